@@ -0,0 +1,208 @@
+from collections import OrderedDict
+
+import numpy as np
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import SPRITE_CACHE_BUDGET
+
+from components.asset_loader import AssetLoader
+
+DEFAULT_FRAME_DELAY = 100  # ms, for frames that give none
+
+
+class SpriteFrames:
+    """Frames of an animated image, decoded once.
+
+    The first frame is kept whole, every frame as the rectangle that changed
+    since the previous one (the first one since the last), which is all that
+    playback blits and repaints.
+    """
+
+    def __init__(self, first: QImage, deltas, loops: int):
+        self.first = first
+        self.deltas = deltas  # (rect, image, delay) per frame
+        self.loops = loops  # Times the animation repeats, -1 for ever
+
+    def size(self):
+        return self.first.size()
+
+    def bytes(self):
+        return self.first.sizeInBytes() + sum(image.sizeInBytes() for _, image, _ in self.deltas)
+
+
+def decode_sprite(path: str):
+    """Frames of an animated image, None if it cannot be read. Runs off the GUI thread."""
+    reader = QImageReader(path)
+    first = previous = None
+    deltas = []
+    while reader.canRead():
+        image = reader.read()
+        if image.isNull():
+            break
+        image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        delay = reader.nextImageDelay() or DEFAULT_FRAME_DELAY
+        if first is None:
+            first = image
+            deltas.append((QRect(), QImage(), delay))  # Against the last frame, known at the end
+        else:
+            # Only the first and the previous frame are kept whole while decoding
+            deltas.append(frame_delta(image, previous, delay))
+        previous = image
+    if first is None:
+        print(f"Failed to load image: {path} ({reader.errorString()})")
+        return None
+    deltas[0] = frame_delta(first, previous, deltas[0][2])
+    return SpriteFrames(first, deltas, reader.loopCount())
+
+
+def frame_delta(image: QImage, previous: QImage, delay: int):
+    """The rectangle of `image` that changed since `previous`, with its pixels"""
+    changed = pixel_array(image) != pixel_array(previous)
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not len(rows):
+        return QRect(), QImage(), delay
+    columns = np.flatnonzero(changed.any(axis=0))
+    rect = QRect(QPoint(int(columns[0]), int(rows[0])), QPoint(int(columns[-1]), int(rows[-1])))
+    return rect, image.copy(rect), delay
+
+
+def pixel_array(image: QImage):
+    rows = np.frombuffer(image.constBits(), np.uint32).reshape(image.height(), image.bytesPerLine() // 4)
+    return rows[:, : image.width()]
+
+
+class DecodeSpriteTask(QRunnable):
+    def __init__(self, cache, path: str):
+        super().__init__()
+        self.cache = cache
+        self.path = path
+
+    def run(self):
+        # Queued to the GUI thread
+        self.cache.decoded.emit(self.path, decode_sprite(self.path))
+
+
+class SpriteCache(QObject):
+    """Decoded animations shared by the sprites, under a memory budget.
+
+    Animations are decoded on the asset loader threads. The least recently
+    used ones are dropped once the budget is exceeded, one larger than the
+    budget is only kept by the sprites playing it.
+    """
+
+    decoded = Signal(str, object)
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, budget: int = SPRITE_CACHE_BUDGET):
+        if self._instance is not None:
+            raise ValueError("An instantiation already exists!")
+        super().__init__()
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.waiting = {}  # Callbacks of the animations being decoded, by path
+        self.decoded.connect(self.on_decoded)
+
+    def request(self, path: str, callback=None):
+        """The decoded frames, else None and `callback(frames)` once decoded"""
+        frames = self.entries.get(path)
+        if frames is not None:
+            self.entries.move_to_end(path)
+            return frames
+        callbacks = self.waiting.get(path)
+        if callbacks is None:
+            callbacks = self.waiting[path] = []
+            AssetLoader.getInstance().pool.start(DecodeSpriteTask(self, path))
+        if callback is not None:
+            callbacks.append(callback)
+        return None
+
+    def on_decoded(self, path: str, frames):
+        if frames is not None and frames.bytes() <= self.budget:
+            self.entries[path] = frames
+            self.bytes += frames.bytes()
+            while self.bytes > self.budget:
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes -= evicted.bytes()
+        for callback in self.waiting.pop(path):
+            callback(frames)
+
+
+class AnimatedSprite(QWidget):
+    """Animated image playing only while it is visible.
+
+    Unlike a QMovie, nothing is decoded while playing: each frame blits the
+    rectangle that changed into the current image and repaints that
+    rectangle. Hidden, the sprite stops and lets go of its frames.
+    """
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.frames = None
+        self.canvas = None
+        self.index = 0
+        self.loops = 0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.advance)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.frame_size = QImageReader(path).size()
+
+        # Decoded ahead, the first show does not wait for it
+        SpriteCache.getInstance().request(path)
+
+    def sizeHint(self):
+        return self.frame_size if self.frame_size.isValid() else QSize(0, 0)
+
+    def showEvent(self, event):
+        frames = SpriteCache.getInstance().request(self.path, self.on_decoded)
+        if frames is not None:
+            self.play(frames)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        self.frames = None
+        self.canvas = None
+
+    def on_decoded(self, frames):
+        if frames is not None and self.isVisible() and self.frames is None:
+            self.play(frames)
+
+    def play(self, frames: SpriteFrames):
+        self.frames = frames
+        self.canvas = frames.first.copy()
+        self.index = 0
+        self.loops = 0
+        self.update()
+        if len(frames.deltas) > 1:
+            self.timer.start(frames.deltas[0][2])
+
+    def advance(self):
+        index = (self.index + 1) % len(self.frames.deltas)
+        if index == 0:
+            self.loops += 1
+            if 0 <= self.frames.loops < self.loops:
+                return  # Stays on the last frame
+        rect, image, delay = self.frames.deltas[index]
+        if rect.isValid():
+            painter = QPainter(self.canvas)
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.drawImage(rect.topLeft(), image)
+            painter.end()
+            self.update(rect)
+        self.index = index
+        self.timer.start(delay)
+
+    def paintEvent(self, event):
+        if self.canvas is not None:
+            QPainter(self).drawImage(event.rect(), self.canvas, event.rect())
@@ -0,0 +1,98 @@
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import ASSET_LOADER_THREADS
+
+from components.image_cache import ImageCache, decode_image
+
+
+class DecodeTask(QRunnable):
+    def __init__(self, loader, key, path: str, target: QSize, mode):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.path = path
+        self.target = target
+        self.mode = mode
+
+    def run(self):
+        image, packed = decode_image(self.loader.cache.pack, self.path, self.target, self.mode)
+        # Queued to the GUI thread, where the pixmap is made
+        self.loader.decoded.emit(self.key, image, packed)
+
+
+class AssetLoader(QObject):
+    """Decode images on a thread pool and hand them to the GUI thread.
+
+    A request answers at once from the image cache, else the image is decoded
+    on a pool thread and the callbacks waiting for it get the pixmap on the GUI
+    thread. Requests for an image already being decoded wait for that one.
+    """
+
+    decoded = Signal(object, QImage, bool)
+    progress = Signal(int, int)  # Images decoded, images requested
+    finished = Signal()  # Nothing left to decode
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if self._instance is not None:
+            raise ValueError("An instantiation already exists!")
+        super().__init__()
+        self.cache = ImageCache.getInstance()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(ASSET_LOADER_THREADS)
+        self.waiting = {}  # Callbacks of the images being decoded, by key
+        self.requested = 0
+        self.done = 0
+        self.decoded.connect(self.on_decoded)
+
+    def request(self, path: str, size: QSize = None, ratio: float = 1.0, mode=Qt.IgnoreAspectRatio, callback=None):
+        """The cached pixmap, else None and `callback(pixmap)` once it is decoded"""
+        key, target = self.cache.key(path, size, ratio, mode)
+        pixmap = self.cache.cached(key)
+        if pixmap is not None:
+            return pixmap
+        callbacks = self.waiting.get(key)
+        if callbacks is None:
+            callbacks = self.waiting[key] = []
+            self.requested += 1
+            self.cache.misses += 1
+            self.pool.start(DecodeTask(self, key, path, target, mode))
+        # Widgets ask again on every paint until it is decoded
+        if callback is not None and callback not in callbacks:
+            callbacks.append(callback)
+        return None
+
+    def on_decoded(self, key, image: QImage, packed: bool):
+        pixmap = self.cache.add(key, image, packed)
+        self.done += 1
+        for callback in self.waiting.pop(key):
+            callback(pixmap)
+        self.progress.emit(self.done, self.requested)
+        if not self.waiting:
+            self.finished.emit()
+
+    def wait(self):
+        """Block until every image is decoded, for tools"""
+        self.pool.waitForDone()
+        QCoreApplication.sendPostedEvents(self)
+
+
+def load_label(label: QLabel, path: str, size: QSize = None, ratio: float = 1.0, mode=Qt.IgnoreAspectRatio):
+    """Show an image in a label, a blank of the same size until it is decoded"""
+    pixmap = AssetLoader.getInstance().request(path, size, ratio, mode, label.setPixmap)
+    if pixmap is None:
+        source = QImageReader(path).size()
+        if size is not None:
+            source = source.scaled(size, mode) if source.isValid() else size
+        pixmap = QPixmap(source if source.isValid() else QSize(1, 1))
+        pixmap.fill(Qt.transparent)
+    label.setPixmap(pixmap)
@@ -0,0 +1,118 @@
+import json
+import mmap
+import os
+import struct
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+
+from components.assets import resource_path, relative_asset
+
+MAGIC = b"LLPACK01"
+HEADER = struct.Struct("<8sI")  # magic, manifest length
+ALIGNMENT = 64  # bytes, every image starts on a cache line
+PACK_FORMAT = QImage.Format_ARGB32_Premultiplied  # what the raster engine draws fastest
+
+
+def pack_path(width: int, height: int):
+    return resource_path(f"assets/packs/{width}x{height}.pack")
+
+
+def open_pack(width: int, height: int):
+    """Pack built for this screen size, None if there is none"""
+    path = pack_path(width, height)
+    if not os.path.exists(path):
+        return None
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError) as error:
+        print(f"Cannot read the asset pack {path}: {error}")
+        return None
+
+
+def write_pack(path: str, screen, images):
+    """Write `images`, a list of (entry, pixels), as one pack.
+
+    Each entry is a dict with the asset path, the requested size and aspect
+    mode, and the width, height and stride of the raw pixels.
+    """
+    manifest = {"screen": list(screen), "format": "ARGB32_Premultiplied", "images": []}
+    for entry, _ in images:
+        manifest["images"].append(dict(entry, offset=0))
+
+    # The offsets change the length of the manifest, so it is laid out twice
+    for _ in range(2):
+        data = json.dumps(manifest).encode()
+        offset = align(HEADER.size + len(data))
+        for entry, (_, pixels) in zip(manifest["images"], images):
+            entry["offset"] = offset
+            offset = align(offset + len(pixels))
+    data = json.dumps(manifest).encode()
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(data)))
+        file.write(data)
+        for entry, (_, pixels) in zip(manifest["images"], images):
+            file.write(b"\0" * (entry["offset"] - file.tell()))
+            file.write(pixels)
+    os.replace(path + ".tmp", path)
+
+
+def align(offset: int):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class AssetPack:
+    """Pre-scaled images of one screen size, read from a memory-mapped pack.
+
+    Images are stored raw in the format the screen is painted in: one that
+    was packed at the requested size is used without decoding or scaling.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            raise ValueError("not an asset pack")
+        self.manifest = json.loads(self.map[HEADER.size:HEADER.size + length])
+        self.screen = tuple(self.manifest["screen"])
+        self.entries = {}
+        self.variants = {}
+        for entry in self.manifest["images"]:
+            request = None if entry["request"] is None else tuple(entry["request"])
+            self.entries[(entry["path"], request, entry["mode"])] = entry
+            self.variants.setdefault(entry["path"], []).append(entry)
+
+    def image(self, path: str, target: QSize, mode):
+        """Image packed for exactly this request, None if there is none"""
+        request = None if target is None else (target.width(), target.height())
+        entry = self.entries.get((relative_asset(path), request, mode_value(mode)))
+        return None if entry is None else self.load(entry)
+
+    def source(self, path: str, target: QSize):
+        """Smallest packed image of `path` covering `target`, to scale down from.
+
+        One packed at the size of the file is as sharp as decoding the file.
+        """
+        covering = [
+            entry
+            for entry in self.variants.get(relative_asset(path), ())
+            if entry["source"] or (entry["width"] >= target.width() and entry["height"] >= target.height())
+        ]
+        if not covering:
+            return None
+        return self.load(min(covering, key=lambda entry: entry["width"] * entry["height"]))
+
+    def load(self, entry):
+        end = entry["offset"] + entry["stride"] * entry["height"]
+        # The image reads the mapped pages, copied only when it becomes a pixmap
+        return QImage(
+            memoryview(self.map)[entry["offset"]:end], entry["width"], entry["height"], entry["stride"], PACK_FORMAT
+        )
+
+
+def mode_value(mode):
+    return int(getattr(mode, "value", mode))
@@ -14,6 +14,17 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-svg_file_path = resource_path("assets\contactless-icon.svg")
-sound_path = resource_path("assets\sounds\click.click.wav")
-wood_bg = resource_path("assets\wood_bg.jpg")
+svg_file_path = resource_path("assets/contactless-icon.svg")
+sound_path = resource_path("assets/sounds/click.wav")
+logo_path = resource_path("assets/linled_logo.png")
+
+# Sizes of the images that only depend on the screen, packed at that size
+LOGO_HEIGHT = 0.15  # of the screen height
+MUGS_SIZE = 500  # px, the mugs keep their aspect ratio within a square
+NO_SUGAR_SIZE = 150  # px
+PAYMENT_CARD_SCALE = 0.3  # of the source size
+
+
+def relative_asset(path):
+    """Path of an asset from the root of the app, with forward slashes"""
+    return os.path.relpath(path, resource_path("")).replace(os.sep, "/")
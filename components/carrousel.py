@@ -6,10 +6,13 @@ from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 from PySide6.QtMultimedia import QSoundEffect
 
-from config import BASIC_FONT, ANIMATION_SPEED
+from config import BASIC_FONT, ANIMATION_SPEED, SWIPE_IDLE_TIMER, SCROLL_MIN_SPEED, SCROLL_MAX_SPEED
 
 from components.assets import resource_path
-from components.parameters import GlobalParameters
+from components.hit_testing import SelectionModel
+from components.kinetic_scroll import KineticScroll
+from components.painted import EdgeGlow
+from components.pointer import PointerInput
 from components.scenes import Scenes
 from components.utils import findMainWindow, get_app_dimensions, custom_font, Debug
 from components.selection import CoffeeType, Selection
@@ -22,17 +25,8 @@ NORMAL_FONT_SIZE = 10
 ENLARGED_FONT_SIZE = 20
 MAX_FONT_SIZE = 32
 DEFAULT_MARGINS = 50
-QUICK_MOVE_THRESHOLD = 150
 CARROUSSEL_CARD_NUMBER = 4
-
-
-def linear_map(value, in_min, in_max, out_min, out_max):
-    if in_min <= value <= in_max:
-        return round(
-            ((value - in_min) / (in_max - in_min)) * (out_max - out_min) + out_min
-        )
-    else:
-        return out_min  # return out_min by default
+PREFETCH_CARDS = 1  # cards bound out of view on each side, their images decoded ahead
 
 
 class Carrousel(QWidget, Debug):
@@ -40,124 +34,153 @@ class Carrousel(QWidget, Debug):
         super().__init__()
         self.initParams()
         self.initUI()
-        self.scroll_timer = QTimer()
-        self.scroll_timer.timeout.connect(self.auto_scroll)
-        self.scroll_direction = 0  # 0: no scroll, -1: left, 1: right
         self.current_coffee_type = None
-        if GlobalParameters.getInstance().debug.state:
-            self.apply_debug_style()
+        self.tracking = False
+        pointer = PointerInput.getInstance()
+        pointer.add_move_handler(self.on_pointer_moved)
+        pointer.gestures.flicked_down.connect(self.on_flick_down)
+        pointer.gestures.swiped.connect(self.on_swipe)
+        self.apply_debug_style()
 
         # Enable key events for the widget
         self.setFocusPolicy(Qt.StrongFocus)
 
     def initParams(self):
         self.number_of_cards = CARROUSSEL_CARD_NUMBER
+        self.entries = [coffee_type for coffee_type in CoffeeType if coffee_type != CoffeeType.NONE]
+        self.offset = 0  # px scrolled from the first entry, along the ring
+        self.card_width = int(get_app_dimensions(self).width / self.number_of_cards)
 
     def initUI(self):
-        # Scroll Area
-        self.scrollArea = QScrollArea(self)
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scrollArea.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.scrollArea.setStyleSheet("background-color: transparent; border: 0px;")
-
-        # Create a container widget and a layout
-        self.container = QWidget()
-        self.container.installEventFilter(self)
-
-        self.layout = QHBoxLayout(self.container)
-        self.layout.setSpacing(0)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-
-        # Create CarrouselCard for each coffee type and add to the layout
-        self.carrousel_cards = [
-            CarrouselCard(coffee_type)
-            for coffee_type in CoffeeType
-            if coffee_type != CoffeeType.NONE
-        ]
-        for card in self.carrousel_cards:
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # Enough cards to cover the view while scrolling, and the neighbors on each side.
+        # Scrolling moves the strip, the cards only move in it when one wraps around
+        self.strip = QWidget(self)
+        self.first = None  # Ring index of the first card of the strip
+        self.carrousel_cards = []
+        for _ in range(self.number_of_cards + 1 + 2 * PREFETCH_CARDS):
+            card = CarrouselCard(self.entries[0])
+            card.setParent(self.strip)
             card.card_validation_signal.connect(self.on_card_validation)
-            card.setMinimumWidth(get_app_dimensions(self).width / self.number_of_cards)
-            self.layout.addWidget(card)
-
-        # Set the container as the scroll area's widget
-
-        self.scrollArea.setContentsMargins(0, 0, 0, 0)
-        self.scrollArea.setWidget(self.container)
-
-        # Main layout of Carrousel is just the scroll area
-        main_layout = QVBoxLayout(self)
-        main_layout.addWidget(self.scrollArea)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        # Connect scroll bar signal
-        self.scrollArea.horizontalScrollBar().valueChanged.connect(self.check_scroll)
-
-    def eventFilter(self, obj, event):
-        if obj is self.container and event.type() == QEvent.MouseMove:
-            self.mouseMoveEvent(event)
-        return super().eventFilter(obj, event)
+            card.card_selection_signal.connect(self.on_card_selected)
+            self.carrousel_cards.append(card)
+
+        # Shows the scroll speed on the edge the hand is on
+        self.edge_glow = EdgeGlow(self, QColor(236, 224, 209))
+
+        # Advanced before the selection model on each frame, hovers see the cards where they are drawn
+        self.scroller = KineticScroll(self.card_width, self)
+        self.scroller.add_handler(self.scroll_to)
+        PointerInput.getInstance().add_frame_handler(self.on_frame)
+
+        self.selection = SelectionModel(self, self.carrousel_cards, clip=self)
+        self.selection.enabled = False
+        self.selection.selection_changed.connect(self.on_card_hovered)
+        self.layout_cards()
+
+    def set_entries(self, entries):
+        """Drinks shown by the carousel, in order"""
+        self.entries = list(entries)
+        self.first = None
+        for card in self.carrousel_cards:
+            card.index = None
+        self.layout_cards()
+
+    def entry(self, index: int):
+        # The entries repeat without end on both sides
+        return self.entries[index % len(self.entries)]
+
+    def layout_cards(self):
+        """Place the strip for the current offset, binding the cards that came into range.
+
+        Only the cards around the view exist: a card leaving one side is bound
+        to the next entry coming in on the other one, at the same cost for 9
+        entries or 500.
+        """
+        first = self.offset // self.card_width - PREFETCH_CARDS
+        count = len(self.carrousel_cards)
+        self.strip.setGeometry(first * self.card_width - self.offset, 0, count * self.card_width, self.height())
+        if first == self.first:
+            return
+        self.first = first
+        for index in range(first, first + count):
+            card = self.carrousel_cards[index % count]
+            if card.index != index:
+                if card.selected:
+                    self.current_coffee_type = None
+                    self.selection.clear()
+                card.bind(self.entry(index), index)
+                card.resize(self.card_width, self.height())
+                card.prefetch()
+            card.setGeometry((index - first) * self.card_width, 0, self.card_width, self.height())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.first = None
+        self.layout_cards()
 
     def showEvent(self, event):
         self.main_window = findMainWindow(self)
         for card in self.carrousel_cards:
             card.set_default_style()
         QTimer.singleShot(1500, lambda: self.activate_cards())
-        QTimer.singleShot(1500, lambda: self.container.setMouseTracking(True))
-        self.move_last_to_start()
 
     def activate_cards(self):
         for card in self.carrousel_cards:
             card.active = True
+        self.tracking = True
+        self.selection.enabled = True
+        self.selection.clear()
+
+    def on_card_hovered(self, card: CarrouselCard):
+        if card.active:
+            card.select()
+
+    def on_pointer_moved(self, position: QPointF):
+        if not self.tracking or not self.isVisible():
+            return
+        if not self.rect().contains(self.mapFromGlobal(position).toPoint()):
+            self.stop_scroll()
+            return
 
-    def mouseMoveEvent(self, event: QMouseEvent):
         if not self.main_window.params.carrousel_swipe.state:
-            # Scroll behaviour
-            mouse_x = event.globalPosition().toPoint().x()
-            widget_x = self.mapToGlobal(self.pos()).x()
-            widget_width = self.width()
-
-            # Adjust these thresholds as needed
-            left_threshold = widget_x + widget_width * 0.1
-            right_threshold = widget_x + widget_width * 0.9
-
-            # Calculate dynamic scroll speed
-            scroll_speed = self.calculate_scroll_speed(
-                mouse_x, left_threshold, right_threshold
-            )
-            transparency_mapped = linear_map(scroll_speed, 10, 15, 64, 255)
-
-            if mouse_x < left_threshold:
-                self.scroll_direction = -1
-                self.scroll_timer.start(30 - scroll_speed)
-                self.scrollArea.setStyleSheet(
-                    f"border-left: 10px solid rgba(236,224,209, {transparency_mapped}); border-top: none; border-right: none; border-bottom: none; background-color: transparent;"
-                )
-            elif mouse_x > right_threshold:
-                self.scroll_direction = 1
-                self.scroll_timer.start(abs(5 - scroll_speed))
-                self.scrollArea.setStyleSheet(
-                    f"border-right: 10px solid rgba(236,224,209, {transparency_mapped}); border-top: none; border-left: none; border-bottom: none; background-color: transparent;"
-                )
+            # Scroll behaviour, faster the deeper the hand is in an edge
+            mouse_x = self.mapFromGlobal(position).x()
+            edge = self.width() * 0.1
+            if mouse_x < edge:
+                direction, depth = -1, (edge - mouse_x) / edge
+            elif mouse_x > self.width() - edge:
+                direction, depth = 1, (mouse_x - self.width() + edge) / edge
             else:
-                self.scroll_timer.stop()
-                self.scrollArea.setStyleSheet(
-                    "border: 0px; background-color: transparent;"
-                )
-
-    def calculate_scroll_speed(self, mouse_x, left_threshold, right_threshold):
-        # Adjust these factors to fine-tune the responsiveness
-        min_speed = 10
-        max_speed = 15
-
-        if mouse_x < left_threshold:
-            # Closer to the left edge => Faster scroll
-            return linear_map(mouse_x, 0, left_threshold, max_speed+10, min_speed)
-        elif mouse_x > right_threshold:
-            # Closer to the right edge => Faster scroll
-            return linear_map(mouse_x, right_threshold, self.width(), min_speed, max_speed)
-        else:
-            # Default speed
-            return min_speed
+                self.stop_scroll()
+                return
+            depth = min(depth, 1.0)
+            speed = SCROLL_MIN_SPEED + depth * (SCROLL_MAX_SPEED - SCROLL_MIN_SPEED)
+            self.scroller.drive_at(direction * speed)
+            self.edge_glow.set_glow(direction, round(64 + depth * (255 - 64)))
+
+    def stop_scroll(self):
+        if self.scroller.drive:
+            self.scroller.drive_at(0)
+            self.edge_glow.set_glow(0)
+
+    def on_frame(self, now: float):
+        if self.isVisible():
+            self.scroller.advance(now)
+
+    def on_flick_down(self):
+        if self.tracking and self.main_window.params.movement_validation.state:
+            if any(card.selected for card in self.carrousel_cards):
+                self.validate_card()
+
+    def on_swipe(self, direction: int):
+        if self.tracking and self.main_window.params.carrousel_swipe.state:
+            # The cards follow the hand, like on a touch screen
+            if direction < 0:
+                self.move_cards_right()
+            else:
+                self.move_cards_left()
 
     def keyPressEvent(self, event):
         super().keyPressEvent(event)
@@ -175,6 +198,10 @@ class Carrousel(QWidget, Debug):
     def move_cards_right(self):
         self.adjust_scroll(1)
 
+    def on_card_selected(self, carrousel_card: CarrouselCard):
+        self.current_coffee_type = carrousel_card.coffee_type
+        self.unselect_cards(carrousel_card)
+
     def unselect_cards(self, carrousel_card: CarrouselCard):
         for card in self.carrousel_cards:
             if card != carrousel_card:
@@ -182,10 +209,12 @@ class Carrousel(QWidget, Debug):
 
     def validate_card(self):
         for card in self.carrousel_cards:
-            if card.coffee_type == self.current_coffee_type:
+            if card.selected and card.coffee_type == self.current_coffee_type:
                 card.validate_card()
 
     def on_card_validation(self, coffee_type: CoffeeType):
+        self.tracking = False
+        self.selection.enabled = False
         for card in self.carrousel_cards:
             card.active = False
         self.main_window.selections.append(Selection(coffee_type, 0))
@@ -195,63 +224,33 @@ class Carrousel(QWidget, Debug):
             self.main_window.selections[-1].sugar = 0
             self.main_window.set_scene(Scenes.RECAP)
 
-    def auto_scroll(self):
-        scroll_bar = self.scrollArea.horizontalScrollBar()
-        scroll_bar.setValue(scroll_bar.value() + self.scroll_direction * 5)
-
-    def check_scroll(self):
-        max_value = self.scrollArea.horizontalScrollBar().maximum()
-        current_value = self.scrollArea.horizontalScrollBar().value()
-
-        if current_value == max_value:  # Scrolled to the right end
-            self.move_first_to_end()
-        elif current_value == 0:  # Scrolled to the left end
-            self.move_last_to_start()
-
-    def move_first_to_end(self):
-        first_item = self.carrousel_cards.pop(0)
-        self.layout.removeWidget(first_item)
-        self.layout.addWidget(first_item)
-        self.carrousel_cards.append(first_item)
-        self.scrollArea.horizontalScrollBar().setValue(
-            self.scrollArea.horizontalScrollBar().value() - first_item.width()
-        )
-
-    def move_last_to_start(self):
-        last_item = self.carrousel_cards.pop(-1)
-        self.layout.removeWidget(last_item)
-        self.layout.insertWidget(0, last_item)
-        self.carrousel_cards.insert(0, last_item)
-        self.scrollArea.horizontalScrollBar().setValue(
-            self.scrollArea.horizontalScrollBar().value() + last_item.width()
-        )
+    def scroll_to(self, offset: int):
+        if offset != self.offset:
+            self.offset = offset
+            self.layout_cards()
+            # The cards moved with the strip, without a move event of their own
+            self.selection.invalidate()
 
     def hideEvent(self, event):
         self.current_card = None
+        self.tracking = False
+        self.selection.enabled = False
+        self.selection.clear()
+        self.stop_scroll()
+        self.scroller.stop()
 
     def move_cards_left(self):
         # Move the scroll area view 4 cards to the left
         self.main_window.swipe_sound.play()
-        self.main_window.idle_timer.start(15000)
+        self.main_window.presence.extend(SWIPE_IDLE_TIMER)
         self.adjust_scroll(-4)
 
     def move_cards_right(self):
         # Move the scroll area view 4 cards to the right
         self.main_window.swipe_sound.play()
-        self.main_window.idle_timer.start(15000)
+        self.main_window.presence.extend(SWIPE_IDLE_TIMER)
         self.adjust_scroll(4)
 
     def adjust_scroll(self, num_cards):
-        # Calculate the width of a single card
-        if self.carrousel_cards:
-            card_width = self.carrousel_cards[0].width()
-
-            # Get the current scroll position
-            scroll_bar = self.scrollArea.horizontalScrollBar()
-            current_value = int(scroll_bar.value() / card_width)
-
-            # Calculate the new scroll position
-            new_value = (current_value + num_cards)% 8  * card_width
-
-            # Set the new scroll position
-            scroll_bar.setValue(new_value)
+        # Glide by whole cards along the ring, from the card being settled on
+        self.scroller.snap_by(num_cards)
@@ -9,21 +9,23 @@ from PySide6.QtMultimedia import QSoundEffect
 from config import BASIC_FONT, ANIMATION_SPEED
 
 from components.assets import resource_path
-from components.parameters import GlobalParameters
+from components.asset_loader import AssetLoader
+from components.frame_scheduler import FrameAnimation
+from components.latency import LatencyMonitor
 from components.scenes import Scenes
 from components.utils import findMainWindow, get_app_dimensions, custom_font, Debug
 from components.selection import CoffeeType, Selection
+from components.theme import set_role, set_state
 
 
 DEFAULT_MARGIN = 70
 SELECTED_MARGIN = 30
 VALIDATED_MARGIN = 40
-ELAPSED_TIMER = 200
-QUICK_MOVE_THRESHOLD = 100
 
 
 class CarrouselCard(QWidget, Debug):
     card_validation_signal = Signal(CoffeeType)
+    card_selection_signal = Signal(QWidget)
 
     def __init__(self, coffee_type: CoffeeType):
         super().__init__()
@@ -32,16 +34,13 @@ class CarrouselCard(QWidget, Debug):
         self.init_animations()
         self.init_font()
         self.init_ui()
-        self.elapsedTimer = QElapsedTimer()
-        if GlobalParameters.getInstance().debug.state:
-            self.apply_debug_style()
-        self.elapsedTimer.start()
-        self.lastMousePosition = QCursor.pos()
+        self.apply_debug_style()
 
     def init_params(self, coffee_type):
         self._font_size = 16
         self._margins = DEFAULT_MARGIN
         self.coffee_type = coffee_type
+        self.index = None  # Position in the carousel ring
 
         self.active = False
         self.animated = True
@@ -70,9 +69,29 @@ class CarrouselCard(QWidget, Debug):
         self.label = QLabel(self.coffee_type.name)
         self.label.setFont(QFont(self.font_family, 24))
         self.label.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.label.setStyleSheet("border: 0px; background-color: transparent;")
+        set_role(self.label, "card-title")
         self.set_background_image(resource_path(self.coffee_type.image_path))
 
+    def bind(self, coffee_type: CoffeeType, index: int):
+        """Show another entry of the carousel, at rest"""
+        self.index = index
+        self.text_animation.stop()
+        self.margin_animation.stop()
+        self.selected = False
+        self.validated = False
+        self.set_default_style()
+        if coffee_type is not self.coffee_type:
+            self.coffee_type = coffee_type
+            self.label.setText(coffee_type.name)
+            self.set_background_image(resource_path(coffee_type.image_path))
+
+    def prefetch(self):
+        """Decode the image at rest size before the card is shown"""
+        if self.image_path is not None and not self.size().isEmpty():
+            AssetLoader.getInstance().request(
+                self.image_path, self.image_size(DEFAULT_MARGIN), self.devicePixelRatioF()
+            )
+
     def set_fallback_background(self):
         # Set a default background color or a placeholder image
         self.setStyleSheet(
@@ -80,12 +99,34 @@ class CarrouselCard(QWidget, Debug):
         )  # Example: light gray background
 
     def set_background_image(self, imagePath):
-        self.backgroundPixmap = QPixmap(imagePath)
-        if self.backgroundPixmap.isNull():
+        self.image_path = imagePath
+        if not QImageReader(imagePath).canRead():
             print(f"Failed to load image: {imagePath}")
+            self.image_path = None
             return
         self.update()
 
+    def image_size(self, margin):
+        return self.rect().adjusted(
+            int(margin / 1.62), margin, -int(margin / 1.62), -margin
+        ).size()
+
+    def background_pixmap(self, rect: QRect):
+        if self.margin_animation.state() != QAbstractAnimation.Stopped:
+            # Between two resting sizes, the largest one is scaled down on the fly
+            size = self.image_size(SELECTED_MARGIN)
+        else:
+            size = rect.size()
+        loader = AssetLoader.getInstance()
+        pixmap = loader.request(self.image_path, size, self.devicePixelRatioF(), callback=self.on_image_decoded)
+        if pixmap is None:
+            # Until this size is decoded, another one is drawn scaled
+            pixmap = loader.cache.latest(self.image_path)
+        return pixmap
+
+    def on_image_decoded(self, pixmap: QPixmap):
+        self.update()
+
     def paintEvent(self, event):
         painter = QPainter(self)
         rect = self.rect()
@@ -96,8 +137,12 @@ class CarrouselCard(QWidget, Debug):
             margins.left(), margins.top(), -margins.right(), -margins.bottom()
         )
 
-        if not self.backgroundPixmap.isNull():
-            painter.drawPixmap(adjustedRect, self.backgroundPixmap)
+        if self.image_path is not None and not adjustedRect.isEmpty():
+            pixmap = self.background_pixmap(adjustedRect)
+            if pixmap is not None:
+                painter.drawPixmap(adjustedRect, pixmap)
+            else:
+                painter.fillRect(adjustedRect, QColor(219, 193, 172, 64))
 
             if self.selected:
                 # Draw a border around the pixmap
@@ -125,29 +170,22 @@ class CarrouselCard(QWidget, Debug):
     def showEvent(self, event):
         self.main_window = findMainWindow(self)
 
-    def enterEvent(self, event):
-        if self.active:
-            self.setMouseTracking(True)
-            self.select()
-        else:
-            pass
-
     def select(self):
         self.main_window.change_sound.play()
+        LatencyMonitor.getInstance().tag(self, Scenes.COFFEE)
         self.selected = True
         self.set_selected_style()
         if self.animated:
             self.start_margin_animation(DEFAULT_MARGIN, SELECTED_MARGIN)
             self.start_text_animation(24, 24)
 
-        self.parent().parent().parent().parent().current_coffee_type = self.coffee_type
-        self.parent().parent().parent().parent().unselect_cards(self)
-
-    def leaveEvent(self, event):
-        self.setMouseTracking(False)
+        self.card_selection_signal.emit(self)
 
     def unselect(self):
-        if self.selected and self.animated:
+        if not self.selected:
+            # Restyling an unselected card would only polish it again
+            return
+        if self.animated:
             self.start_text_animation(24, 24)
             self.start_margin_animation(SELECTED_MARGIN, DEFAULT_MARGIN)
         self.selected = False
@@ -160,26 +198,11 @@ class CarrouselCard(QWidget, Debug):
         self.font_size = 18
 
     def set_default_style(self):
-        self.setStyleSheet(
-            "background-color: rgba(219,193,172, 128); border: 2px solid red;"
-        )
         self.margins = DEFAULT_MARGIN
-        self.label.setStyleSheet("border: 2px solid black;")
-
-        if self.main_window != None:
-            if self.main_window.params.debug.state:
-                self.setStyleSheet(
-                    "background-color: rgba(219,193,172, 128); border: 2px solid red;"
-                )
-                self.label.setStyleSheet("border: 2px solid red;")
+        set_state("default", self.label)
 
     def set_selected_style(self):
-        if self.main_window.params.debug.state:
-            self.setStyleSheet("border: 2px solid yellow;")
-        else:
-            self.setStyleSheet(
-                "background-color: rgba(219,193,172, 255); border: 2px solid red;"
-            )
+        set_state("selected", self.label)
 
     def set_validated_style(self):
         self.margins = VALIDATED_MARGIN
@@ -188,48 +211,21 @@ class CarrouselCard(QWidget, Debug):
         super().hideEvent(event)
         self.selected = False
 
-    def mouseMoveEvent(self, event):
-        super().mouseMoveEvent(event)
-        if (
-            self.main_window.params.movement_validation.state
-            or self.main_window.params.carrousel_swipe.state
-        ):
-            currentMousePosition = event.globalPosition().toPoint()
-            if self.elapsedTimer.elapsed() < ELAPSED_TIMER:
-                movement = currentMousePosition - self.lastMousePosition
-
-                # Detect vertical swipe (up or down)
-                if (
-                    self.main_window.params.movement_validation.state
-                    and movement.y() > abs(movement.x())
-                    and movement.y() > QUICK_MOVE_THRESHOLD
-                ):
-                    self.validate_card()
-                    self.disableMouseTrackingForPause()
-
-            self.lastMousePosition = currentMousePosition
-
-        self.elapsedTimer.restart()
-
     def mousePressEvent(self, event: QMouseEvent):
         if self.main_window.params.clickable_button.state:
             self.validate_card()
 
-    def disableMouseTrackingForPause(self):
-        self.setMouseTracking(False)
-        QTimer.singleShot(500, lambda: self.setMouseTracking(True))
-
     # ANIMATIONS
     def init_animations(self):
         self.init_text_animation()
         self.init_margin_animation()
 
     def init_text_animation(self):
-        self.text_animation = QPropertyAnimation(self, b"font_size")
+        self.text_animation = FrameAnimation(self, b"font_size")
         self.text_animation.setDuration(ANIMATION_SPEED)
 
     def init_margin_animation(self):
-        self.margin_animation = QPropertyAnimation(self, b"margins")
+        self.margin_animation = FrameAnimation(self, b"margins")
         self.margin_animation.setDuration(ANIMATION_SPEED)
 
     def start_text_animation(self, start, end):
@@ -1,12 +1,15 @@
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
-from PySide6.QtSvg import *
 from PySide6.QtMultimedia import *
 
 from config import PAYMENT_TIMER
 
 from components.assets import svg_file_path, resource_path
+from components.frame_scheduler import FrameAnimation
+from components.image_cache import ImageCache
+
+ARC_WIDTH = 3  # px
 
 
 class ContactlessPayment(QWidget):
@@ -15,6 +18,7 @@ class ContactlessPayment(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._border_progress = 0.0
+        self.face = None
         self.sound_path = "assets/sounds/validate.wav"
         self.initUI()
         self.setup_animation()
@@ -22,7 +26,6 @@ class ContactlessPayment(QWidget):
         self.setStyleSheet("border: 2px solid black;")
 
     def initUI(self):
-        self.svgRenderer = QSvgRenderer(svg_file_path)  # Load the SVG file
         self.setFixedSize(150, 150)  # Set the size of the widget
         self.move_to_center()
 
@@ -51,7 +54,7 @@ class ContactlessPayment(QWidget):
         self.move(500, 500)
 
     def setup_animation(self):
-        self.animation = QPropertyAnimation(self, b"borderProgress")
+        self.animation = FrameAnimation(self, b"borderProgress")
         self.animation.setDuration(PAYMENT_TIMER)
         self.animation.setStartValue(0.0)
         self.animation.setEndValue(1.0)
@@ -64,54 +67,70 @@ class ContactlessPayment(QWidget):
     def showEvent(self, event):
         self.animation.start()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Dimensions du widget
-        widget_width = self.width()
-        widget_height = self.height()
-
-        # Taille de l'image et du cercle
+    def icon_rect(self):
+        # Taille de l'image, centrée dans le widget
         image_size = 120  # ou toute autre taille appropriée pour votre image SVG
-
-        # Calcul du rectangle central pour le SVG
-        rect_svg = QRectF(
-            (widget_width - image_size) / 2,
-            (widget_height - image_size) / 2,
+        return QRectF(
+            (self.width() - image_size) / 2,
+            (self.height() - image_size) / 2,
             image_size,
             image_size,
         )
 
-        # Ajuster le QRectF pour l'arc
-        arc_padding = (
-            10  # L'espace entre l'arc et l'image SVG, ajustez selon vos besoins
-        )
-        arc_size = image_size + 2 * arc_padding
-        rect_arc = QRectF(
-            (widget_width - arc_size) / 2,
-            (widget_height - arc_size) / 2,
-            arc_size,
-            arc_size,
-        )
+    def arc_rect(self):
+        # L'espace entre l'arc et l'image SVG, ajustez selon vos besoins
+        arc_padding = 10
+        return self.icon_rect().adjusted(-arc_padding, -arc_padding, arc_padding, arc_padding)
+
+    def face_pixmap(self):
+        """The icon and the circle, drawn once per size and device pixel ratio"""
+        ratio = self.devicePixelRatioF()
+        if self.face is None or self.face.size() != self.size() * ratio:
+            self.face = QPixmap(self.size() * ratio)
+            self.face.setDevicePixelRatio(ratio)
+            self.face.fill(Qt.transparent)
+            icon_rect = self.icon_rect()
+            icon = ImageCache.getInstance().pixmap(svg_file_path, icon_rect.size().toSize(), ratio)
+
+            painter = QPainter(self.face)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self.palette().color(self.foregroundRole()))
+            painter.drawPixmap(icon_rect.topLeft(), icon)
+            painter.setBrush(QBrush(QColor(219, 193, 172, 0)))
+            painter.drawEllipse(self.arc_rect())
+            painter.end()
+        return self.face
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self.face = None
+        super().changeEvent(event)
 
-        # Dessiner l'image SVG
-        self.svgRenderer.render(painter, rect_svg)
-
-        # Dessiner le cercle
-        painter.setBrush(QBrush(QColor(219, 193, 172, 0)))
-        painter.drawEllipse(rect_arc)
+    def paintEvent(self, event):
+        # Qt clips the painter to the part of the arc that changed
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.face_pixmap())
 
         # Dessiner la bordure avec la progression de l'animation
-        pen = QPen(QColor(219, 193, 172), 3)
-        painter.setPen(pen)
-        painter.drawArc(rect_arc, 90 * 16, -360 * 16 * self._border_progress)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(219, 193, 172), ARC_WIDTH))
+        painter.drawArc(self.arc_rect(), 90 * 16, -360 * 16 * self._border_progress)
+
+    def progress_rect(self, start: float, end: float):
+        """Bounds of the arc drawn between two progress values"""
+        path = QPainterPath()
+        path.arcMoveTo(self.arc_rect(), 90 - 360 * start)
+        path.arcTo(self.arc_rect(), 90 - 360 * start, -360 * (end - start))
+        margin = ARC_WIDTH / 2 + 1  # Antialiasing
+        return path.boundingRect().adjusted(-margin, -margin, margin, margin).toAlignedRect()
 
     def getBorderProgress(self):
         return self._border_progress
 
     def setBorderProgress(self, value):
+        previous = self._border_progress
         self._border_progress = value
-        self.update()  # Trigger a repaint
+        # Only the part of the arc that changed is repainted
+        self.update(self.progress_rect(min(previous, value), max(previous, value)))
 
     borderProgress = Property(float, getBorderProgress, setBorderProgress)
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import (
+    VALIDATION_TIME,
+    VALIDATION_EARLY_TIME,
+    VALIDATION_APPROACH_WINDOW,
+    VALIDATION_COMMIT_SPEED,
+    VALIDATION_STRAIGHTNESS,
+    DWELL_RADIUS,
+)
+
+
+@dataclass(frozen=True)
+class DwellParams:
+    dwell_time: float = VALIDATION_TIME  # ms, for an ambiguous entry
+    early_time: float = VALIDATION_EARLY_TIME  # ms, for a clear downward move
+    approach_window: float = VALIDATION_APPROACH_WINDOW  # ms
+    commit_speed: float = VALIDATION_COMMIT_SPEED  # px/s
+    straightness: float = VALIDATION_STRAIGHTNESS
+    retreat: float = DWELL_RADIUS  # px
+
+
+def commit_delay(t, x, y, now, params: DwellParams):
+    """Dwell needed in the zone given the approach before entering it at `now`.
+
+    The downward speed over the last `approach_window` ms shortens the dwell,
+    down to `early_time` from `commit_speed` on. A slanted approach (less than
+    `straightness` of the move going down) keeps the full dwell.
+    """
+    start = np.searchsorted(t, now - params.approach_window)
+    end = np.searchsorted(t, now, side="right")
+    if end - start < 2:
+        return params.dwell_time
+    t, x, y = t[start:end], x[start:end], y[start:end]
+    span = t[-1] - t[0]
+    if span < params.approach_window / 2:
+        return params.dwell_time  # Too little history to judge the approach
+
+    down = y[-1] - y[0]
+    distance = np.hypot(x[-1] - x[0], down)
+    if distance == 0 or down / distance < params.straightness:
+        return params.dwell_time
+
+    # From half the commit speed, the dwell shrinks linearly to early_time
+    speed = down * 1000 / span
+    ratio = np.clip(2 * speed / params.commit_speed - 1, 0, 1)
+    return float(params.dwell_time - ratio * (params.dwell_time - params.early_time))
+
+
+def is_settled(t, x, y, now, duration, radius):
+    """True if the pointer stayed within `radius` px over the last `duration` ms"""
+    start = np.searchsorted(t, now - duration)
+    if start == len(t):
+        return True  # No new sample, the pointer did not move
+    return bool(np.ptp(x[start:]) <= radius and np.ptp(y[start:]) <= radius)
+
+
+class DwellCommit:
+    """Decide when a hand held in a zone validates, one frame at a time.
+
+    `update` is given the pointer history, whether the newest position is in
+    the zone and the frame time, and returns the dwell time when it commits.
+    The delay is chosen on entry from the approach. Committing before the full
+    dwell also needs the hand to have settled: still within `retreat` px for
+    the last `early_time` ms, so a hand bouncing off the zone does not count.
+    """
+
+    def __init__(self, params: DwellParams = None):
+        self.params = params or DwellParams()
+        self.reset()
+
+    def reset(self):
+        self.entered_at = None
+        self.delay = self.params.dwell_time
+        self.committed = False
+
+    def update(self, t, x, y, inside: bool, now: float):
+        if not inside:
+            self.reset()
+            return None
+        if self.committed:
+            return None  # One validation per entry
+
+        if self.entered_at is None:
+            self.entered_at = now
+            self.delay = commit_delay(t, x, y, now, self.params)
+
+        elapsed = now - self.entered_at
+        if elapsed < self.delay:
+            return None
+        if elapsed < self.params.dwell_time and not is_settled(
+            t, x, y, now, self.params.early_time, self.params.retreat
+        ):
+            return None
+        self.committed = True
+        return elapsed
@@ -0,0 +1,152 @@
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import FRAME_INTERVAL, FRAME_BUDGET
+
+from components.utils import now_ms
+
+
+class FrameScheduler(QObject):
+    """Single tick per frame for the input, the animations and the repaint.
+
+    Each tick calls the handlers with its time for the input to be handled,
+    with all that follows the hand, then advances every running
+    FrameAnimation to the time of the tick, then paints at once everything
+    the frame updated. Each part is timed; a frame whose work goes over the
+    budget is counted, and printed when `warn` is set.
+
+    The handlers are called directly, not through a signal: on PySide6 6.12
+    every emit from Python loses a reference to True, which a signal emitted
+    each frame uses up in seconds and the interpreter aborts.
+    """
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, budget: float = FRAME_BUDGET):
+        if self._instance is not None:
+            raise ValueError("An instantiation already exists!")
+        super().__init__()
+        self.budget = budget
+        self.handlers = []  # Called first in each tick, with its time in ms
+        self.animations = {}  # Running animation: time it started, ms
+        self.clock = now_ms  # Replaced with set_clock by the replayer, to run on recorded time
+        self.warn = False
+
+        # Counters
+        self.frames = 0
+        self.late = 0  # Frames over budget
+        self.work = 0.0  # ms, spent in all the frames
+        self.longest = 0.0  # ms, of work in a single frame
+        self.parts = {"input": 0.0, "animations": 0.0, "paint": 0.0}  # ms, spent in each part
+
+        # Stopped by the replayer, which ticks on recorded time
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(FRAME_INTERVAL)
+
+    def add_handler(self, handler):
+        """Call `handler` with the time of each tick, before the animations advance"""
+        self.handlers.append(handler)
+
+    def set_clock(self, clock):
+        """Run on `clock`, the running animations carry on from where they are"""
+        shift = clock() - self.clock()
+        for animation in self.animations:
+            self.animations[animation] += shift
+        self.clock = clock
+
+    def play(self, animation: QAbstractAnimation):
+        """Start `animation` on the next tick, nothing if it is running"""
+        if animation in self.animations and animation.state() == QAbstractAnimation.Paused:
+            return
+        # Paused, Qt's own animation timer leaves it to the ticks
+        QAbstractAnimation.start(animation)
+        QAbstractAnimation.pause(animation)
+        self.animations[animation] = self.clock()
+
+    def tick(self):
+        now = self.clock()
+        started = now_ms()
+        for handler in self.handlers:
+            handler(now)
+        handled = now_ms()
+
+        for animation, start in list(self.animations.items()):
+            if animation.state() == QAbstractAnimation.Paused:
+                elapsed = now - start
+                total = animation.totalDuration()
+                if animation.direction() == QAbstractAnimation.Backward and total >= 0:
+                    elapsed = total - elapsed
+                # Stops the animation, which emits finished, once it reached its end
+                animation.setCurrentTime(max(0, round(elapsed)))
+            if animation.state() == QAbstractAnimation.Stopped:
+                self.animations.pop(animation, None)
+        animated = now_ms()
+
+        # The updates of the whole frame are painted in one pass per window
+        QCoreApplication.sendPostedEvents(None, QEvent.UpdateRequest)
+        painted = now_ms()
+
+        self.record(handled - started, animated - handled, painted - animated)
+
+    def record(self, input_time: float, animation_time: float, paint_time: float):
+        work = input_time + animation_time + paint_time
+        self.frames += 1
+        self.work += work
+        self.longest = max(self.longest, work)
+        self.parts["input"] += input_time
+        self.parts["animations"] += animation_time
+        self.parts["paint"] += paint_time
+        if work > self.budget:
+            self.late += 1
+            if self.warn:
+                print(
+                    f"Frame over budget: {work:.1f} ms (input {input_time:.1f}, "
+                    f"{len(self.animations)} animations {animation_time:.1f}, paint {paint_time:.1f})"
+                )
+
+    def stop(self):
+        """No more ticks, the running animations stop where they are; the next getInstance makes a new scheduler"""
+        self.timer.stop()
+        for animation in list(self.animations):
+            animation.stop()
+        self.animations.clear()
+        self.handlers.clear()
+        if FrameScheduler._instance is self:
+            FrameScheduler._instance = None
+        self.deleteLater()
+
+    def stats(self):
+        frames = max(self.frames, 1)
+        return {
+            "frames": self.frames,
+            "late": self.late,
+            "mean_work": round(self.work / frames, 2),
+            "longest_work": round(self.longest, 1),
+            **{f"mean_{part}": round(time / frames, 2) for part, time in self.parts.items()},
+        }
+
+
+class FrameAnimation(QPropertyAnimation):
+    """QPropertyAnimation advanced by the frame scheduler.
+
+    While it runs its state is Paused, check it against Stopped.
+    """
+
+    def start(self):
+        FrameScheduler.getInstance().play(self)
+
+
+class FrameAnimationGroup(QParallelAnimationGroup):
+    """QParallelAnimationGroup advanced by the frame scheduler, with its animations"""
+
+    def start(self):
+        FrameScheduler.getInstance().play(self)
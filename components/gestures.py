@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtCore import *
+
+from config import (
+    GESTURE_WINDOW,
+    SWIPE_DISTANCE,
+    FLICK_DISTANCE,
+    DWELL_TIME,
+    DWELL_RADIUS,
+    GESTURE_COOLDOWN,
+    GESTURE_HISTORY,
+)
+
+
+@dataclass(frozen=True)
+class GestureParams:
+    window: float = GESTURE_WINDOW  # ms
+    swipe_distance: float = SWIPE_DISTANCE  # px
+    flick_distance: float = FLICK_DISTANCE  # px
+    dwell_time: float = DWELL_TIME  # ms
+    dwell_radius: float = DWELL_RADIUS  # px
+    cooldown: float = GESTURE_COOLDOWN  # ms
+
+
+def motion_scores(t, x, y, window: float):
+    """Largest downward, leftward and rightward move completed at each sample.
+
+    A move counts for sample j when it starts at an earlier sample less than
+    `window` ms before, and goes mostly in that direction. All samples are
+    scored at once, one lag at a time.
+    """
+    count = len(t)
+    down = np.zeros(count)
+    left = np.zeros(count)
+    right = np.zeros(count)
+
+    for lag in range(1, count):
+        inside = (t[lag:] - t[:-lag]) <= window
+        if not inside.any():
+            break  # Timestamps are sorted, larger lags are even older
+        dx = x[lag:] - x[:-lag]
+        dy = y[lag:] - y[:-lag]
+        vertical = inside & (dy > np.abs(dx))
+        horizontal = inside & (np.abs(dx) > np.abs(dy))
+        np.maximum(down[lag:], np.where(vertical, dy, 0), out=down[lag:])
+        np.maximum(left[lag:], np.where(horizontal, -dx, 0), out=left[lag:])
+        np.maximum(right[lag:], np.where(horizontal, dx, 0), out=right[lag:])
+
+    return down, left, right
+
+
+def detect_motions(t, x, y, params: GestureParams):
+    """Flag the samples that complete a downward flick, a left or a right swipe"""
+    down, left, right = motion_scores(t, x, y, params.window)
+    return (
+        down > params.flick_distance,
+        left > params.swipe_distance,
+        right > params.swipe_distance,
+    )
+
+
+def is_dwelling(t, x, y, now, params: GestureParams):
+    """True if the pointer stayed within `dwell_radius` for `dwell_time` ms"""
+    start = np.searchsorted(t, now - params.dwell_time, side="right") - 1
+    if start < 0:
+        return False  # Not enough history to know where the pointer was
+    dx = x[start:] - x[-1]
+    dy = y[start:] - y[-1]
+    return bool(np.all(dx * dx + dy * dy <= params.dwell_radius**2))
+
+
+class GestureEngine(QObject):
+    """Classify pointer samples into gestures, once per frame.
+
+    Samples are kept in a ring buffer and evaluated in one batch by
+    `evaluate`, scenes connect to the signals of the gestures they handle.
+    """
+
+    swiped = Signal(int)  # -1: hand moved to the left, 1: to the right
+    flicked_down = Signal()
+    dwelled = Signal(QPointF)
+
+    def __init__(self, params: GestureParams = None, capacity=GESTURE_HISTORY):
+        super().__init__()
+        self.params = params or GestureParams()
+        self.capacity = capacity
+        self.t = np.zeros(capacity)
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.written = 0
+        self.evaluated = 0
+        self.forget_before = -np.inf  # Samples of a detected gesture can't trigger again
+        self.cooldown_until = -np.inf
+        self.dwelling = False
+
+    def add(self, t: float, x: float, y: float):
+        index = self.written % self.capacity
+        self.t[index] = t
+        self.x[index] = x
+        self.y[index] = y
+        self.written += 1
+
+    def add_many(self, t, x, y):
+        count = len(t)
+        if count > self.capacity:
+            t, x, y = t[-self.capacity :], x[-self.capacity :], y[-self.capacity :]
+            self.written += count - self.capacity
+            count = self.capacity
+        indices = np.arange(self.written, self.written + count) % self.capacity
+        self.t[indices] = t
+        self.x[indices] = x
+        self.y[indices] = y
+        self.written += count
+
+    def history(self, since=-np.inf):
+        """Samples taken at or after `since`, oldest first"""
+        count = min(self.written, self.capacity)
+        indices = np.arange(self.written - count, self.written) % self.capacity
+        t = self.t[indices]
+        start = np.searchsorted(t, since)
+        indices = indices[start:]
+        return t[start:], self.x[indices], self.y[indices]
+
+    def evaluate(self, now: float):
+        new = min(self.written - self.evaluated, self.capacity)
+        self.evaluated = self.written
+        if self.written == 0:
+            return
+
+        if new and now >= self.cooldown_until:
+            self.detect_motions(new)
+        self.detect_dwell(now)
+
+    def detect_motions(self, new):
+        # Only the new samples can complete a gesture, older ones were
+        # already checked on previous frames
+        first_new = self.t[(self.written - new) % self.capacity]
+        since = max(first_new - self.params.window, self.forget_before)
+        t, x, y = self.history(since)
+        new = min(new, len(t))
+        flick, swipe_left, swipe_right = detect_motions(t, x, y, self.params)
+
+        triggers = np.flatnonzero((flick | swipe_left | swipe_right)[-new:])
+        if len(triggers) == 0:
+            return
+
+        index = len(t) - new + triggers[0]
+        self.forget_before = t[index]
+        self.cooldown_until = t[index] + self.params.cooldown
+        if flick[index]:
+            self.flicked_down.emit()
+        else:
+            self.swiped.emit(-1 if swipe_left[index] else 1)
+
+    def detect_dwell(self, now):
+        t, x, y = self.history()
+        if is_dwelling(t, x, y, now, self.params):
+            if not self.dwelling:
+                self.dwelling = True
+                self.dwelled.emit(QPointF(x[-1], y[-1]))
+        else:
+            self.dwelling = False
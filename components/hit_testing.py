@@ -0,0 +1,123 @@
+from bisect import bisect_right
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import HOVER_HYSTERESIS
+
+from components.pointer import PointerInput
+
+
+class RegionIndex:
+    """Point location over disjoint rectangles, by slab decomposition.
+
+    The x axis is cut at every vertical edge, the rectangles crossing a slab
+    are sorted by their top edge: a lookup is two bisections.
+    """
+
+    def __init__(self, regions):
+        self.edges = sorted({rect.left() for rect, _ in regions} | {rect.right() for rect, _ in regions})
+        self.slabs = []
+        for left, right in zip(self.edges, self.edges[1:]):
+            middle = (left + right) / 2
+            crossing = sorted(
+                ((rect, target) for rect, target in regions if rect.left() <= middle < rect.right()),
+                key=lambda region: region[0].top(),
+            )
+            self.slabs.append(([rect.top() for rect, _ in crossing], crossing))
+
+    def find(self, point: QPointF):
+        slab = bisect_right(self.edges, point.x()) - 1
+        if slab < 0 or slab >= len(self.slabs):
+            return None
+        tops, regions = self.slabs[slab]
+        row = bisect_right(tops, point.y()) - 1
+        if row < 0:
+            return None
+        rect, target = regions[row]
+        return target if point.y() < rect.bottom() else None
+
+
+class SelectionModel(QObject):
+    """Hover selection of a scene, resolved from the pointer once per frame.
+
+    Replaces enter/leave events: the targets' global rectangles are indexed,
+    the selection sticks to the current target until the pointer is more than
+    `hysteresis` px outside of it, and `selection_changed` fires at most once
+    per frame. Leaving every target keeps the last selection.
+    """
+
+    selection_changed = Signal(QWidget)
+
+    def __init__(self, scene: QWidget, targets, clip: QWidget = None, hysteresis=HOVER_HYSTERESIS):
+        super().__init__(scene)
+        self.scene = scene
+        self.targets = list(targets)
+        self.clip = clip  # Only the part of the targets shown by this widget is selectable
+        self.hysteresis = hysteresis
+        self.enabled = True
+        self.selected = None
+        self.index = None
+        self.rects = {}
+        self.dirty = True
+        self.position = None
+        self.changes = 0
+
+        for target in self.targets:
+            target.installEventFilter(self)
+        self.pointer = PointerInput.getInstance()
+        self.pointer.add_frame_handler(self.on_frame)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide):
+            self.invalidate()
+        return super().eventFilter(obj, event)
+
+    def invalidate(self):
+        """The targets moved, rebuild the index on the next frame"""
+        self.index = None
+        self.dirty = True
+
+    def clear(self):
+        self.selected = None
+        self.dirty = True
+
+    def build(self):
+        clip = None
+        if self.clip is not None:
+            clip = QRectF(self.clip.mapToGlobal(QPointF(0, 0)), QSizeF(self.clip.size()))
+
+        self.rects = {}
+        for target in self.targets:
+            if not target.isVisible():
+                continue
+            rect = QRectF(target.mapToGlobal(QPointF(0, 0)), QSizeF(target.size()))
+            if clip is not None:
+                rect = rect.intersected(clip)
+            if not rect.isEmpty():
+                self.rects[target] = rect
+        self.index = RegionIndex([(rect, target) for target, rect in self.rects.items()])
+
+    def on_frame(self, now: float):
+        if not self.enabled or not self.scene.isVisible():
+            return
+        position = self.pointer.position
+        if not self.dirty and position == self.position:
+            return
+        self.position = position
+        self.dirty = False
+        if self.index is None:
+            self.build()
+
+        # Jitter along a border must not flip the selection back and forth
+        current = self.rects.get(self.selected)
+        margin = self.hysteresis
+        if current is not None and current.adjusted(-margin, -margin, margin, margin).contains(position):
+            return
+
+        target = self.index.find(position)
+        if target is not None and target is not self.selected:
+            self.selected = target
+            self.changes += 1
+            self.selection_changed.emit(target)
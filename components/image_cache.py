@@ -0,0 +1,153 @@
+from collections import OrderedDict
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtSvg import *
+
+from config import IMAGE_CACHE_BUDGET
+
+
+class ImageCache:
+    """Pre-scaled pixmaps shared by every widget, under a memory budget.
+
+    Keyed by asset, size in device pixels and aspect mode, so a pixmap is
+    drawn without being scaled again and two widgets showing the same file
+    share it. A miss takes the image from the asset pack of the screen when it
+    was packed at that size, else scales down a larger packed one, else decodes
+    the file straight at the target size. SVG icons are rasterized once per
+    size and device pixel ratio the same way. The least recently used pixmaps
+    are dropped once the budget is exceeded.
+    """
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, budget: int = IMAGE_CACHE_BUDGET):
+        if self._instance is not None:
+            raise ValueError("An instantiation already exists!")
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.pack = None
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.packed = 0  # Misses served from the pack without scaling
+
+    def pixmap(self, path: str, size: QSize = None, ratio: float = 1.0, mode=Qt.IgnoreAspectRatio):
+        """Pixmap of `path` fitting `size` in logical pixels, the source size if None"""
+        key, target = self.key(path, size, ratio, mode)
+        pixmap = self.cached(key)
+        if pixmap is None:
+            self.misses += 1
+            pixmap = self.add(key, *decode_image(self.pack, path, target, mode))
+        return pixmap
+
+    def key(self, path: str, size: QSize, ratio: float, mode):
+        """Key of a request and its size in device pixels"""
+        target = None if size is None else QSize(round(size.width() * ratio), round(size.height() * ratio))
+        return (path, None if target is None else (target.width(), target.height()), ratio, mode), target
+
+    def cached(self, key):
+        pixmap = self.entries.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return pixmap
+
+    def latest(self, path: str):
+        """Most recently used pixmap of `path`, whatever its size"""
+        for key in reversed(self.entries):
+            if key[0] == path:
+                return self.entries[key]
+        return None
+
+    def add(self, key, image: QImage, packed: bool = False):
+        """Pixmap of a decoded image, kept under `key`. GUI thread only."""
+        self.packed += packed
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            return pixmap
+        pixmap.setDevicePixelRatio(key[2])
+        self.insert(key, pixmap)
+        return pixmap
+
+    def insert(self, key, pixmap: QPixmap):
+        size = pixmap_bytes(pixmap)
+        if size > self.budget:
+            return
+        self.entries[key] = pixmap
+        self.bytes += size
+        while self.bytes > self.budget:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= pixmap_bytes(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "packed": self.packed,
+        }
+
+
+def decode_image(pack, path: str, target: QSize, mode):
+    """Image of `path` at `target` device pixels, and whether the pack had it.
+
+    Touches no pixmap, it runs on the asset loader threads as well.
+    """
+    if path.lower().endswith(".svg"):
+        return render_svg(path, target, mode), False
+    if pack is not None:
+        image = pack.image(path, target, mode)
+        if image is not None:
+            return image, True
+        source = None if target is None else pack.source(path, target)
+        if source is not None:
+            return source.scaled(source.size().scaled(target, mode), Qt.IgnoreAspectRatio, Qt.SmoothTransformation), False
+
+    reader = QImageReader(path)
+    if target is not None and reader.size().isValid():
+        # JPEGs are decoded at a fraction of their size, much faster
+        target = reader.size().scaled(target, mode)
+        reader.setScaledSize(target)
+    image = reader.read()
+    if image.isNull():
+        print(f"Failed to load image: {path} ({reader.errorString()})")
+    elif target is not None and image.size() != target:
+        image = image.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    return image, False
+
+
+def render_svg(path: str, target: QSize, mode):
+    """SVG rasterized at `target` device pixels, its default size if None"""
+    renderer = QSvgRenderer(path)
+    if not renderer.isValid():
+        print(f"Failed to load image: {path}")
+        return QImage()
+    size = renderer.defaultSize() if target is None else renderer.defaultSize().scaled(target, mode)
+    image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+    return image
+
+
+def pixmap_bytes(pixmap: QPixmap):
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
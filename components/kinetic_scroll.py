@@ -0,0 +1,136 @@
+import math
+
+from PySide6.QtCore import *
+
+from config import (
+    FRAME_INTERVAL,
+    SCROLL_ACCELERATION,
+    SCROLL_SNAP_TIME,
+    SCROLL_MAX_STEP,
+)
+
+REST_DISTANCE = 0.5  # px from the snap position, and
+REST_SPEED = 5.0  # px/s, under which the scroll stops
+
+
+class KineticScroll(QObject):
+    """Scroll position moved by velocity, advanced once per frame.
+
+    While driven, the velocity goes toward the drive velocity with a bounded
+    acceleration; released, the position settles on the multiple of `step`
+    it was gliding to, along a critically damped spring. Every step is
+    computed from the time elapsed since the previous frame, so the motion is
+    the same whatever the frame rate, and a late frame is counted as dropped.
+    At rest, frames cost nothing.
+    """
+
+    def __init__(self, step: int, parent=None):
+        super().__init__(parent)
+        self.step = step  # px between snap positions
+        self.position = 0.0  # px
+        self.velocity = 0.0  # px/s
+        self.drive = 0.0  # px/s wanted while driven, 0 when released
+        self.target = None  # Snap position being settled on
+        self.time = None  # ms, of the previous frame while moving
+        self.handlers = []  # Called with the position, rounded to the pixel, when it moved
+
+        # Counters
+        self.frames = 0  # Frames advanced while moving
+        self.dropped = 0  # Frames missed between two of them
+        self.longest = 0.0  # ms, longest gap between two frames
+
+    @property
+    def moving(self):
+        return self.drive != 0 or self.target is not None or self.velocity != 0
+
+    def add_handler(self, handler):
+        self.handlers.append(handler)
+
+    def call_handlers(self):
+        position = round(self.position)
+        for handler in self.handlers:
+            handler(position)
+
+    def drive_at(self, velocity: float):
+        """Scroll at `velocity` px/s, the sign giving the direction; 0 settles on a step"""
+        if velocity == self.drive:
+            return
+        self.drive = velocity
+        if velocity:
+            self.target = None
+        elif self.velocity:
+            # Settle where the scroll would glide to if it slowed down at the same rate
+            glide = math.copysign(self.velocity**2 / (2 * SCROLL_ACCELERATION), self.velocity)
+            self.snap_to(round((self.position + glide) / self.step) * self.step)
+        else:
+            self.snap_to(round(self.position / self.step) * self.step)
+
+    def snap_by(self, steps: int):
+        """Settle `steps` steps away from the step being settled on, or the nearest one"""
+        base = self.target if self.target is not None else round(self.position / self.step) * self.step
+        self.drive = 0.0
+        self.snap_to(base + steps * self.step)
+
+    def snap_to(self, position: float):
+        self.target = position if position != self.position or self.velocity else None
+
+    def stop(self):
+        """Rest at once, on the step being settled on if any"""
+        if self.target is not None:
+            self.position = self.target
+        self.drive = self.velocity = 0.0
+        self.target = self.time = None
+        self.call_handlers()
+
+    def advance(self, now: float):
+        """Move by the time elapsed since the previous frame, `now` in ms"""
+        if not self.moving:
+            self.time = None
+            return
+        if self.time is None:
+            # First frame of a move, it starts from here
+            self.time = now
+            return
+        elapsed = now - self.time
+        self.time = now
+        if elapsed <= 0:
+            return
+        self.frames += 1
+        self.longest = max(self.longest, elapsed)
+        if elapsed > 1.5 * FRAME_INTERVAL:
+            self.dropped += round(elapsed / FRAME_INTERVAL) - 1
+        # A stall is not caught up in one jump
+        dt = min(elapsed, SCROLL_MAX_STEP) / 1000
+
+        if self.target is None:
+            self.accelerate(dt)
+        else:
+            self.settle(dt)
+        self.call_handlers()
+
+    def accelerate(self, dt: float):
+        change = max(-SCROLL_ACCELERATION * dt, min(SCROLL_ACCELERATION * dt, self.drive - self.velocity))
+        # Exact for a constant acceleration over the step
+        self.position += (self.velocity + change / 2) * dt
+        self.velocity += change
+
+    def settle(self, dt: float):
+        # Closed form of the critically damped spring, stable for any step
+        omega = 1000 / SCROLL_SNAP_TIME
+        offset = self.position - self.target
+        decay = math.exp(-omega * dt)
+        slope = self.velocity + omega * offset
+        offset = (offset + slope * dt) * decay
+        self.velocity = (self.velocity - omega * slope * dt) * decay
+        self.position = self.target + offset
+        if abs(offset) < REST_DISTANCE and abs(self.velocity) < REST_SPEED:
+            self.position = self.target
+            self.velocity = 0.0
+            self.target = None
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "longest_frame": round(self.longest, 1),
+        }
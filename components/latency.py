@@ -0,0 +1,185 @@
+import json
+import math
+import platform
+import time
+from bisect import bisect_right
+from collections import deque
+
+import numpy as np
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import LATENCY_HISTORY
+
+from components.parameters import GlobalParameters
+from components.pointer import PointerInput
+from components.scenes import Scenes
+
+PERCENTILES = (50, 95, 99)
+
+
+class RollingHistogram:
+    """Distribution of the last `size` values, in logarithmic bins.
+
+    Recording is O(1) and memory is fixed, percentiles are read from the
+    bins so they are precise to about 6% (20 bins per decade).
+    """
+
+    def __init__(self, size=LATENCY_HISTORY, low=0.1, high=10_000.0, bins_per_decade=20):
+        count = round(math.log10(high / low) * bins_per_decade)
+        self.edges = low * 10 ** (np.arange(count + 1) / bins_per_decade)
+        self.counts = np.zeros(len(self.edges) + 1, int)  # First and last bins catch what is out of range
+        self.recent = deque(maxlen=size)
+        self.total = 0
+
+    def record(self, value: float):
+        index = bisect_right(self.edges, value)
+        if len(self.recent) == self.recent.maxlen:
+            self.counts[self.recent[0]] -= 1
+        self.recent.append(index)
+        self.counts[index] += 1
+        self.total += 1
+
+    def __len__(self):
+        return len(self.recent)
+
+    def bin_value(self, index):
+        if index == 0:
+            return float(self.edges[0])
+        if index == len(self.edges):
+            return float(self.edges[-1])
+        return float(math.sqrt(self.edges[index - 1] * self.edges[index]))
+
+    def percentile(self, q: float):
+        if not self.recent:
+            return math.nan
+        rank = max(1, math.ceil(q / 100 * len(self.recent)))
+        return self.bin_value(int(np.searchsorted(np.cumsum(self.counts), rank)))
+
+    def summary(self):
+        result = {"count": len(self.recent), "total": self.total}
+        for q in PERCENTILES:
+            result[f"p{q}"] = self.percentile(q)
+        return result
+
+
+class LatencyMonitor(QObject):
+    """Delay from a pointer sample to the repaint it causes, per scene.
+
+    Samples are stamped when they are ingested (their time in PointerInput).
+    A handler that changes what is shown calls `tag` on the widget to repaint,
+    with the scene it belongs to; the first paint of a tagged widget records
+    now minus the stamp of the newest sample delivered at its latest tag. A
+    widget hidden before it is painted records nothing.
+    The paint is timed as it starts, composition and display are not included.
+    """
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if self._instance is not None:
+            raise ValueError("An instantiation already exists!")
+        super().__init__()
+        self.pointer = PointerInput.getInstance()
+        self.histograms = {}
+        self.pending = {}  # widget: (sample time, scene)
+        self.watched = set()
+        self.last_recorded = {}  # scene: sample time, one record per sample
+
+    def tag(self, widget: QWidget, scene: Scenes):
+        if self.pointer.time == 0:
+            return  # Nothing came from the pointer yet
+        self.pending[widget] = (self.pointer.time, scene.name.lower())
+        if widget not in self.watched:
+            self.watched.add(widget)
+            widget.installEventFilter(self)
+            widget.destroyed.connect(lambda: self.forget(widget))
+
+    def forget(self, widget):
+        self.watched.discard(widget)
+        self.pending.pop(widget, None)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and obj in self.pending:
+            sample_time, scene = self.pending.pop(obj)
+            if self.last_recorded.get(scene) != sample_time:
+                self.last_recorded[scene] = sample_time
+                self.record(scene, self.pointer.clock() - sample_time)
+        elif event.type() == QEvent.Hide:
+            # Its next paint answers a later input, not this one
+            self.pending.pop(obj, None)
+        return super().eventFilter(obj, event)
+
+    def record(self, scene: str, latency: float):
+        if scene not in self.histograms:
+            self.histograms[scene] = RollingHistogram()
+        self.histograms[scene].record(latency)
+
+    def summary(self):
+        return {scene: histogram.summary() for scene, histogram in sorted(self.histograms.items())}
+
+    def dump(self, path=None, **metadata):
+        """Write the histograms to a JSON file, to compare boards and releases"""
+        if path is None:
+            path = time.strftime("latency-%Y%m%d-%H%M%S.json")
+        scenes = {}
+        for scene, histogram in sorted(self.histograms.items()):
+            scenes[scene] = histogram.summary()
+            scenes[scene]["bins"] = {
+                f"{histogram.bin_value(index):.3g}": int(count)
+                for index, count in enumerate(histogram.counts)
+                if count
+            }
+        report = {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "pyside": PYSIDE_VERSION,
+            "unit": "ms",
+            **metadata,
+            "scenes": scenes,
+        }
+        with open(path, "w") as file:
+            json.dump(report, file, indent=2)
+        return path
+
+
+class LatencyOverlay(QLabel):
+    """Input to paint latency percentiles, in a corner of the window in debug mode"""
+
+    def __init__(self, window: QWidget, debug: bool):
+        super().__init__(window)
+        self.debug = debug
+        self.monitor = LatencyMonitor.getInstance()
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setFont(QFont("Courier New", 12))
+        self.setStyleSheet("color: #ece0d1; background-color: rgba(56, 34, 15, 200); padding: 6px;")
+        self.hide()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(500)
+
+    def refresh(self):
+        visible = self.debug or GlobalParameters.getInstance().debug.state
+        self.setVisible(visible)
+        if not visible:
+            return
+
+        lines = ["latency (ms)   p50    p95    p99      n"]
+        for scene, summary in self.monitor.summary().items():
+            values = "".join(f"{summary[f'p{q}']:7.1f}" for q in PERCENTILES)
+            lines.append(f"{scene:<12}{values}{summary['count']:7d}")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self.move(self.parentWidget().rect().right() - self.width() - 10, 10)
+        self.raise_()
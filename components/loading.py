@@ -2,6 +2,8 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
+from components.frame_scheduler import FrameScheduler
+
 
 class ProgressionBar(QWidget):
     def __init__(self):
@@ -22,15 +24,13 @@ class ProgressionBar(QWidget):
         )
         self.layout.addWidget(self.progress_bar)
 
-        # Timer for Progress Bar Update
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_progress_bar)
-        self.timer.start(16)  # Update interval in milliseconds
+        # Updated once per frame
+        FrameScheduler.getInstance().add_handler(self.update_progress_bar)
 
         # Initialize progress value
         self.progress_value = 0
 
-    def update_progress_bar(self):
+    def update_progress_bar(self, now: float):
         # Check if the progress bar is visible
         if not self.progress_bar.isVisible():
             return
@@ -0,0 +1,150 @@
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+EDGE_GLOW_WIDTH = 10  # px
+
+
+class TextRaster:
+    """Text drawn once into an image, composited again at any opacity.
+
+    Text this large is filled as paths rather than taken from the glyph
+    cache, so laying it out and drawing it again costs most of a frame. The
+    image is redrawn only when the text, font, rectangle or color change.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.image = None
+        self.origin = QPoint()
+
+    def draw(self, painter: QPainter, rect: QRect, flags: int, text: str, color: QColor, ratio: float):
+        key = (text, painter.font().key(), rect.getRect(), flags, color.rgb(), ratio)
+        if key != self.key:
+            self.key = key
+            self.render(painter.font(), rect, flags, text, color, ratio)
+        if self.image is None:
+            return
+        painter.setOpacity(painter.opacity() * color.alphaF())
+        painter.drawImage(self.origin, self.image)
+
+    def render(self, font: QFont, rect: QRect, flags: int, text: str, color: QColor, ratio: float):
+        metrics = QFontMetrics(font)
+        # Some glyphs overhang their advance, the margin keeps them whole
+        margin = metrics.height() // 8
+        bounds = metrics.boundingRect(rect, flags, text).adjusted(-margin, -margin, margin, margin) & rect
+        if bounds.isEmpty():
+            self.image = None
+            return
+        self.origin = bounds.topLeft()
+        self.image = QImage(bounds.size() * ratio, QImage.Format_ARGB32_Premultiplied)
+        self.image.setDevicePixelRatio(ratio)
+        self.image.fill(Qt.transparent)
+        painter = QPainter(self.image)
+        painter.setFont(font)
+        painter.setPen(QColor(color.rgb()))
+        painter.translate(-bounds.topLeft())
+        painter.drawText(rect, flags, text)
+        painter.end()
+
+
+class PaintedLabel(QLabel):
+    """QLabel drawing its text in a color and opacity of its own.
+
+    Changing the color, its alpha or the opacity only repaints the label,
+    where a new stylesheet would be parsed and polished again for the whole
+    subtree. The text is rasterized once and composited again. Without a
+    color of its own, the label takes the one of its stylesheet.
+    """
+
+    def __init__(self, text: str = "", color: QColor = QColor("black"), parent=None):
+        super().__init__(text, parent)
+        self._color = None if color is None else QColor(color)
+        self._opacity = 1.0
+        self.raster = TextRaster()
+
+    def color(self):
+        if self._color is None:
+            return self.palette().color(self.foregroundRole())
+        return QColor(self._color)
+
+    def set_color(self, color: QColor):
+        if color != self._color:
+            self._color = QColor(color)
+            self.update()
+
+    def set_alpha(self, alpha: int):
+        color = self.color()
+        color.setAlpha(alpha)
+        self.set_color(color)
+
+    def get_opacity(self):
+        return self._opacity
+
+    def set_opacity(self, opacity: float):
+        if opacity != self._opacity:
+            self._opacity = opacity
+            self.update()
+
+    opacity = Property(float, get_opacity, set_opacity)
+
+    def paintEvent(self, event):
+        color = self.color()
+        if not color.alpha() or not self._opacity:
+            return
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setOpacity(self._opacity)
+        flags = self.alignment().value
+        if self.wordWrap():
+            flags |= Qt.TextWordWrap.value
+        self.raster.draw(painter, self.contentsRect(), flags, self.text(), color, self.devicePixelRatioF())
+
+
+class EdgeGlow(QWidget):
+    """Bar glowing on the left or right edge of its parent, drawn over it.
+
+    `set_glow` only repaints the edges that change, the parent and its
+    stylesheet are left alone.
+    """
+
+    def __init__(self, parent: QWidget, color: QColor):
+        super().__init__(parent)
+        self.color = QColor(color)
+        self.side = 0  # -1: left, 1: right, 0: none
+        self.alpha = 0
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        parent.installEventFilter(self)
+        self.setGeometry(parent.rect())
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.setGeometry(obj.rect())
+            self.raise_()
+        return super().eventFilter(obj, event)
+
+    def edge_rect(self, side: int):
+        if side < 0:
+            return QRect(0, 0, EDGE_GLOW_WIDTH, self.height())
+        return QRect(self.width() - EDGE_GLOW_WIDTH, 0, EDGE_GLOW_WIDTH, self.height())
+
+    def set_glow(self, side: int, alpha: int = 0):
+        if not alpha:
+            side = 0
+        if (side, alpha) == (self.side, self.alpha):
+            return
+        if self.side:
+            self.update(self.edge_rect(self.side))
+        self.side = side
+        self.alpha = alpha
+        if side:
+            self.raise_()
+            self.update(self.edge_rect(side))
+
+    def paintEvent(self, event):
+        if not self.side:
+            return
+        color = QColor(self.color)
+        color.setAlpha(self.alpha)
+        QPainter(self).fillRect(self.edge_rect(self.side), color)
@@ -0,0 +1,113 @@
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+
+from components.gestures import GestureEngine
+from components.smoothing import OneEuroFilter
+from components.utils import now_ms
+
+
+class PointerInput(QObject):
+    """Single entry point for pointer positions, delivered once per frame.
+
+    Mouse events and sensor samples are fed as they arrive, `flush` is called
+    once per frame and calls the move handlers with the newest position only.
+    Every sample still reaches the gesture engine, evaluated in the same flush.
+    Samples are smoothed first, the recorder keeps them raw. Like the frame
+    scheduler's, the handlers are called directly rather than by signals.
+    """
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if self._instance is not None:
+            raise ValueError("An instantiation already exists!")
+        super().__init__()
+        self.position = QPointF()
+        self.time = 0.0
+        self.pending = None
+        self.last_event = None
+        self.gestures = GestureEngine()
+        self.smoothing = OneEuroFilter()
+        self.recorder = None
+        self.clock = now_ms  # Replaced by the replayer to run on recorded time
+        self.move_handlers = []  # Called with the position when it moved
+        self.frame_handlers = []  # Called with the time by every flush, moved or not
+
+        # Counters
+        self.received = 0  # Distinct samples fed
+        self.duplicates = 0  # Same mouse event seen by another object
+        self.coalesced = 0  # Samples replaced by a newer one within a frame
+        self.updates = 0  # Positions given to the move handlers
+
+    def add_move_handler(self, handler):
+        self.move_handlers.append(handler)
+
+    def add_frame_handler(self, handler):
+        self.frame_handlers.append(handler)
+
+    def feed_event(self, event: QMouseEvent):
+        # The application filter sees a move once per object it goes through
+        key = (event.timestamp(), event.globalPosition())
+        if key == self.last_event:
+            self.duplicates += 1
+            return
+        self.last_event = key
+        position = event.globalPosition()
+        self.feed(self.clock(), position.x(), position.y())
+
+    def feed(self, t: float, x: float, y: float):
+        self.received += 1
+        if self.pending is not None:
+            self.coalesced += 1
+        if self.recorder is not None:
+            self.recorder.record_pointer(t, x, y)
+        x, y = self.smoothing.filter(t, x, y)
+        self.pending = (t, x, y)
+        self.gestures.add(t, x, y)
+
+    def feed_many(self, t, x, y):
+        """Feed a batch of samples (sequences of equal length, oldest first)"""
+        count = len(t)
+        if count == 0:
+            return
+        self.received += count
+        self.coalesced += count - 1 + (self.pending is not None)
+        if self.recorder is not None:
+            self.recorder.record_pointers(t, x, y)
+        x, y = self.smoothing.filter_many(t, x, y)
+        self.pending = (t[-1], x[-1], y[-1])
+        self.gestures.add_many(t, x, y)
+
+    def flush(self):
+        now = self.clock()
+        if self.recorder is not None:
+            self.recorder.maybe_flush(now)
+        if self.pending is not None:
+            self.time, x, y = self.pending
+            self.pending = None
+            self.position = QPointF(x, y)
+            self.updates += 1
+            for handler in self.move_handlers:
+                handler(self.position)
+        self.gestures.evaluate(now)
+        for handler in self.frame_handlers:
+            handler(now)
+
+    @property
+    def dropped(self):
+        return self.duplicates + self.coalesced
+
+    def stats(self):
+        return {
+            "received": self.received,
+            "duplicates": self.duplicates,
+            "coalesced": self.coalesced,
+            "updates": self.updates,
+            "smoothing_latency": round(self.smoothing.mean_latency, 2),
+        }
@@ -0,0 +1,72 @@
+from PySide6.QtCore import *
+
+from config import IDLE_TIMER, SCENE_IDLE_TIMERS, PRESENCE_CHECK_INTERVAL
+
+from components.pointer import PointerInput
+from components.scenes import Scenes
+
+
+class PresenceManager(QObject):
+    """Decide when the machine goes idle from the time of the last activity.
+
+    Input only writes a timestamp (`activity`), a single slow timer compares it
+    with the deadline of the current scene, so no timer is restarted per move.
+    A hand reported by the sensor counts as activity even when it is still.
+    """
+
+    went_idle = Signal()
+    presence_changed = Signal(bool)
+
+    def __init__(self):
+        super().__init__()
+        self.pointer = PointerInput.getInstance()
+        self.timeout = IDLE_TIMER
+        self.last_activity = self.pointer.clock()
+        self.extended_until = 0.0
+        self.paused = False
+        self.expired = False
+        self.present = False
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        self.timer.start(PRESENCE_CHECK_INTERVAL)
+
+    def activity(self):
+        self.last_activity = self.pointer.clock()
+        self.expired = False
+
+    def extend(self, duration: float):
+        """Stay awake at least `duration` ms from now, whatever the scene timeout"""
+        self.activity()
+        self.extended_until = max(self.extended_until, self.last_activity + duration)
+
+    def set_scene(self, scene: Scenes):
+        self.timeout = SCENE_IDLE_TIMERS.get(scene.name, IDLE_TIMER)
+        self.activity()
+
+    def set_presence(self, present: bool):
+        if present:
+            self.activity()
+        if present != self.present:
+            self.present = present
+            self.presence_changed.emit(present)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+        self.activity()
+
+    @property
+    def deadline(self):
+        if self.timeout is None:
+            return None
+        return max(self.last_activity + self.timeout, self.extended_until)
+
+    def check(self):
+        if self.paused or self.expired or self.deadline is None:
+            return
+        if self.pointer.clock() >= self.deadline:
+            self.expired = True
+            self.went_idle.emit()
@@ -0,0 +1,149 @@
+import glob
+import os
+import struct
+import time
+
+import numpy as np
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+
+from config import RECORD_FILE_SIZE, RECORD_MAX_FILES
+
+# A log file is a header followed by records. Each record is its kind, the
+# time since the start of the file (us) and a payload depending on the kind.
+MAGIC = b"LNR1"
+HEADER = struct.Struct("<4sdHH")  # magic, start time (ms, pointer clock), screen size
+RECORD = struct.Struct("<BI")
+KIND_POINTER = 1
+KIND_KEY = 2
+PAYLOADS = {
+    KIND_POINTER: struct.Struct("<hh"),  # position in quarter pixels
+    KIND_KEY: struct.Struct("<iB"),  # Qt key, 1 for a press and 0 for a release
+}
+POINTER_RECORD = np.dtype([("kind", "u1"), ("t", "<u4"), ("x", "<i2"), ("y", "<i2")])
+SUBPIXELS = 4
+MAX_OFFSET = 0xFFFFFFFF / 1000  # ms, a file can't span more than this
+FLUSH_SIZE = 64 * 1024  # bytes kept in memory before writing
+FLUSH_INTERVAL = 1000  # ms
+
+
+def subpixels(value):
+    return min(max(round(value * SUBPIXELS), -0x8000), 0x7FFF)
+
+
+class InputRecorder:
+    """Opt-in binary log of the pointer samples and key events of a session.
+
+    Files are rotated every `file_size` bytes and only the `max_files` most
+    recent are kept, so disk usage stays bounded on a kiosk running for weeks.
+    """
+
+    def __init__(self, directory, screen_size, file_size=RECORD_FILE_SIZE, max_files=RECORD_MAX_FILES):
+        self.directory = directory
+        self.screen_size = screen_size
+        self.file_size = file_size
+        self.max_files = max_files
+        self.file = None
+        self.buffer = bytearray()
+        self.last_key = None
+        self.last_flush = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def open_file(self, t):
+        if self.file is not None:
+            self.file.close()
+        name = time.strftime("input-%Y%m%d-%H%M%S")
+        index = 0
+        while os.path.exists(path := os.path.join(self.directory, f"{name}-{index:03d}.lnr")):
+            index += 1
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, t, *self.screen_size))
+        self.start = t
+        self.written = HEADER.size
+
+        for old in sorted(glob.glob(os.path.join(self.directory, "input-*.lnr")))[: -self.max_files]:
+            os.remove(old)
+
+    def offset(self, t):
+        if self.file is None or t - self.start >= MAX_OFFSET:
+            self.flush()
+            self.open_file(t)
+        return max(0, round((t - self.start) * 1000))
+
+    def record_pointer(self, t, x, y):
+        offset = self.offset(t)
+        self.buffer += RECORD.pack(KIND_POINTER, offset)
+        self.buffer += PAYLOADS[KIND_POINTER].pack(subpixels(x), subpixels(y))
+        self.rotate_if_full()
+
+    def record_pointers(self, t, x, y):
+        if len(t) == 0:
+            return
+        self.offset(t[0])
+        records = np.empty(len(t), POINTER_RECORD)
+        records["kind"] = KIND_POINTER
+        records["t"] = np.clip(np.round((np.asarray(t) - self.start) * 1000), 0, 0xFFFFFFFF)
+        records["x"] = np.clip(np.round(np.asarray(x) * SUBPIXELS), -0x8000, 0x7FFF)
+        records["y"] = np.clip(np.round(np.asarray(y) * SUBPIXELS), -0x8000, 0x7FFF)
+        self.buffer += records.tobytes()
+        self.rotate_if_full()
+
+    def record_key_event(self, t, event: QKeyEvent):
+        # The application filter sees a key once per object it goes through
+        key = (event.timestamp(), event.key(), event.type())
+        if key == self.last_key:
+            return
+        self.last_key = key
+        offset = self.offset(t)
+        self.buffer += RECORD.pack(KIND_KEY, offset)
+        self.buffer += PAYLOADS[KIND_KEY].pack(event.key(), event.type() == QEvent.KeyPress)
+        self.rotate_if_full()
+
+    def rotate_if_full(self):
+        if self.written + len(self.buffer) >= self.file_size:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+    def maybe_flush(self, now):
+        # Writes are batched, the GUI thread must not hit the disk every frame
+        if len(self.buffer) >= FLUSH_SIZE or now - self.last_flush >= FLUSH_INTERVAL:
+            self.flush()
+            self.last_flush = now
+
+    def flush(self):
+        if self.file is None or not self.buffer:
+            return
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.written += len(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_log(path):
+    """Return the screen size and the (kind, t, a, b) records of a log file"""
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, start, width, height = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an input log")
+
+    records = []
+    position = HEADER.size
+    while position + RECORD.size <= len(data):
+        kind, offset = RECORD.unpack_from(data, position)
+        payload = PAYLOADS.get(kind)
+        if payload is None or position + RECORD.size + payload.size > len(data):
+            break  # Truncated by a crash, keep what was complete
+        a, b = payload.unpack_from(data, position + RECORD.size)
+        if kind == KIND_POINTER:
+            a, b = a / SUBPIXELS, b / SUBPIXELS
+        records.append((kind, start + offset / 1000, a, b))
+        position += RECORD.size + payload.size
+    return (width, height), records
@@ -0,0 +1,63 @@
+from collections import Counter
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+
+class RepaintMonitor(QObject):
+    """Count what gets repainted, installed as an event filter of the app.
+
+    For every paint event it adds up the painted area per widget, in pixels,
+    and the union of the painted regions in window coordinates. Painted area
+    over the area of the union is the overdraw: how many times each repainted
+    pixel was painted.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self.paints = Counter()
+        self.areas = Counter()
+        self.regions = {}  # Union of the painted regions, by widget
+        self.region = QRegion()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and isinstance(obj, QWidget):
+            name = obj.objectName() or type(obj).__name__
+            region = event.region().translated(obj.mapTo(obj.window(), QPoint(0, 0)))
+            self.paints[name] += 1
+            self.areas[name] += region_area(region)
+            self.regions[name] = self.regions.get(name, QRegion()) + region
+            self.region += region
+        return super().eventFilter(obj, event)
+
+    @property
+    def painted(self):
+        return sum(self.areas.values())
+
+    @property
+    def overdraw(self):
+        covered = region_area(self.region)
+        return self.painted / covered if covered else 0.0
+
+    def outside(self, region: QRegion):
+        """Area painted outside `region`, by widget"""
+        areas = Counter({name: region_area(painted - region) for name, painted in self.regions.items()})
+        return +areas
+
+    def report(self, top: int = 10):
+        bounds = self.region.boundingRect()
+        lines = [
+            f"{self.painted} px painted in {sum(self.paints.values())} paints, overdraw {self.overdraw:.2f}, "
+            f"within {bounds.width()}x{bounds.height()}+{bounds.x()}+{bounds.y()}"
+        ]
+        for name, area in self.areas.most_common(top):
+            lines.append(f"  {name:<24}{self.paints[name]:>6} paints{area:>12} px")
+        return "\n".join(lines)
+
+
+def region_area(region: QRegion):
+    return sum(rect.width() * rect.height() for rect in region)
@@ -9,7 +9,7 @@ class CoffeeType(Enum):
     LATTE = (5, "Latte", True, "assets/coffee9.jpg")
     HAZELNUT = (6, "Hazelnut coffee", True, "assets/coffee1.jpg")
     CHOCOLATE = (7, "Chocolate", True, "assets/coffee10.jpg")
-    WATER = (8, "Water", False, "assets/coffee7.jpg")
+    WATER = (8, "Water", False, "assets/coffee5.jpg")
     TEA = (9, "Tea", True, "assets/the.jpg")
 
     def __init__(self, id, label, sweet, image_path):
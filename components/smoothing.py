@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+
+from config import (
+    SMOOTHING_MIN_CUTOFF,
+    SMOOTHING_BETA,
+    SMOOTHING_DERIVATIVE_CUTOFF,
+    SMOOTHING_LATENCY_BUDGET,
+)
+
+
+def smoothing_factor(elapsed: float, cutoff: float):
+    """Weight of a new sample in a first order low-pass filter, elapsed in ms"""
+    tau = 1000 / (2 * math.pi * cutoff)
+    return elapsed / (elapsed + tau)
+
+
+def filter_latency(cutoff: float):
+    """Lag of a first order low-pass filter on a ramp (ms), its time constant"""
+    return 1000 / (2 * math.pi * cutoff)
+
+
+class OneEuroFilter:
+    """Adaptive low-pass filter of the pointer position (Casiez et al., 2012).
+
+    A still hand gets a low cutoff that removes the sensor jitter, a moving
+    hand a cutoff raised with its speed so that it is not lagged behind. The
+    cutoff never goes below what `latency_budget` allows; a budget of 0
+    disables the filter. `latency` is the lag estimate of the last sample.
+    """
+
+    def __init__(
+        self,
+        min_cutoff=SMOOTHING_MIN_CUTOFF,
+        beta=SMOOTHING_BETA,
+        derivative_cutoff=SMOOTHING_DERIVATIVE_CUTOFF,
+        latency_budget=SMOOTHING_LATENCY_BUDGET,
+    ):
+        self.enabled = latency_budget > 0
+        self.min_cutoff = max(min_cutoff, 1000 / (2 * math.pi * latency_budget)) if self.enabled else math.inf
+        self.beta = beta
+        self.derivative_cutoff = derivative_cutoff
+        self.reset()
+
+    def reset(self):
+        self.t = None
+        self.x = self.y = 0.0
+        self.dx = self.dy = 0.0  # px/s
+        self.latency = 0.0
+        self.latency_sum = 0.0
+        self.samples = 0
+
+    def filter(self, t: float, x: float, y: float):
+        if not self.enabled:
+            return x, y
+        if self.t is None or t <= self.t:
+            # First sample, or a duplicate timestamp: nothing to filter against
+            if self.t is None:
+                self.x, self.y = x, y
+            self.t = t
+            return self.x, self.y
+
+        elapsed = t - self.t
+        self.t = t
+        alpha = smoothing_factor(elapsed, self.derivative_cutoff)
+        self.dx += alpha * ((x - self.x) * 1000 / elapsed - self.dx)
+        self.dy += alpha * ((y - self.y) * 1000 / elapsed - self.dy)
+
+        cutoff = self.min_cutoff + self.beta * math.hypot(self.dx, self.dy)
+        alpha = smoothing_factor(elapsed, cutoff)
+        self.x += alpha * (x - self.x)
+        self.y += alpha * (y - self.y)
+
+        self.latency = filter_latency(cutoff)
+        self.latency_sum += self.latency
+        self.samples += 1
+        return self.x, self.y
+
+    def filter_many(self, t, x, y):
+        # The filter is recursive, samples can only go one by one
+        if not self.enabled:
+            return x, y
+        smoothed_x = np.empty(len(t))
+        smoothed_y = np.empty(len(t))
+        for i in range(len(t)):
+            smoothed_x[i], smoothed_y[i] = self.filter(float(t[i]), float(x[i]), float(y[i]))
+        return smoothed_x, smoothed_y
+
+    @property
+    def mean_latency(self):
+        return self.latency_sum / self.samples if self.samples else 0.0
@@ -0,0 +1,116 @@
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from components.style import COFFEE_COLOR
+
+
+def choice_rules(role: str, validated: str):
+    """A card the hand selects, then validates"""
+    return {
+        f'QWidget[role="{role}"]': {
+            "border": f"2px solid {COFFEE_COLOR[2]}",
+            "background-color": "rgba(150, 114, 89, 128)",
+            "border-radius": "5px",
+        },
+        f'QWidget[role="{role}"][state="selected"]': {
+            "border": f"2px solid {COFFEE_COLOR[0]}",
+            "background-color": "rgba(150, 114, 89, 220)",
+        },
+        f'QWidget[role="{role}"][state="validated"]': {
+            "border": f"2px solid {COFFEE_COLOR[0]}",
+            "background-color": validated,
+        },
+    }
+
+
+RULES = {
+    "*": {"border": "0px"},
+    'QLabel[role="title"]': {"color": COFFEE_COLOR[1], "border": "0px", "background-color": "transparent"},
+    'QLabel[role="title"][state="selected"]': {"color": COFFEE_COLOR[0]},
+    **choice_rules("recap", "rgba(219, 193, 172, 128)"),
+    **choice_rules("another", "rgba(219, 193, 172, 64)"),
+    'QWidget[role="sugar"]': {"background-color": "rgba(150, 114, 89, 64)"},
+    'QWidget[role="sugar"][state="default"]': {
+        "border": f"2px solid {COFFEE_COLOR[4]}",
+        "background-color": "rgba(150, 114, 89, 128)",
+        "border-radius": "5px",
+    },
+    'QWidget[role="sugar"][state="selected"]': {
+        "border": f"2px solid {COFFEE_COLOR[1]}",
+        "background-color": "rgba(150, 114, 89, 220)",
+        "border-radius": "5px",
+    },
+    'QWidget[role="sugar-level"]': {"border": "0px", "background-color": COFFEE_COLOR[3]},
+    'QWidget[role="sugar-level"][state="filled"]': {"background-color": COFFEE_COLOR[1]},
+    'QLabel[role="card-title"]': {"border": "2px solid black", "background-color": "rgba(219, 193, 172, 128)"},
+    'QLabel[role="card-title"][state="selected"]': {"background-color": "rgba(219, 193, 172, 255)"},
+}
+
+# Appended to the production rules, they win over them at equal specificity
+DEBUG_RULES = {
+    '[debug_outline="true"], [debug_outline="true"] QWidget': {"border": "2px solid red"},
+    'QLabel[role="card-title"]': {"border": "2px solid red"},
+    'QLabel[role="card-title"][state="selected"]': {"background-color": "transparent"},
+}
+
+
+def compile_sheet(*rule_sets):
+    return "\n".join(
+        f"{selector} {{ {'; '.join(f'{key}: {value}' for key, value in style.items())}; }}"
+        for rules in rule_sets
+        for selector, style in rules.items()
+    )
+
+
+def set_role(widget: QWidget, role: str):
+    """Name the rules a widget follows, before it is first shown"""
+    widget.setProperty("role", role)
+
+
+def set_state(state: str, *widgets: QWidget):
+    """Switch widgets to the rules of another state.
+
+    The sheet is already parsed, flipping the property only polishes the
+    widgets again, and nothing happens when they are in that state already.
+    """
+    for widget in widgets:
+        if widget.property("state") == state:
+            continue
+        widget.setProperty("state", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+
+class Theme:
+    """Stylesheets of every role and state, compiled once per theme.
+
+    The sheet is set on the root of the themed widgets, switching between the
+    production and the debug theme sets it again: one re-polish of the tree.
+    """
+
+    _instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if self._instance is not None:
+            raise ValueError("An instantiation already exists!")
+        self.sheets = {False: compile_sheet(RULES), True: compile_sheet(RULES, DEBUG_RULES)}
+        self.root = None
+        self.debug = False
+
+    def apply(self, root: QWidget, debug: bool = False):
+        self.root = root
+        self.debug = debug
+        root.setStyleSheet(self.sheets[debug])
+
+    def set_debug(self, debug: bool):
+        if self.root is not None and debug != self.debug:
+            self.apply(self.root, debug)
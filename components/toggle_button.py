@@ -2,6 +2,8 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
+from components.frame_scheduler import FrameAnimation
+
 
 class ToggleButton(QCheckBox):
     def __init__(
@@ -24,7 +26,7 @@ class ToggleButton(QCheckBox):
 
         # ANIMATION
         self._circle_position = 3
-        self.animation = QPropertyAnimation(self, b"circle_position", self)
+        self.animation = FrameAnimation(self, b"circle_position", self)
         self.animation.setEasingCurve(animation_curve)
         self.animation.setDuration(500)  # Time in miliseconds
 
@@ -6,8 +6,8 @@ from PySide6.QtWidgets import *
 
 from config import BASIC_FONT, TOP_BAR_SPEED
 from components.utils import custom_font, get_app_dimensions, Debug
-from components.parameters import GlobalParameters
 from components.assets import resource_path
+from components.frame_scheduler import FrameAnimation
 from components.style import COFFEE_COLOR
 
 
@@ -21,10 +21,12 @@ class TopBarProgress(QWidget):
         self._progress = 0.0
 
     def initAnimation(self):
-        self.animation = QPropertyAnimation(self, b"progress")
+        self.animation = FrameAnimation(self, b"progress")
         self.animation.setEasingCurve(QEasingCurve.InOutQuad)
 
     def setProgress(self, progress, animation_time):
+        if progress == self._progress and self.animation.state() == QAbstractAnimation.Stopped:
+            return
         # Start an animation from the current progress value to the new value
         self.animation.stop()
         self.animation.setDuration(animation_time)  # Duration in milliseconds
@@ -41,12 +43,16 @@ class TopBarProgress(QWidget):
 
     @progress.setter
     def progress(self, value):
-        self._progress = value
-        self.update()  # Trigger a repaint
+        if value != self._progress:
+            self._progress = value
+            self.update(self.bar_rect())  # Only the bar is drawn
+
+    def bar_rect(self):
+        return QRect(0, 0, self.width(), (self.height() + 3) // 4)
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.fillRect(0, 0, self.width(), self.height() / 4, QColor("#ece0d1"))
+        painter.fillRect(self.bar_rect(), QColor("#ece0d1"))
 
         # Draw progress rectangle
         progress_rect = QRect(0, 0, self.width() * self._progress, self.height() / 4)
@@ -63,8 +69,7 @@ class TopBar(QWidget, Debug):
         self.initUI(state)
         self.addLabels()
         self.addProgressBar()
-        if GlobalParameters.getInstance().debug.state:
-            self.apply_debug_style()
+        self.apply_debug_style()
 
     def initParams(self, state):
         self.state = state
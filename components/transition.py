@@ -0,0 +1,171 @@
+import numpy as np
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from components.frame_scheduler import FrameAnimationGroup
+
+
+class Snapshot(QWidget):
+    """Picture of a widget painted over it, at an opacity and offset of its own.
+
+    The widget is rendered without its background into an image cropped to
+    what it draws, again only when it changes place, size or look, or
+    `capture` is called; moving the offset only repaints where the picture
+    was and is. `reach` is the furthest offset, the snapshot covers the
+    widget moved by anything up to it.
+    """
+
+    def __init__(self, target: QWidget, reach: QPoint):
+        super().__init__(target.parentWidget())
+        self.target = target
+        self.reach = QPoint(reach)
+        self.image = None
+        self.origin = QPoint()  # Of the image, in the target
+        self.captured = QRect()  # Geometry of the target when rendered
+        self._opacity = 1.0
+        self._offset = QPoint()
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.hide()
+        target.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.FontChange, QEvent.PaletteChange, QEvent.StyleChange) and self.isVisible():
+            self.capture()
+        return super().eventFilter(obj, event)
+
+    def capture(self):
+        """Render the target as it is now, and cover it"""
+        rect = self.captured = self.target.geometry()
+        self.update()
+        self.setGeometry(rect | rect.translated(self.reach))
+        ratio = self.target.devicePixelRatioF()
+        image = QImage(rect.size() * ratio, QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+        self.target.render(image, QPoint(), QRegion(), QWidget.DrawChildren)
+        drawn = opaque_rect(image)
+        self.image = image.copy(drawn) if drawn.isValid() else None
+        self.origin = (QPointF(drawn.topLeft()) / ratio).toPoint()
+        self.raise_()
+        self.update()
+
+    def follow(self):
+        # A hidden target gets its move and resize events only once shown
+        if self.target.geometry() != self.captured:
+            self.capture()
+
+    def picture_rect(self):
+        if self.image is None:
+            return QRect()
+        position = self.target.pos() - self.pos() + self.origin + self._offset
+        return QRect(position, self.image.deviceIndependentSize().toSize())
+
+    def get_opacity(self):
+        return self._opacity
+
+    def set_opacity(self, opacity: float):
+        if opacity != self._opacity:
+            self.follow()
+            self._opacity = opacity
+            self.update(self.picture_rect())
+
+    opacity = Property(float, get_opacity, set_opacity)
+
+    def get_offset(self):
+        return QPoint(self._offset)
+
+    def set_offset(self, offset: QPoint):
+        if offset != self._offset:
+            self.follow()
+            self.update(self.picture_rect())
+            self._offset = QPoint(offset)
+            self.update(self.picture_rect())
+
+    offset = Property(QPoint, get_offset, set_offset)
+
+    def hideEvent(self, event):
+        # Grabbed again on the next frame it is shown in
+        self.image = None
+        self.captured = QRect()
+
+    def paintEvent(self, event):
+        if self.image is None or not self._opacity:
+            return
+        painter = QPainter(self)
+        painter.setOpacity(self._opacity)
+        painter.drawImage(self.picture_rect().topLeft(), self.image)
+
+
+def opaque_rect(image: QImage):
+    """Smallest rectangle of `image`, in pixels, holding all that is not transparent"""
+    rows = np.frombuffer(image.constBits(), np.uint32).reshape(image.height(), image.bytesPerLine() // 4)
+    drawn = rows[:, : image.width()] >> 24 != 0
+    ys = np.flatnonzero(drawn.any(axis=1))
+    if not len(ys):
+        return QRect()
+    xs = np.flatnonzero(drawn.any(axis=0))
+    return QRect(QPoint(int(xs[0]), int(ys[0])), QPoint(int(xs[-1]), int(ys[-1])))
+
+
+class FadeSlide(QObject):
+    """Fade a widget in or out while sliding it by a distance.
+
+    While it runs, a snapshot of the target stands in for it: the target is
+    rendered when the transition starts, and again only if it changes place,
+    size or look, and each frame composites that picture at the opacity and
+    translation of the moment. Nothing is rendered offscreen nor moved in the
+    layout; the target keeps its place hidden, and shows again once faded in.
+    The target needs a parent widget.
+    """
+
+    faded_in = Signal()
+    faded_out = Signal()
+
+    def __init__(self, target: QWidget, distance: QPoint, duration: int):
+        super().__init__(target)
+        self.target = target
+        self.distance = QPoint(distance)
+        self.fading_in = False
+        self.snapshot = Snapshot(target, distance)
+        policy = target.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        target.setSizePolicy(policy)
+
+        self.group = FrameAnimationGroup(self)
+        self.opacity_animation = QPropertyAnimation(self.snapshot, b"opacity")
+        self.offset_animation = QPropertyAnimation(self.snapshot, b"offset")
+        for animation in (self.opacity_animation, self.offset_animation):
+            animation.setDuration(duration)
+            self.group.addAnimation(animation)
+        self.group.finished.connect(self.on_finished)
+
+    def fade_in(self):
+        """Start from the distance, transparent, and come to rest opaque"""
+        self.start(True, 0.0, 1.0, self.distance, QPoint(), QEasingCurve.OutQuad)
+
+    def fade_out(self):
+        self.start(False, 1.0, 0.0, QPoint(), self.distance, QEasingCurve.InQuad)
+
+    def start(self, fading_in: bool, opacity_from, opacity_to, offset_from, offset_to, easing):
+        self.group.stop()
+        self.fading_in = fading_in
+        self.opacity_animation.setStartValue(opacity_from)
+        self.opacity_animation.setEndValue(opacity_to)
+        self.offset_animation.setStartValue(offset_from)
+        self.offset_animation.setEndValue(offset_to)
+        self.offset_animation.setEasingCurve(easing)
+        self.snapshot.show()
+        self.snapshot.capture()
+        self.snapshot.set_opacity(opacity_from)
+        self.snapshot.set_offset(offset_from)
+        self.target.hide()
+        self.group.start()
+
+    def on_finished(self):
+        self.snapshot.hide()
+        if self.fading_in:
+            self.target.show()
+            self.faded_in.emit()
+        else:
+            self.faded_out.emit()
@@ -1,4 +1,5 @@
 import sys
+import time
 from collections import namedtuple
 from dataclasses import dataclass, field
 
@@ -16,6 +17,11 @@ def findMainWindow(widget: QWidget):
         widget = widget.parent()
 
 
+def now_ms():
+    """Monotonic time in ms, shared by every input source"""
+    return time.perf_counter_ns() / 1e6
+
+
 Dimensions = namedtuple("Dimensions", ["width", "height"])
 
 
@@ -31,7 +37,8 @@ def get_app_dimensions(widget: QWidget):
 
 class Debug:
     def apply_debug_style(self):
-            self.setStyleSheet("border: 2px solid red;")  # Example debug style
+        # Outlined in red by the debug theme
+        self.setProperty("debug_outline", True)
 
 
 # font_id = QFontDatabase.addApplicationFont(
@@ -3,21 +3,36 @@ from PySide6.QtGui import *
 from PySide6.QtMultimedia import *
 from PySide6.QtWidgets import *
 
+from config import VALIDATION_TIME
+
 from components.style import COFFEE_COLOR
 from components.assets import resource_path
-
-VALIDATION_TIME = 200
+from components.dwell import DwellCommit
+from components.frame_scheduler import FrameAnimation
+from components.latency import LatencyMonitor
+from components.painted import PaintedLabel
+from components.pointer import PointerInput
 
 
 class ValidateBottomZone(QWidget):
+    """Zone at the bottom of a scene, validates when the hand is held in it.
+
+    Created once per scene and checked against the pointer every frame, the
+    dwell is shorter when the hand came in with a clear downward move.
+    """
+
     validate_signal = Signal()
 
     def __init__(self):
         super().__init__()
+        self._fill = QColor(Qt.transparent)
+        self.border_top = False
+        self.pointer = PointerInput.getInstance()
+        self.dwell = DwellCommit()
         self.init_font()
         self.init_ui()
         self.setupAnimation()
-        self.elapsedTimer = QElapsedTimer()
+        self.pointer.add_frame_handler(self.on_frame)
 
     def init_font(self):
         self.font_db = QFontDatabase()
@@ -33,7 +48,7 @@ class ValidateBottomZone(QWidget):
         self.container = QWidget()
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.setContentsMargins(0, 0, 0, 0)
-        self.label = QLabel("↓ Go down to validate ↓")
+        self.label = PaintedLabel("↓ Go down to validate ↓", QColor(COFFEE_COLOR[0]))
         self.font = QFont(self.font_family, 48)
         self.label.setFont(self.font)
         self.label.setContentsMargins(0, 0, 0, 0)
@@ -45,74 +60,99 @@ class ValidateBottomZone(QWidget):
         self.main_layout.addWidget(self.container)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
 
+        self.container.setStyleSheet("border: 0px; background-color: transparent;")
         self.set_default_style()
 
     def setupAnimation(self):
         self._textAlpha = 255
-        self.animation = QPropertyAnimation(self, b"bgColor")
+        self.animation = FrameAnimation(self, b"bgColor")
         self.animation.setDuration(VALIDATION_TIME)  # Duration in milliseconds
         self.animation.setStartValue(QColor(99, 72, 50, 128))
         self.animation.setEndValue(QColor(219, 193, 172, 255))  # Lighter color
-        self.animation.finished.connect(self.on_animation_finished)
 
-        self.glowing_animation = QPropertyAnimation(self, b"textAlpha")
+        self.glowing_animation = FrameAnimation(self, b"textAlpha")
         self.glowing_animation.setStartValue(255)  # Start from opaque
         self.glowing_animation.setEndValue(-255)  # End at semi-transparent
         self.glowing_animation.setDuration(2000)  # Duration in milliseconds
         self.glowing_animation.finished.connect(self.on_glowing_animation_finished)
 
     def set_default_style(self):
-        self.label.setStyleSheet(
-            f"border: 0px; background-color: transparent; color: {COFFEE_COLOR[0]};"
-        )
-        self.container.setStyleSheet(
-          f"border: 0px; background-color: transparent;"
-        )
+        self.label.set_color(QColor(COFFEE_COLOR[0]))
+        self.border_top = False
+        self._set_bg_color(QColor(Qt.transparent))
 
     def set_debug_style(self):
-        self.label.setStyleSheet(
-            f"border: 0px; background-color: transparent; color: {COFFEE_COLOR[0]};"
-        )
+        self.label.set_color(QColor(COFFEE_COLOR[0]))
         self.container.setStyleSheet(
             "border: 3px solid red; background-color: rgba(99, 72, 50, 128);"
         )
 
     def _set_bg_color(self, color):
-        style = f"background-color: rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha()});"
-        self.container.setStyleSheet(style)
+        if color != self._fill:
+            self._fill = QColor(color)
+            self.update()
 
     def _get_bg_color(self):
-        return self.container.palette().color(self.container.backgroundRole())
+        return QColor(self._fill)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._fill)
+        if self.border_top:
+            painter.fillRect(0, 0, self.width(), 3, QColor(COFFEE_COLOR[0]))
 
     def on_glowing_animation_finished(self):
-        QTimer.singleShot(500, lambda: self.glowing_animation.start())
+        QTimer.singleShot(500, self.restart_glowing)
+
+    def restart_glowing(self):
+        if self.isVisible() and self.dwell.entered_at is None:
+            self.glowing_animation.start()
 
     @Property(QColor, fset=_set_bg_color, fget=_get_bg_color)
     def bgColor(self):
         return self._get_bg_color()
 
     def showEvent(self, event):
+        self.dwell.reset()
         self.set_default_style()
         self.glowing_animation.start()
 
-    def enterEvent(self, event):
+    def hideEvent(self, event):
+        self.dwell.reset()
+        self.animation.stop()
         self.glowing_animation.stop()
-        self.container.setStyleSheet(
-            "border-top: 3px solid #ece0d1; background-color: rgba(99, 72, 50, 128);"
-        )
-        self.label.setStyleSheet(
-            "border: 0px; background-color: transparent; color: #ece0d1;"
-        )
+
+    def on_frame(self, now: float):
+        if not self.isVisible():
+            return
+        position = self.mapFromGlobal(self.pointer.position)
+        inside = QRectF(self.rect()).contains(position)
+        was_inside = self.dwell.entered_at is not None
+
+        t, x, y = self.pointer.gestures.history(now - self.dwell.params.approach_window)
+        elapsed = self.dwell.update(t, x, y, inside, now)
+        if inside and not was_inside:
+            self.on_enter()
+        elif was_inside and not inside:
+            self.on_leave()
+
+        if elapsed is not None:
+            LatencyMonitor.getInstance().record("commit", elapsed)
+            self.validate_signal.emit()
+
+    def on_enter(self):
+        self.glowing_animation.stop()
+        self.border_top = True
+        self._set_bg_color(QColor(99, 72, 50, 128))
+        self.label.set_color(QColor(COFFEE_COLOR[0]))
+        self.animation.setDuration(round(self.dwell.delay))
         self.animation.start()
 
-    def leaveEvent(self, event):
+    def on_leave(self):
         self.animation.stop()
         self.glowing_animation.start()
         self.set_default_style()
 
-    def on_animation_finished(self):
-        self.parent().validate_card()      
-
     @Property(int)
     def textAlpha(self):
         return self._textAlpha
@@ -120,4 +160,4 @@ class ValidateBottomZone(QWidget):
     @textAlpha.setter
     def textAlpha(self, alpha):
         self._textAlpha = abs(alpha)
-        self.label.setStyleSheet(f"color: rgba(219, 193, 172, {abs(alpha)});")
+        self.label.set_color(QColor(219, 193, 172, abs(alpha)))
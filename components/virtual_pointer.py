@@ -0,0 +1,50 @@
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+from shiboken6 import isValid
+
+
+class VirtualPointer:
+    """Deliver sensor positions to the widgets without moving the OS cursor.
+
+    Enter/leave and move events are sent to the widget under the position,
+    exactly as Qt would for a real mouse, so scenes don't need to know where
+    the pointer comes from.
+    """
+
+    def __init__(self, window: QWidget):
+        self.window = window
+        self.hovered = []  # Widgets under the pointer, innermost first
+        self.position = QPointF()
+
+    def move_to(self, global_pos: QPointF):
+        self.position = global_pos
+        widget = QApplication.widgetAt(global_pos.toPoint())
+
+        chain = []
+        while widget is not None:
+            chain.append(widget)
+            widget = widget.parentWidget()
+
+        for widget in self.hovered:
+            if widget not in chain and isValid(widget):
+                QApplication.sendEvent(widget, QEvent(QEvent.Leave))
+        for widget in reversed(chain):
+            if widget not in self.hovered:
+                local = widget.mapFromGlobal(global_pos)
+                QApplication.sendEvent(widget, QEnterEvent(local, local, global_pos))
+        self.hovered = chain
+
+        if chain:
+            local = chain[0].mapFromGlobal(global_pos)
+            event = QMouseEvent(
+                QEvent.MouseMove, local, global_pos, Qt.NoButton, Qt.NoButton, Qt.NoModifier
+            )
+            QApplication.sendEvent(chain[0], event)
+
+    def reset(self):
+        # Leave everything, the next sample enters the widgets again
+        for widget in self.hovered:
+            if isValid(widget):
+                QApplication.sendEvent(widget, QEvent(QEvent.Leave))
+        self.hovered = []
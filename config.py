@@ -4,11 +4,75 @@ BASIC_FONT = "Arial"
 
 # Behavior
 CURSOR_HIDDEN = True
-QUICK_MOVE_TRESHOLD = 50  # ms
 SUGAR_BAR_RESOLUTION = 8
 IDLE_TIMER = 8000  # ms
+SCENE_IDLE_TIMERS = {"PAYMENT": 15000, "PREPARATION": None}  # ms, None never goes idle
+SWIPE_IDLE_TIMER = 15000  # ms, after a carousel swipe
+PRESENCE_CHECK_INTERVAL = 250  # ms
 PAYMENT_TIMER = 5000  # ms
+HOVER_HYSTERESIS = 24  # px, the selection only changes this far past its border
+
+# Gestures
+GESTURE_WINDOW = 200  # ms, a swipe or a flick must be done within this time
+SWIPE_DISTANCE = 150  # px
+FLICK_DISTANCE = 100  # px
+DWELL_TIME = 600  # ms
+DWELL_RADIUS = 20  # px
+GESTURE_COOLDOWN = 500  # ms, no new swipe or flick right after one
+GESTURE_HISTORY = 1024  # samples kept for detection
+
+# Validation
+VALIDATION_TIME = 200  # ms the hand stays in the bottom zone to validate
+VALIDATION_EARLY_TIME = 100  # ms, after a fast and straight downward move
+VALIDATION_APPROACH_WINDOW = 150  # ms of movement before the zone that are judged
+VALIDATION_COMMIT_SPEED = 1200  # px/s, downward speed for the shortest dwell
+VALIDATION_STRAIGHTNESS = 0.8  # share of the approach move that must go down
+
+# Smoothing
+SMOOTHING_MIN_CUTOFF = 1.0  # Hz, cutoff for a still hand, lower removes more jitter
+SMOOTHING_BETA = 0.05  # Hz of cutoff added per px/s of hand speed
+SMOOTHING_DERIVATIVE_CUTOFF = 10.0  # Hz, for the speed estimate
+SMOOTHING_LATENCY_BUDGET = 30  # ms, most lag allowed, 0 disables smoothing
 
 # Animation
 TOP_BAR_SPEED = 1500  # ms
 ANIMATION_SPEED = 200  # ms
+
+# Carousel scrolling
+SCROLL_MIN_SPEED = 300  # px/s, with the hand just inside a scrolling edge
+SCROLL_MAX_SPEED = 1000  # px/s, with the hand on the border of the screen
+SCROLL_ACCELERATION = 4000  # px/s², to reach, change or leave the scrolling speed
+SCROLL_SNAP_TIME = 50  # ms, time constant of the spring settling the cards in place
+SCROLL_MAX_STEP = 50  # ms, longest time advanced in one frame, after a stall
+
+# Images
+IMAGE_CACHE_BUDGET = 64 * 1024 * 1024  # bytes of pre-scaled pixmaps kept in memory
+ASSET_LOADER_THREADS = 2  # threads decoding images off the GUI thread
+SPRITE_CACHE_BUDGET = 32 * 1024 * 1024  # bytes of decoded animation frames kept in memory
+
+# Recording
+RECORD_FILE_SIZE = 4 * 1024 * 1024  # bytes per input log file
+RECORD_MAX_FILES = 16  # older input logs are deleted
+
+# Sensor
+SENSOR_RING_SIZE = 4096  # samples, about 4 s at 1 kHz
+FRAME_INTERVAL = 16  # ms
+FRAME_BUDGET = 12  # ms of work per frame, a frame over it is late
+SENSOR_OVERLAP = 0.1  # share of the screen width seen by two neighbouring bars
+CLOCK_SYNC_WINDOW = 2000  # ms of arrivals used to estimate the clock offset of a bar
+
+# Fusion
+FUSION_RATE = 1000  # merged samples per second
+FUSION_DELAY = 10  # ms the merged stream waits for the slower bars
+FUSION_STALE_AGE = 30  # ms, older samples of a bar are dropped
+FUSION_EDGE = 0.1  # share of a field near its edges where its bar is trusted less
+FUSION_INTERVAL = 4  # ms between merges
+
+# Latency
+LATENCY_HISTORY = 1000  # last measures kept per scene
+
+# Calibration
+CALIBRATION_FILE = "calibration.npz"
+CALIBRATION_GRID = 256  # cells per side of the sensor to screen lookup table
+CALIBRATION_HOLD = 1000  # ms the hand must stay on a target
+CALIBRATION_TOLERANCE = 400  # sensor units the hand may wander while held
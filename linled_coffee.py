@@ -11,12 +11,21 @@ from main_window import MainWindow, MouseGlobalEventFilter
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Start the application.")
     parser.add_argument("--debug", default=False, action="store_true", help="Enable debug mode")
+    parser.add_argument(
+        "--sensor",
+        dest="sensors",
+        action="append",
+        default=[],
+        help="Read a LinLED bar instead of the mouse: serial:PORT[:BAUD], udp:[HOST:]PORT, pty:PATH or "
+        "sim[:RATE[:COUNT]]. Repeat for bars side by side, from left to right",
+    )
+    parser.add_argument("--record", default=None, metavar="DIRECTORY", help="Record every input to this directory")
     args = parser.parse_args()
 
     app = QApplication(sys.argv)
 
     debug_mode = args.debug
-    main_window = MainWindow(debug=debug_mode)
+    main_window = MainWindow(debug=debug_mode, sensor_sources=args.sensors, record_directory=args.record)
 
     filter = MouseGlobalEventFilter(main_window)
 
@@ -3,7 +3,11 @@ from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 from PySide6.QtMultimedia import QSoundEffect
 
-from config import IDLE_TIMER
+import time
+
+import numpy as np
+
+from config import SENSOR_RING_SIZE, SENSOR_OVERLAP, CALIBRATION_FILE
 
 from scenes.options import OptionsScene
 from scenes.idle import IdleScene
@@ -12,36 +16,66 @@ from scenes.sugar_selection import SugarSelectionScene
 from scenes.recap import RecapScene
 from scenes.payment import PaymentScene
 from scenes.preparation import PreparationScene
+from scenes.calibration import CalibrationScene
 
 from components.scenes import Scenes
 from components.selection import CoffeeType, Selection
 from components.top_bar import TopBar
-from components.assets import wood_bg, resource_path
+from components.asset_pack import open_pack
+from components.assets import logo_path, resource_path, LOGO_HEIGHT
+from components.asset_loader import AssetLoader, load_label
+from components.frame_scheduler import FrameScheduler
+from components.image_cache import ImageCache
 from components.parameters import GlobalParameters
+from components.latency import LatencyMonitor, LatencyOverlay
+from components.pointer import PointerInput
+from components.presence import PresenceManager
+from components.recorder import InputRecorder
+from components.theme import Theme
+from components.virtual_pointer import VirtualPointer
+
+from sensor.calibration import CalibrationTable, load_calibration
+from sensor.fusion import FusionWorker
+from sensor.mapping import LinearMapping, strip_mappings
+from sensor.protocol import FLAG_PRESENCE
+from sensor.reader import SensorReader
+from sensor.ring_buffer import SampleRingBuffer
+from sensor.sources import expand_sources
 
 
 class MouseGlobalEventFilter(QObject):
     def __init__(self, window):
         super().__init__()
         self.window = window
+        self.pointer = PointerInput.getInstance()
 
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.MouseMove:
-            self.window.mouseMoveEvent(event)
+        # Moves sent by the virtual pointer are already fed by the sensor
+        if event.type() == QEvent.MouseMove and event.spontaneous():
+            self.pointer.feed_event(event)
+        elif event.type() in (QEvent.KeyPress, QEvent.KeyRelease) and event.spontaneous():
+            if self.pointer.recorder is not None:
+                self.pointer.recorder.record_key_event(self.pointer.clock(), event)
         return super().eventFilter(obj, event)
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, debug: bool):
+    def __init__(self, debug: bool, sensor_sources=(), record_directory: str = None):
         self.debug = debug
+        self.sensor_sources = list(sensor_sources)
+        self.record_directory = record_directory
         super().__init__()
         self.initializing = True
         self.init_global_parameters()
+        self.init_assets()
         self.init_scenes()
         self.init_timers()
         self.init_sounds()
         self.init_ui()
         self.init_selections()
+        self.init_pointer()
+        self.init_sensor()
+        self.init_latency()
         self.show()
         self.setMouseTracking(True)  # Enable mouse tracking
         self.reset_cursor_position()
@@ -57,6 +91,20 @@ class MainWindow(QMainWindow):
         self.params.addParameter("debug", False, "Debug mode")
         self.on_idle = True
 
+    def init_assets(self):
+        # Images pre-scaled for this screen by tools/build_assets.py, if it was run
+        screen = QApplication.primaryScreen().geometry()
+        ImageCache.getInstance().pack = open_pack(screen.width(), screen.height())
+        # Images are decoded off the GUI thread, widgets show a blank until theirs arrives
+        self.asset_loader = AssetLoader.getInstance()
+        self.started = time.perf_counter()
+        if self.debug:
+            self.asset_loader.finished.connect(self.on_assets_loaded)
+
+    def on_assets_loaded(self):
+        elapsed = 1000 * (time.perf_counter() - self.started)
+        print(f"{self.asset_loader.done} images decoded {elapsed:.0f} ms after startup")
+
     def init_scenes(self):
         self.options_scene = OptionsScene(self.params)
         self.idle_scene = IdleScene()
@@ -82,19 +130,16 @@ class MainWindow(QMainWindow):
 
         self.main_scene.layout = QVBoxLayout(self.main_scene)
         self.main_scene.layout.setContentsMargins(0, 0, 0, 0)
-        self.main_scene.setStyleSheet("border: 0px;")
+        Theme.getInstance().apply(self.main_scene, self.params.debug.state)
 
         self.top_bar_container = QWidget()
         self.top_bar_layout = QHBoxLayout(self.top_bar_container)
 
         # Logo on left top
-        top_bar_height = QApplication.primaryScreen().geometry().height() * 0.15
+        screen = QApplication.primaryScreen().geometry()
+        top_bar_height = int(screen.height() * LOGO_HEIGHT)
         self.image_label = QLabel()
-        self.pixmap = QPixmap(resource_path("assets/linled_logo.png"))
-        self.scaled_pixmap = self.pixmap.scaledToHeight(
-            top_bar_height, Qt.SmoothTransformation
-        )
-        self.image_label.setPixmap(self.scaled_pixmap)
+        load_label(self.image_label, logo_path, QSize(screen.width(), top_bar_height), 1.0, Qt.KeepAspectRatio)
         self.top_bar_layout.addWidget(self.image_label, 1)
         self.top_bar_layout.addSpacing(10)
 
@@ -114,6 +159,11 @@ class MainWindow(QMainWindow):
         self.main_stack.addWidget(self.idle_scene)
         self.main_stack.addWidget(self.main_scene)
 
+        self.calibration_scene = CalibrationScene()
+        self.calibration_scene.calibrated.connect(self.on_calibrated)
+        self.calibration_scene.cancelled.connect(self.close_calibration)
+        self.main_stack.addWidget(self.calibration_scene)
+
     def init_sounds(self):
         self.validation_sound = QSoundEffect()
         self.validation_sound.setSource(
@@ -140,13 +190,7 @@ class MainWindow(QMainWindow):
         # Make the window frameless and fullscreen
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.showFullScreen()
-        self.background = QPixmap(wood_bg)
-
-        # Create a label and set its size to fill the window
-        self.background_label = QLabel(self)
         self.font = QFont("Arial", 16)
-        self.background_label.setGeometry(0, 0, 800, 600)
-        self.background_label.setScaledContents(True)
 
         # Example: Switch to scene two
         self.sub_stack.setCurrentIndex(Scenes.COFFEE.value)
@@ -158,9 +202,123 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.main_stack)
 
     def init_timers(self):
-        self.idle_timer = QTimer(self)
-        self.idle_timer.timeout.connect(self.onIdle)
-        self.idle_timer.start(IDLE_TIMER)
+        self.presence = PresenceManager()
+        self.presence.went_idle.connect(self.onIdle)
+        self.presence.presence_changed.connect(self.on_presence_changed)
+
+    def init_pointer(self):
+        self.pointer = PointerInput.getInstance()
+        self.pointer.add_move_handler(self.on_pointer_moved)
+        self.virtual_pointer = None
+        if self.record_directory is not None:
+            self.pointer.recorder = InputRecorder(self.record_directory, (self.width, self.height))
+
+        # Input is handled once per frame, however many events came in, before the animations
+        self.scheduler = FrameScheduler.getInstance()
+        self.scheduler.warn = self.debug
+        self.scheduler.add_handler(self.on_frame)
+
+    def init_sensor(self):
+        self.sensors = []
+        self.fusion = None
+        self.simulators = []
+        if not self.sensor_sources:
+            return
+        try:
+            specs, self.simulators = expand_sources(self.sensor_sources)
+        except (OSError, ValueError) as error:
+            print(f"Cannot start the sensors: {error}")
+            return
+
+        self.sensor_ring = SampleRingBuffer(SENSOR_RING_SIZE)
+        if len(specs) == 1:
+            mapping = load_calibration(CALIBRATION_FILE, (self.width, self.height))
+            if mapping is None:
+                mapping = LinearMapping(self.width, self.height)
+            self.sensors.append(SensorReader(specs[0], self.sensor_ring, mapping))
+        else:
+            # Bars side by side, each one sees a strip of the screen and the
+            # fusion thread merges them into the ring the frame drains
+            mappings = strip_mappings(len(specs), self.width, self.height, SENSOR_OVERLAP)
+            rings = [SampleRingBuffer(SENSOR_RING_SIZE) for _ in specs]
+            for spec, ring, mapping in zip(specs, rings, mappings):
+                self.sensors.append(SensorReader(spec, ring, mapping))
+            self.fusion = FusionWorker(rings, self.sensor_ring)
+
+        self.use_virtual_pointer()
+        for sensor in self.sensors:
+            sensor.error.connect(print)
+            sensor.start()
+        if self.fusion is not None:
+            self.fusion.start()
+
+    def init_latency(self):
+        self.latency = LatencyMonitor.getInstance()
+        self.latency_overlay = LatencyOverlay(self, self.debug)
+
+    def dump_latency(self):
+        path = self.latency.dump(sensor=" + ".join(self.sensor_sources) or "mouse")
+        print(f"Latency histograms written to {path}")
+
+    def use_virtual_pointer(self):
+        # Positions that don't come from the OS cursor still need to reach widgets
+        self.virtual_pointer = VirtualPointer(self)
+        self.pointer.add_move_handler(self.virtual_pointer.move_to)
+
+    def on_frame(self, now: float):
+        if self.sensors:
+            samples = self.sensor_ring.drain()
+            if self.calibration_scene.isVisible():
+                # The positions are being calibrated, they can't drive the app
+                self.calibration_scene.feed_raw(samples)
+            else:
+                if len(samples):
+                    self.presence.set_presence(bool(samples["flags"][-1] & FLAG_PRESENCE))
+                # Without a hand the positions are meaningless
+                samples = samples[(samples["flags"] & FLAG_PRESENCE) != 0]
+                self.pointer.feed_many(samples["t"], samples["x"], samples["y"])
+        self.pointer.flush()
+
+    def open_calibration(self):
+        if len(self.sensors) != 1:
+            print("Calibration needs a single sensor, start with one --sensor")
+            return
+        self.presence.pause()
+        self.on_idle = False
+        self.main_stack.setCurrentWidget(self.calibration_scene)
+
+    def close_calibration(self):
+        self.main_stack.setCurrentIndex(2)
+        self.presence.resume()
+
+    def on_calibrated(self, sensor_points, screen_points):
+        try:
+            table = CalibrationTable.fit(sensor_points, screen_points, (self.width, self.height))
+        except (ValueError, np.linalg.LinAlgError) as error:
+            print(f"Calibration failed: {error}")
+        else:
+            table.save(CALIBRATION_FILE)
+            # Picked up by the reader thread from its next batch
+            self.sensors[0].mapping = table
+        self.close_calibration()
+
+    def closeEvent(self, event):
+        self.scheduler.stop()
+        if self.fusion is not None:
+            self.fusion.stop()
+        for sensor in self.sensors:
+            sensor.stop()
+        for simulator in self.simulators:
+            simulator.close()
+        if self.pointer.recorder is not None:
+            self.pointer.recorder.close()
+        if self.debug:
+            print(f"Pointer: {self.pointer.stats()}")
+            print(f"Images: {ImageCache.getInstance().stats()}")
+            print(f"Frames: {self.scheduler.stats()}")
+            print(f"Carousel scroll: {self.coffee_selection_scene.carrousel.scroller.stats()}")
+            self.dump_latency()
+        super().closeEvent(event)
 
     def init_selections(self):
         self.selections = []
@@ -179,40 +337,52 @@ class MainWindow(QMainWindow):
         self.selections = []
         self.set_scene(Scenes.COFFEE)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.drawPixmap(self.rect(), self.background)
-
-    def mouseMoveEvent(self, event: QMouseEvent):
+    def on_pointer_moved(self, position: QPointF):
         if self.on_idle:
             self.exitIdle()
-        else:
-            self.idle_timer.start(IDLE_TIMER)
+        self.presence.activity()
+
+    def on_presence_changed(self, present: bool):
+        if present and self.on_idle:
+            self.exitIdle()
 
     def keyPressEvent(self, event: QKeyEvent):
         match event.key():
             case Qt.Key_O:
                 if self.main_stack.currentIndex() != 0:
                     self.main_stack.setCurrentIndex(0)
-                    self.idle_timer.stop()
+                    self.presence.pause()
                     if self.on_idle:
                         self.on_idle = False
                 else:
-                    self.idle_timer.start(IDLE_TIMER)
+                    self.presence.resume()
                     self.main_stack.setCurrentIndex(2)
                 return
+            case Qt.Key_L:
+                self.dump_latency()
+                return
+            case Qt.Key_C:
+                if self.main_stack.currentWidget() is self.calibration_scene:
+                    self.close_calibration()
+                else:
+                    self.open_calibration()
+                return
 
     def set_scene(self, scene: Scenes):
         self.top_bar.set_state(scene.value)
         QTimer.singleShot(1500, lambda: self.sub_stack.setCurrentIndex(scene.value))
-        QTimer.singleShot(1500, lambda: self.idle_timer.start(IDLE_TIMER))
+        QTimer.singleShot(1500, lambda: self.presence.set_scene(scene))
         if not self.initializing:
             QTimer.singleShot(1500, lambda: self.reset_cursor_position())
         else:
             self.initializing = False
 
     def reset_cursor_position(self):
-        QCursor.setPos(self.width / 2, self.height / 2)
+        if self.virtual_pointer is not None:
+            # The hand is the cursor, only forget what it was hovering
+            self.virtual_pointer.reset()
+        else:
+            QCursor.setPos(self.width / 2, self.height / 2)
 
     def validate_selection(self):
         self.selections.append(self.current_selection)
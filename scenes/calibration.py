@@ -0,0 +1,126 @@
+import numpy as np
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import CALIBRATION_HOLD, CALIBRATION_TOLERANCE
+
+from components.style import COFFEE_COLOR
+from sensor.protocol import FLAG_PRESENCE, SENSOR_RANGE
+
+TARGETS = [(0.1, 0.1), (0.5, 0.1), (0.9, 0.1), (0.1, 0.5), (0.5, 0.5), (0.9, 0.5), (0.1, 0.9), (0.5, 0.9), (0.9, 0.9)]
+TARGET_RADIUS = 40
+MIN_TARGET_DISTANCE = SENSOR_RANGE * 0.05  # The hand must leave a target before the next capture
+
+
+class CalibrationScene(QWidget):
+    """Show targets one by one and record the raw sensor position of the hand
+    held on each.
+
+    Raw samples come from `feed_raw`, the mapped pointer is not used since it
+    is what is being calibrated. Space captures the target at once, Escape
+    cancels.
+    """
+
+    calibrated = Signal(list, list)  # Sensor points, matching screen points
+    cancelled = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.font = QFont("Arial", 28)
+        self.restart()
+
+    def restart(self):
+        self.sensor_points = []
+        self.screen_points = []
+        self.held = np.zeros(0, [("t", "f8"), ("u", "f8"), ("v", "f8")])
+        self.progress = 0.0
+
+    def showEvent(self, event):
+        self.restart()
+        self.setFocus()
+
+    def target_position(self):
+        fx, fy = TARGETS[len(self.sensor_points)]
+        return QPointF(fx * self.width(), fy * self.height())
+
+    def feed_raw(self, samples):
+        """Raw sensor samples (ring buffer records) since the previous frame"""
+        samples = samples[(samples["flags"] & FLAG_PRESENCE) != 0]
+        if len(samples) == 0:
+            self.held = self.held[:0]
+            self.progress = 0.0
+            self.update()
+            return
+
+        latest = np.zeros(len(samples), self.held.dtype)
+        latest["t"], latest["u"], latest["v"] = samples["t"], samples["u"], samples["v"]
+        held = np.concatenate([self.held, latest])
+
+        # Only the samples since the hand last moved away count as held
+        u, v = held["u"][-1], held["v"][-1]
+        away = np.flatnonzero(np.maximum(np.abs(held["u"] - u), np.abs(held["v"] - v)) > CALIBRATION_TOLERANCE)
+        if len(away):
+            held = held[away[-1] + 1 :]
+        self.held = held[held["t"] >= held["t"][-1] - CALIBRATION_HOLD]
+
+        self.progress = min(1.0, (self.held["t"][-1] - self.held["t"][0]) / CALIBRATION_HOLD)
+        if self.progress >= 1.0:
+            self.capture()
+        self.update()
+
+    def capture(self):
+        if len(self.held) == 0:
+            return
+        point = (float(np.median(self.held["u"])), float(np.median(self.held["v"])))
+        if self.sensor_points:
+            previous = np.array(self.sensor_points[-1])
+            if np.abs(previous - point).max() < MIN_TARGET_DISTANCE:
+                # Still on the previous target
+                self.held = self.held[:0]
+                self.progress = 0.0
+                return
+        target = self.mapToGlobal(self.target_position())
+        self.sensor_points.append(point)
+        self.screen_points.append((target.x(), target.y()))
+        self.held = self.held[:0]
+        self.progress = 0.0
+
+        if len(self.sensor_points) == len(TARGETS):
+            self.calibrated.emit(self.sensor_points, self.screen_points)
+
+    def keyPressEvent(self, event: QKeyEvent):
+        if event.key() == Qt.Key_Space:
+            self.capture()
+            self.update()
+        elif event.key() == Qt.Key_Escape:
+            self.cancelled.emit()
+        else:
+            super().keyPressEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor(COFFEE_COLOR[4]))
+
+        painter.setPen(QColor(COFFEE_COLOR[0]))
+        painter.setFont(self.font)
+        painter.drawText(
+            self.rect().adjusted(0, 0, 0, -self.height() // 3),
+            Qt.AlignCenter,
+            f"Calibration {len(self.sensor_points) + 1}/{len(TARGETS)}\n"
+            "Hold your hand on the target\n(Space to capture, Escape to cancel)",
+        )
+        if len(self.sensor_points) >= len(TARGETS):
+            return
+
+        center = self.target_position()
+        painter.setPen(QPen(QColor(COFFEE_COLOR[0]), 3))
+        painter.drawEllipse(center, TARGET_RADIUS, TARGET_RADIUS)
+        painter.drawLine(center - QPointF(TARGET_RADIUS, 0), center + QPointF(TARGET_RADIUS, 0))
+        painter.drawLine(center - QPointF(0, TARGET_RADIUS), center + QPointF(0, TARGET_RADIUS))
+        if self.progress > 0:
+            painter.setPen(QPen(QColor(COFFEE_COLOR[1]), 8))
+            arc = QRectF(center.x() - TARGET_RADIUS, center.y() - TARGET_RADIUS, 2 * TARGET_RADIUS, 2 * TARGET_RADIUS)
+            painter.drawArc(arc, 90 * 16, -int(self.progress * 360 * 16))
@@ -2,7 +2,9 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
+from components.frame_scheduler import FrameAnimation
 from components.my_widget import MyWidget
+from components.painted import PaintedLabel
 
 
 class IdleScene(MyWidget):
@@ -14,8 +16,10 @@ class IdleScene(MyWidget):
 
     def initUI(self):
         layout = QVBoxLayout(self)
-        self.title = QLabel("LINLED COFFEE MACHINE\nFor demonstration purpose only\n\nBring your hand to interact")
-        self.title.setStyleSheet("color: rgba(219, 193, 172, 255);")
+        self.title = PaintedLabel(
+            "LINLED COFFEE MACHINE\nFor demonstration purpose only\n\nBring your hand to interact",
+            QColor(219, 193, 172),
+        )
         self.title.setMouseTracking(True)
 
         self.font = QFont("Arial", 72)
@@ -27,7 +31,7 @@ class IdleScene(MyWidget):
         layout.addWidget(self.title)
 
         # Create the animation
-        self.animation = QPropertyAnimation(self, b"textAlpha")
+        self.animation = FrameAnimation(self, b"textAlpha")
         self.animation.setDuration(4000)  # Duration in milliseconds
         self.animation.setStartValue(255)  # Start from opaque
         self.animation.setEndValue(-255)  # End at semi-transparent
@@ -43,13 +47,10 @@ class IdleScene(MyWidget):
     @textAlpha.setter
     def textAlpha(self, alpha):
         self._textAlpha = abs(alpha)
-        self.title.setStyleSheet(f"color: rgba(219, 193, 172, {abs(alpha)});")
+        self.title.set_alpha(abs(alpha))
 
     def reverseAnimationDirection(self):
         if self.animation.direction() == QAbstractAnimation.Forward:
             self.animation.setDirection(QAbstractAnimation.Backward)
         else:
             self.animation.setDirection(QAbstractAnimation.Forward)
-
-    def mouseMoveEvent(self, event: QMouseEvent):
-        self.main_window.mouseMoveEvent(event)
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QVBoxLayout, Q
 
 from components.toggle_button import ToggleButton
 from components.parameters import GlobalParameters, Parameter
+from components.theme import Theme
 
 from config import CURSOR_HIDDEN
 
@@ -73,5 +74,6 @@ class OptionsScene(QWidget):
         QApplication.restoreOverrideCursor()  # Show cursor
 
     def hideEvent(self, event):
+        Theme.getInstance().set_debug(self.global_parameters.debug.state)
         if self.global_parameters.cursor_hidden.state:
             QApplication.setOverrideCursor(Qt.BlankCursor)  # Hide cursor
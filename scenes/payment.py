@@ -2,8 +2,9 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
-from components.assets import resource_path
+from components.assets import resource_path, PAYMENT_CARD_SCALE
 from components.contactless_payment import ContactlessPayment
+from components.asset_loader import load_label
 from components.scenes import Scenes
 from components.style import COFFEE_COLOR
 from components.utils import findMainWindow
@@ -41,11 +42,14 @@ class PaymentScene(QWidget):
 
         # PNG
         self.image_label = QLabel()
-        pixmap = QPixmap(resource_path("assets/cb.png"))
-        scaled_pixmap = pixmap.scaled(
-            pixmap.size() * 0.3, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        path = resource_path("assets/cb.png")
+        load_label(
+            self.image_label,
+            path,
+            QImageReader(path).size() * PAYMENT_CARD_SCALE,
+            self.devicePixelRatioF(),
+            Qt.KeepAspectRatio,
         )
-        self.image_label.setPixmap(scaled_pixmap)
         self.image_label.setAlignment(Qt.AlignCenter)  # Centrer l'image si nécessaire
         self.container_layout.addWidget(self.image_label)
         self.container_layout.addSpacing(50)  # Ajustez cette valeur selon vos besoins
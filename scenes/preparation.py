@@ -6,6 +6,9 @@ from components.scenes import Scenes
 from components.loading import ProgressionBar
 from components.utils import findMainWindow
 from components.assets import resource_path
+from components.animated_sprite import AnimatedSprite
+from components.painted import PaintedLabel
+from components.transition import FadeSlide
 
 class FadeInText(QWidget):
     fade_out_finished = Signal()  # Step 1: Add a new signal
@@ -15,9 +18,6 @@ class FadeInText(QWidget):
         self.init_font()
         self.init_ui(text)
         self.setup_animations()
-        self.fade_out_animations_completed = (
-            0  # Counter for completed fade-out animations
-        )
 
     def init_font(self):
         self.font_db = QFontDatabase()
@@ -30,70 +30,29 @@ class FadeInText(QWidget):
             print("Failed to load and register the custom font.")
 
     def init_ui(self, text: str):
-        self.label = QLabel(text, alignment=Qt.AlignCenter)
-        self.label.setStyleSheet("color: #dbc1ac;")
+        self.label = PaintedLabel(text, QColor("#dbc1ac"))
+        self.label.setAlignment(Qt.AlignCenter)
         self.font = QFont(self.font_family, 48)
         self.label.setFont(self.font)
-        self.opacity_effect = QGraphicsOpacityEffect(self.label)
-        self.label.setGraphicsEffect(self.opacity_effect)
         self.layout = QVBoxLayout(self)
         self.layout.addWidget(self.label)
 
-        # Ajouter le widget de GIF ici
-        self.gif_label = QLabel(self)
-        self.movie = QMovie(resource_path("assets/cup.gif"))
-        self.gif_label.setMovie(self.movie)
-        self.layout.addWidget(self.gif_label, 0, Qt.AlignCenter)  # Ajouter le QLabel à la disposition
-        self.movie.start()  # Commencer à jouer le GIF
+        # Ajouter le widget de GIF ici, joué seulement quand la scène est visible
+        self.gif = AnimatedSprite(resource_path("assets/cup.gif"), self)
+        self.layout.addWidget(self.gif, 0, Qt.AlignCenter)
 
     def setup_animations(self):
         """Set up the fade-in and fade-out animations."""
-        # Fade-in animation
-        self.fade_in_opacity_animation = QPropertyAnimation(
-            self.opacity_effect, b"opacity"
-        )
-        self.fade_in_opacity_animation.setDuration(1000)
-        self.fade_in_opacity_animation.setStartValue(0.0)
-        self.fade_in_opacity_animation.setEndValue(1.0)
-
-        self.fade_in_move_animation = QPropertyAnimation(self.label, b"pos")
-        self.fade_in_move_animation.setDuration(1000)
-        self.fade_in_move_animation.setStartValue(QPoint(0, 30))
-        self.fade_in_move_animation.setEndValue(QPoint(0, 0))
-        self.fade_in_move_animation.setEasingCurve(QEasingCurve.OutQuad)
-
-        # Fade-out animation
-        self.fade_out_opacity_animation = QPropertyAnimation(
-            self.opacity_effect, b"opacity"
-        )
-        self.fade_out_opacity_animation.setDuration(1000)
-        self.fade_out_opacity_animation.setStartValue(1.0)
-        self.fade_out_opacity_animation.setEndValue(0.0)
-
-        self.fade_out_move_animation = QPropertyAnimation(self.label, b"pos")
-        self.fade_out_move_animation.setDuration(1000)
-        self.fade_out_move_animation.setStartValue(QPoint(0, 0))
-        self.fade_out_move_animation.setEndValue(QPoint(0, 30))
-        self.fade_out_move_animation.setEasingCurve(QEasingCurve.InQuad)
-        self.fade_out_opacity_animation.finished.connect(self.check_fade_out_finished)
-        self.fade_out_move_animation.finished.connect(self.check_fade_out_finished)
+        self.transition = FadeSlide(self.label, QPoint(0, 30), 1000)
+        self.transition.faded_out.connect(self.fade_out_finished)
 
     def fade_in(self):
         """Start the fade-in animation."""
-        self.fade_in_opacity_animation.start()
-        self.fade_in_move_animation.start()
+        self.transition.fade_in()
 
     def fade_out(self):
         """Start the fade-out animation."""
-        self.fade_out_opacity_animation.start()
-        self.fade_out_move_animation.start()
-
-    def check_fade_out_finished(self):
-        """Check if both fade-out animations have finished."""
-        self.fade_out_animations_completed += 1
-        if self.fade_out_animations_completed == 2:
-            self.fade_out_finished.emit()  # Emit the signal when both animations are finished
-            self.fade_out_animations_completed = 0  # Reset the counter
+        self.transition.fade_out()
 
 
 class PreparationScene(QWidget):
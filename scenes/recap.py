@@ -4,12 +4,18 @@ from PySide6.QtWidgets import *
 
 from config import BASIC_FONT
 
-from components.assets import resource_path
+from components.assets import resource_path, MUGS_SIZE
 from components.carrousel_card import Selection
 from components.contactless_payment import ContactlessPayment
+from components.hit_testing import SelectionModel
+from components.asset_loader import load_label
+from components.latency import LatencyMonitor
 from components.my_widget import MyWidget
+from components.painted import PaintedLabel
+from components.pointer import PointerInput
 from components.scenes import Scenes
 from components.style import COFFEE_COLOR
+from components.theme import set_role, set_state
 from components.utils import findMainWindow
 from components.validate_bottom import ValidateBottomZone
 
@@ -76,8 +82,6 @@ class RecapCard(QWidget):
     def __init__(self):
         super().__init__()
         self._text = "Récapitulatif"
-        self.elapsedTimer = QElapsedTimer()
-        self.quickMoveThreshold = 150  # Threshold for quick movement, adjust as needed
         self.init_font()
         self.initUI()
         self.set_default_style()
@@ -94,12 +98,14 @@ class RecapCard(QWidget):
 
     def initUI(self):
         self.container = QWidget()
+        set_role(self.container, "recap")
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.addSpacing(20)
 
         # Title
-        self.text = QLabel("Your order")
+        self.text = PaintedLabel("Your order", None)
         self.text.setAttribute(Qt.WA_TransparentForMouseEvents)
+        set_role(self.text, "title")
         self.font = QFont(self.font_family, 48)
         self.text.setFont(self.font)
         self.container_layout.addWidget(self.text, 0, Qt.AlignTop | Qt.AlignHCenter)
@@ -140,21 +146,16 @@ class RecapCard(QWidget):
             self.price_label.deleteLater()
             self.price_label = None
 
-    def enterEvent(self, event):
-        self.parent().active = Scenes.PAYMENT
-        super().enterEvent(event)
-        self.select(event)
-
     def mousePressEvent(self, event: QMouseEvent):
         if self.main_window.params.clickable_button.state:
             self.validate_card()
 
-    def select(self, event):
+    def select(self):
         self.main_window.change_sound.play()
+        LatencyMonitor.getInstance().tag(self.container, Scenes.RECAP)
         self.parent().unselectCards()
 
         self.parent().active = Scenes.PAYMENT
-        super().enterEvent(event)
         self.set_selected_style()
 
     def unselect(self):
@@ -166,45 +167,13 @@ class RecapCard(QWidget):
         self.card_validation_signal.emit()
 
     def set_default_style(self):
-        self.container.setStyleSheet(
-            """
-            border: 2px solid #967259;
-            background-color: rgba(150, 114, 89, 128);
-            border-radius: 5px;
-            """
-        )
-        self.text.setStyleSheet(
-            f"""
-            color: {COFFEE_COLOR[1]};
-            border: 0px; 
-            background-color: transparent;
-            """
-        )
+        set_state("default", self.container, self.text)
 
     def set_selected_style(self):
-        self.container.setStyleSheet(
-            """
-            border: 2px solid #ece0d1;
-            background-color: rgba(150, 114, 89, 220);
-            border-radius: 5px;
-            """
-        )
-        self.text.setStyleSheet(
-            f"""
-            color: {COFFEE_COLOR[0]};
-            border: 0px; 
-            background-color: transparent;
-            """
-        )
+        set_state("selected", self.container, self.text)
 
     def set_validated_style(self):
-        self.container.setStyleSheet(
-            """
-            border: 2px solid #ece0d1;
-            background-color: rgba(219,193,172, 128);
-            border-radius: 5px;
-            """
-        )
+        set_state("validated", self.container)
 
 
 class AddAnotherCard(QWidget):
@@ -213,8 +182,6 @@ class AddAnotherCard(QWidget):
     def __init__(self):
         super().__init__()
         self._text = "Add another drink"
-        self.elapsedTimer = QElapsedTimer()
-        self.quickMoveThreshold = 150  # Threshold for quick movement, adjust as needed
         self.init_font()
         self.initUI()
 
@@ -229,24 +196,26 @@ class AddAnotherCard(QWidget):
             print("Failed to load and register the custom font.")
 
     def initUI(self):
-        self.text = QLabel(self._text)
+        self.text = PaintedLabel(self._text, None)
         self.text.setAttribute(Qt.WA_TransparentForMouseEvents)
+        set_role(self.text, "title")
         self.font = QFont(self.font_family, 48)
         self.text.setFont(self.font)
 
         # Création du QLabel pour l'image
         self.imageLabel = QLabel()
-        pixmap = QPixmap(
-            resource_path("assets/mugs.jpg")
-        )  # Remplacez par le chemin de votre image
-        max_width = 500  # Définissez la largeur maximale souhaitée pour l'image
-        pixmap = pixmap.scaled(
-            max_width, max_width, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        load_label(
+            self.imageLabel,
+            resource_path("assets/mugs.jpg"),
+            QSize(MUGS_SIZE, MUGS_SIZE),
+            self.devicePixelRatioF(),
+            Qt.KeepAspectRatio,
         )  # Redimensionnement de l'image
-        self.imageLabel.setPixmap(pixmap)
         self.imageLabel.setAlignment(Qt.AlignCenter)  # Centrez l'image, si nécessaire
+        set_role(self.imageLabel, "another")
 
         self.container = QWidget()
+        set_role(self.container, "another")
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.addSpacing(20)
         self.container_layout.addWidget(self.text, 1, Qt.AlignTop | Qt.AlignHCenter)
@@ -269,15 +238,13 @@ class AddAnotherCard(QWidget):
     def showEvent(self, event):
         self.main_window = findMainWindow(self)
 
-    def enterEvent(self, event):
-        self.select(event)
-
     def mousePressEvent(self, event: QMouseEvent):
         if self.main_window.params.clickable_button.state:
             self.validate_card()
 
-    def select(self, event):
+    def select(self):
         self.main_window.change_sound.play()
+        LatencyMonitor.getInstance().tag(self.container, Scenes.RECAP)
         self.parent().unselectCards()
         self.parent().active = Scenes.COFFEE
         self.set_selected_style()
@@ -289,45 +256,13 @@ class AddAnotherCard(QWidget):
         pass
 
     def set_default_style(self):
-        self.container.setStyleSheet(
-            """
-            border: 2px solid #967259;
-            background-color: rgba(150, 114, 89, 128);
-            border-radius: 5px;
-            """
-        )
-        self.text.setStyleSheet(
-            f"""
-            color: {COFFEE_COLOR[1]};
-            border: 0px; 
-            background-color: transparent;
-            """
-        )
+        set_state("default", self.container, self.imageLabel, self.text)
 
     def set_selected_style(self):
-        self.container.setStyleSheet(
-            """
-            border: 2px solid #ece0d1;
-            background-color: rgba(150, 114, 89, 220);
-            border-radius: 5px;
-            """
-        )
-        self.text.setStyleSheet(
-            f"""
-            color: {COFFEE_COLOR[0]};
-            border: 0px; 
-            background-color: transparent;
-            """
-        )
+        set_state("selected", self.container, self.imageLabel, self.text)
 
     def set_validated_style(self):
-        self.container.setStyleSheet(
-            """
-            border: 2px solid #ece0d1;
-            background-color: rgba(219,193,172, 64);
-            border-radius: 5px;
-            """
-        )
+        set_state("validated", self.container, self.imageLabel)
 
 
 class RecapScene(QWidget):
@@ -336,6 +271,7 @@ class RecapScene(QWidget):
         self.validate_bottom_zone = None
         self.active = None
         self.initUI()
+        PointerInput.getInstance().gestures.flicked_down.connect(self.on_flick_down)
 
     def initUI(self):
         self.layout = QVBoxLayout(self)
@@ -356,10 +292,10 @@ class RecapScene(QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
 
         self.layout.addLayout(self.mid_layout)
+        self.add_bottom_validation()
 
-    def set_default_style(self):
-        self.recap_card.setStyleSheet("border: 2px solid black;")
-        self.another_card.setStyleSheet("border: 2px solid black;")
+        self.selection = SelectionModel(self, [self.recap_card, self.another_card])
+        self.selection.selection_changed.connect(self.on_card_hovered)
 
     def validate_command(self):
         self.main_window = findMainWindow(self)
@@ -370,10 +306,12 @@ class RecapScene(QWidget):
         
     def showEvent(self, event):
         self.main_window = findMainWindow(self)
-        self.add_bottom_validation()
 
     def hideEvent(self, event):
-        self.removeBottomValidation()
+        self.selection.clear()
+
+    def on_card_hovered(self, card):
+        card.select()
 
     def add_bottom_validation(self):
         self.validate_bottom_zone = ValidateBottomZone()
@@ -381,12 +319,6 @@ class RecapScene(QWidget):
         self.validate_bottom_zone.validate_signal.connect(self.validate_card)
         self.layout.addWidget(self.validate_bottom_zone, alignment=Qt.AlignBottom)
 
-    def removeBottomValidation(self):
-        if self.validate_bottom_zone is not None:
-            self.layout.removeWidget(self.validate_bottom_zone)
-            self.validate_bottom_zone.deleteLater()
-            self.validate_bottom_zone = None
-
     def unselectCards(self):
         self.another_card.unselect()
         self.recap_card.unselect()
@@ -397,6 +329,11 @@ class RecapScene(QWidget):
         elif scene == Scenes.PAYMENT:
             self.another_card.unselect()
 
+    def on_flick_down(self):
+        if self.isVisible() and self.main_window.params.movement_validation.state:
+            if self.active is not None:
+                self.validate_card()
+
     def validate_card(self):
         self.main_window.validation_sound.play()
         if self.active == Scenes.PAYMENT:
@@ -5,12 +5,17 @@ from PySide6.QtMultimedia import QSoundEffect
 
 from config import *
 
-from components.assets import resource_path
+from components.assets import resource_path, NO_SUGAR_SIZE
+from components.hit_testing import SelectionModel
+from components.asset_loader import load_label
+from components.latency import LatencyMonitor
+from components.pointer import PointerInput
 from components.scenes import Scenes
 from components.top_bar import TopBar
 from components.utils import findMainWindow
 from components.validate_bottom import ValidateBottomZone
 from components.style import COFFEE_COLOR
+from components.theme import set_role, set_state
 
 MAX_SUGAR = 5
 TITLE_SPACING = 20
@@ -64,28 +69,24 @@ class NoSugarBox(QWidget):
     def loadAssets(self):
         self.image_label = QLabel(self)
         self.image_path = resource_path("assets/no_sugar.png")
-        pixmap = QPixmap(self.image_path)
-        self.image_label.setPixmap(pixmap)
+        load_label(self.image_label, self.image_path, QSize(NO_SUGAR_SIZE, NO_SUGAR_SIZE), self.devicePixelRatioF())
         self.image_label.setScaledContents(True)  # Scale image to fit the label size
 
     def initUI(self):
         self.container = QWidget()
+        set_role(self.container, "sugar")
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.addSpacing(TITLE_SPACING)
 
         self.label = QLabel("No sugar")
         self.label.setFont(QFont(self.font_family, 48))
-        self.label.setStyleSheet(
-            f"border: 2px; color: {COFFEE_COLOR[1]}; background-color: transparent;"
-        )
+        set_role(self.label, "title")
         self.label.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.label.setContentsMargins(0, 0, 0, 0)
         self.container_layout.addWidget(self.label, 1, Qt.AlignTop | Qt.AlignHCenter)
         self.font = QFont("Arial", 32)
 
-        max_width = 150  # Replace with your desired maximum width
-        max_height = 150  # Replace with your desired maximum height
-        self.image_label.setMaximumSize(max_width, max_height)
+        self.image_label.setMaximumSize(NO_SUGAR_SIZE, NO_SUGAR_SIZE)
         self.image_label.setStyleSheet("border: 0px; background-color: transparent;")
 
         self.container_layout.addWidget(
@@ -99,31 +100,18 @@ class NoSugarBox(QWidget):
     def showEvent(self, event):
         self.main_window = findMainWindow(self)
 
-    def enterEvent(self, event):
-        self.parent().unselect_widgets()
-        self.select(event)
-
     def mousePressEvent(self, event: QMouseEvent):
         if self.main_window.params.clickable_button.state:
             self.validate_card()
 
-    def select(self, event):
+    def select(self):
         self.main_window.change_sound.play()
+        LatencyMonitor.getInstance().tag(self.container, Scenes.SUGAR)
         self.sugar_scene.sugar_value = 0
-        self.container.setStyleSheet(
-            f"border: 2px solid {COFFEE_COLOR[1]}; background-color: rgba(150, 114, 89, 220); border-radius: 5px;"
-        )
-        self.label.setStyleSheet(
-            f"color: {COFFEE_COLOR[0]}; border: 0px; background-color: transparent;"
-        )
+        set_state("selected", self.container, self.label)
 
     def unselect(self):
-        self.container.setStyleSheet(
-            f"border: 2px solid {COFFEE_COLOR[4]}; background-color: rgba(150, 114, 89, 128);border-radius: 5px;"
-        )
-        self.label.setStyleSheet(
-            f"color: {COFFEE_COLOR[1]};border: 0px; background-color: transparent;"
-        )
+        set_state("default", self.container, self.label)
 
     def mousePressEvent(self, event: QMouseEvent):
         if self.main_window.params.clickable_button.state:
@@ -141,9 +129,9 @@ class SugarBarBox(QWidget):
         super().__init__()
         self.sugar_level = 3
         self.sugar_scene = sugarScene
-        self.setMouseTracking(True)
         self.init_font()
         self.initUI()
+        PointerInput.getInstance().add_move_handler(self.on_pointer_moved)
 
     def init_font(self):
         self.font_db = QFontDatabase()
@@ -158,14 +146,13 @@ class SugarBarBox(QWidget):
     def initUI(self):
         self.container = QWidget()
         self.container.setAttribute(Qt.WA_TransparentForMouseEvents)
+        set_role(self.container, "sugar")
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.addSpacing(TITLE_SPACING)
 
         self.label = QLabel("Add some sugar ?")
         self.label.setFont(QFont(self.font_family, 48))
-        self.label.setStyleSheet(
-            f"border: 2px; color: {COFFEE_COLOR[1]}; background-color: transparent;"
-        )
+        set_role(self.label, "title")
         self.label.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.label.setContentsMargins(0, 0, 0, 0)
 
@@ -182,9 +169,7 @@ class SugarBarBox(QWidget):
 
             block_widget = QWidget()
             block_widget.setLayout(block_container)
-            block_widget.setStyleSheet(
-                f"border: 0px; background-color: {COFFEE_COLOR[3]};"
-            )
+            set_role(block_widget, "sugar-level")
             block_widget.setMaximumHeight(block_height)
             self.blocks_layout.addWidget(block_widget, 0, Qt.AlignBottom)
             self.blocks.append(block_widget)
@@ -198,10 +183,6 @@ class SugarBarBox(QWidget):
     def showEvent(self, event):
         self.main_window = findMainWindow(self)
 
-    def enterEvent(self, event):
-        self.parent().unselect_widgets()
-        self.select(event)
-
     def leaveEvent(self, event):
         pass
 
@@ -209,57 +190,35 @@ class SugarBarBox(QWidget):
         if self.main_window.params.clickable_button.state:
             self.validate_card()
 
-    def select(self, event):
+    def select(self):
         self.main_window.change_sound.play()
-        self.container.setStyleSheet(
-            f"border: 2px solid {COFFEE_COLOR[1]}; background-color: rgba(150, 114, 89, 220); border-radius: 5px;"
-        )
-        self.label.setStyleSheet(
-            f"color: {COFFEE_COLOR[0]}; border: 0px; background-color: transparent;"
-        )
+        LatencyMonitor.getInstance().tag(self.container, Scenes.SUGAR)
+        set_state("selected", self.container, self.label)
 
     def unselect(self):
-        self.container.setStyleSheet(
-            f"border: 2px solid {COFFEE_COLOR[4]}; background-color: rgba(150, 114, 89, 128); border-radius: 5px;"
-        )
-        self.label.setStyleSheet(
-          f"color: {COFFEE_COLOR[1]}; border: 0px; background-color: transparent;"
-          )
+        set_state("default", self.container, self.label)
 
     def hideEvent(self, event):
         pass
 
-    def mouseMoveEvent(self, event):
-        super().mouseMoveEvent(event)
-        mouse_x = event.globalPosition().x()
-        x = self.x()  # X position of the widget's top-left corner
-        width = self.width()  # Width of the widget
-        step = width / MAX_SUGAR
-        min_x = x
-        max_x = x + width
-
-        if min_x <= mouse_x < min_x + step:
-            sugar_value = 0
-        elif min_x + step <= mouse_x < min_x + 2 * step:
-            sugar_value = 1
-        elif min_x + 2 * step <= mouse_x < min_x + 3 * step:
-            sugar_value = 2
-        elif min_x + 3 * step <= mouse_x < min_x + 4 * step:
-            sugar_value = 3
-        elif min_x + 4 * step <= mouse_x <= min_x + 5 * step:
-            sugar_value = 4
+    def on_pointer_moved(self, position: QPointF):
+        if not self.isVisible():
+            return
+        local = self.mapFromGlobal(position)
+        if not self.rect().contains(local.toPoint()):
+            return
+
+        step = self.width() / MAX_SUGAR
+        sugar_value = min(int(local.x() / step), MAX_SUGAR - 1)
 
         self.sugar_level = sugar_value
         self.sugar_scene.sugar_value = sugar_value + 1
         self.colorBlocks(self.sugar_level)
 
     def colorBlocks(self, sugar_value):
-        for block in self.blocks:
-            if self.blocks.index(block) <= sugar_value:
-                block.setStyleSheet(f"background-color: {COFFEE_COLOR[1]};")
-            else:
-                block.setStyleSheet(f"background-color: {COFFEE_COLOR[3]};")
-        self.update()
+        LatencyMonitor.getInstance().tag(self.blocks[sugar_value], Scenes.SUGAR)
+        for index, block in enumerate(self.blocks):
+            set_state("filled" if index <= sugar_value else "empty", block)
 
     def mousePressEvent(self, event: QMouseEvent):
         if self.main_window.params.clickable_button.state:
@@ -273,21 +232,18 @@ class SugarBarBox(QWidget):
 class SugarSelectionScene(QWidget):
     def __init__(self):
         super().__init__()
-        self.lastMousePosition = QPoint()
-        self.elapsedTimer = QElapsedTimer()
         self.validate_bottom_zone = None
         self.sugar_value = 0
         self.initUI()
+        PointerInput.getInstance().gestures.flicked_down.connect(self.on_flick_down)
 
     def initUI(self):
         self.no_sugar_box = NoSugarBox(self)
-        self.no_sugar_box.setStyleSheet("background-color: rgba(150, 114, 89, 64)")
         self.no_sugar_box.setContentsMargins(0, 0, 0, 0)
         self.no_sugar_box.validate_sugar_signal.connect(self.validate_sugar)
         self.no_sugar_box.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
 
         self.sugar_bar_box = SugarBarBox(self)
-        self.sugar_bar_box.setStyleSheet("background-color: rgba(150, 114, 89, 64)")
         self.sugar_bar_box.setContentsMargins(0, 0, 0, 0)
         self.sugar_bar_box.validate_sugar_signal.connect(self.validate_sugar)
         self.sugar_bar_box.setMinimumHeight(570)
@@ -303,20 +259,28 @@ class SugarSelectionScene(QWidget):
         self.setContentsMargins(0, 0, 0, 0)
         self.add_bottom_validation()
 
+        self.selection = SelectionModel(self, [self.no_sugar_box, self.sugar_bar_box])
+        self.selection.selection_changed.connect(self.on_box_hovered)
+
     def showEvent(self, event):
         self.main_window = findMainWindow(self)
 
+    def hideEvent(self, event):
+        self.selection.clear()
+
+    def on_box_hovered(self, box):
+        self.unselect_widgets()
+        box.select()
+
     def add_bottom_validation(self):
         self.validate_bottom_zone = ValidateBottomZone()
         self.validate_bottom_zone.setContentsMargins(0, 0, 0, 0)
         self.validate_bottom_zone.validate_signal.connect(self.validate_card)
         self.layout.addWidget(self.validate_bottom_zone, alignment=Qt.AlignBottom)
 
-    def remove_bottom_validation(self):
-        if self.validate_bottom_zone is not None:
-            self.layout.removeWidget(self.validate_bottom_zone)
-            self.validate_bottom_zone.deleteLater()
-            self.validate_bottom_zone = None
+    def on_flick_down(self):
+        if self.isVisible() and self.main_window.params.movement_validation.state:
+            self.validate_card()
 
     def validate_card(self):
         self.main_window.validation_sound.play()  # Play the sound
@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+
+from config import CALIBRATION_GRID
+
+from sensor.protocol import SENSOR_RANGE
+
+
+def fit_homography(sensor_points, screen_points):
+    """Projective transform taking sensor points to screen points.
+
+    At least 4 pairs are needed, more are fitted in the least squares sense.
+    Coordinates are normalized first so that the system is well conditioned.
+    """
+    sensor = np.asarray(sensor_points, float) / SENSOR_RANGE
+    screen = np.asarray(screen_points, float)
+    scale = screen.max(axis=0)
+    screen = screen / scale
+
+    rows = []
+    for (u, v), (x, y) in zip(sensor, screen):
+        rows.append([-u, -v, -1, 0, 0, 0, u * x, v * x, x])
+        rows.append([0, 0, 0, -u, -v, -1, u * y, v * y, y])
+    _, _, vt = np.linalg.svd(np.array(rows))
+    homography = vt[-1].reshape(3, 3)
+
+    # Back to raw sensor units in, screen pixels out
+    return np.diag([scale[0], scale[1], 1]) @ homography @ np.diag([1 / SENSOR_RANGE, 1 / SENSOR_RANGE, 1])
+
+
+def fit_affine(sensor_points, screen_points):
+    """Affine transform as a 3x3 matrix, for 3 pairs or more"""
+    sensor = np.asarray(sensor_points, float)
+    screen = np.asarray(screen_points, float)
+    design = np.column_stack([sensor, np.ones(len(sensor))])
+    solution, *_ = np.linalg.lstsq(design, screen, rcond=None)
+    return np.vstack([solution.T, [0, 0, 1]])
+
+
+def apply_transform(matrix, u, v):
+    x, y, w = matrix @ np.stack([u, v, np.ones_like(u)])
+    return x / w, y / w
+
+
+class CalibrationTable:
+    """Sensor to screen mapping as a dense lookup table.
+
+    The table holds the screen position of every node of a regular grid over
+    the sensor field, a sample is mapped by bilinear interpolation between
+    the 4 nodes around it: constant time whatever the warp the table encodes.
+    """
+
+    def __init__(self, x_table, y_table, screen_size, sensor_points=(), screen_points=()):
+        self.x_table = np.asarray(x_table, np.float32)
+        self.y_table = np.asarray(y_table, np.float32)
+        self.screen_size = tuple(screen_size)
+        self.sensor_points = np.asarray(sensor_points, float)
+        self.screen_points = np.asarray(screen_points, float)
+        self.cells = self.x_table.shape[0] - 1
+        self.scale = self.cells / SENSOR_RANGE
+
+    @classmethod
+    def fit(cls, sensor_points, screen_points, screen_size, grid=CALIBRATION_GRID):
+        if len(sensor_points) >= 4:
+            matrix = fit_homography(sensor_points, screen_points)
+        elif len(sensor_points) == 3:
+            matrix = fit_affine(sensor_points, screen_points)
+        else:
+            raise ValueError("Calibration needs at least 3 points")
+
+        nodes = np.linspace(0, SENSOR_RANGE, grid + 1)
+        u, v = np.meshgrid(nodes, nodes)  # Rows follow v, columns follow u
+        x, y = apply_transform(matrix, u.ravel(), v.ravel())
+        shape = (grid + 1, grid + 1)
+        return cls(x.reshape(shape), y.reshape(shape), screen_size, sensor_points, screen_points)
+
+    def map(self, u: int, v: int):
+        x, y = self.map_many(np.array([u]), np.array([v]))
+        return float(x[0]), float(y[0])
+
+    def map_many(self, u, v):
+        fu = np.asarray(u, np.float32) * self.scale
+        fv = np.asarray(v, np.float32) * self.scale
+        i = np.minimum(fu.astype(np.intp), self.cells - 1)
+        j = np.minimum(fv.astype(np.intp), self.cells - 1)
+        a = fu - i
+        b = fv - j
+        return self.interpolate(self.x_table, i, j, a, b), self.interpolate(self.y_table, i, j, a, b)
+
+    @staticmethod
+    def interpolate(table, i, j, a, b):
+        top = table[j, i] * (1 - a) + table[j, i + 1] * a
+        bottom = table[j + 1, i] * (1 - a) + table[j + 1, i + 1] * a
+        return top * (1 - b) + bottom * b
+
+    def resized(self, screen_size):
+        """The same calibration on a screen of another resolution"""
+        scale_x = screen_size[0] / self.screen_size[0]
+        scale_y = screen_size[1] / self.screen_size[1]
+        return CalibrationTable(
+            self.x_table * scale_x,
+            self.y_table * scale_y,
+            screen_size,
+            self.sensor_points,
+            self.screen_points * [scale_x, scale_y] if len(self.screen_points) else (),
+        )
+
+    def save(self, path):
+        np.savez(
+            path,
+            x_table=self.x_table,
+            y_table=self.y_table,
+            screen_size=np.array(self.screen_size),
+            sensor_points=self.sensor_points,
+            screen_points=self.screen_points,
+        )
+
+
+def load_calibration(path, screen_size):
+    """Calibration saved at `path`, or None if there is none"""
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as data:
+        table = CalibrationTable(
+            data["x_table"],
+            data["y_table"],
+            data["screen_size"],
+            data["sensor_points"],
+            data["screen_points"],
+        )
+    if table.screen_size != tuple(screen_size):
+        table = table.resized(screen_size)
+    return table
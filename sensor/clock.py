@@ -0,0 +1,54 @@
+from collections import deque
+
+import numpy as np
+
+from config import CLOCK_SYNC_WINDOW
+
+TIMESTAMP_WRAP = 1 << 32  # us, sensor timestamps are 32 bits and wrap every 71 minutes
+
+
+class ClockSync:
+    """Offset from the clock of a bar to the host clock, from arrival times.
+
+    A batch arrives after its newest frame was taken: the arrival time minus
+    the sensor time of that frame is the offset plus the transport delay. The
+    smallest value over the last `window` ms is the offset plus the shortest
+    delay seen, it follows the slow drift of the bar's crystal and ignores the
+    batches that were held up.
+    """
+
+    def __init__(self, window=CLOCK_SYNC_WINDOW):
+        self.window = window
+        self.candidates = deque()  # (arrival, offset), offsets increasing: the sliding minimum is first
+        self.last_timestamp = None
+        self.wraps = 0
+        self.offset = None
+        self.resets = 0
+
+    def unwrap(self, timestamps):
+        """Sensor times in ms, continuous across wraps"""
+        timestamps = np.asarray(timestamps, np.int64)
+        previous = timestamps[0] if self.last_timestamp is None else self.last_timestamp
+        steps = np.diff(timestamps, prepend=previous)
+        wrapped = steps < -TIMESTAMP_WRAP // 2
+        if np.any((steps < 0) & ~wrapped):
+            # The bar went back in time: it restarted, its clock is a new one
+            self.candidates.clear()
+            self.resets += 1
+        wraps = self.wraps + np.cumsum(wrapped)
+        self.wraps = int(wraps[-1])
+        self.last_timestamp = int(timestamps[-1])
+        return (timestamps + wraps * TIMESTAMP_WRAP) / 1000
+
+    def to_host(self, received: float, timestamps):
+        """Host times (ms) of frames with these sensor timestamps (us), the
+        newest one being received at `received`"""
+        sensor = self.unwrap(timestamps)
+        candidate = received - sensor[-1]
+        while self.candidates and self.candidates[-1][1] >= candidate:
+            self.candidates.pop()
+        self.candidates.append((received, candidate))
+        while self.candidates[0][0] < received - self.window:
+            self.candidates.popleft()
+        self.offset = self.candidates[0][1]
+        return sensor + self.offset
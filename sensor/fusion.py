@@ -0,0 +1,128 @@
+import numpy as np
+from PySide6.QtCore import QThread
+
+from config import FUSION_RATE, FUSION_DELAY, FUSION_STALE_AGE, FUSION_EDGE, FUSION_INTERVAL
+
+from components.utils import now_ms
+
+from sensor.protocol import FLAG_PRESENCE, SENSOR_RANGE
+from sensor.ring_buffer import SAMPLE_DTYPE, SampleRingBuffer
+
+MIN_WEIGHT = 0.05  # A bar seeing the hand on its very edge still counts a little
+
+
+def edge_weight(u, v, edge=FUSION_EDGE):
+    """Trust in a position from how far it is from the edges of the field"""
+    distance = np.minimum(np.minimum(u, SENSOR_RANGE - u), np.minimum(v, SENSOR_RANGE - v))
+    return np.clip(distance / (edge * SENSOR_RANGE), MIN_WEIGHT, 1.0)
+
+
+class FusionWorker(QThread):
+    """Merge the streams of several bars into one ring, on its own thread.
+
+    Each reader writes its own ring, with times already on the host clock.
+    Every FUSION_INTERVAL ms the streams are resampled on a common grid at
+    `rate`, up to `delay` ms in the past so that slower bars have delivered.
+    At each grid time a bar contributes its newest sample if it is younger
+    than `stale_age`, weighted by how far from the edges of its field the hand
+    is; older samples are dropped. The output ring is drained by the GUI like
+    the ring of a single bar.
+    """
+
+    def __init__(
+        self,
+        rings,
+        output: SampleRingBuffer,
+        rate=FUSION_RATE,
+        delay=FUSION_DELAY,
+        stale_age=FUSION_STALE_AGE,
+    ):
+        super().__init__()
+        self.rings = rings
+        self.output = output
+        self.step = 1000 / rate
+        self.delay = delay
+        self.stale_age = stale_age
+        self.history = [np.zeros(0, SAMPLE_DTYPE) for _ in rings]
+        self.next_time = None
+
+        # Counters
+        self.fused = 0  # Samples written to the output
+        self.stale = 0  # Samples that arrived too late to be used
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            self.fuse(now_ms())
+            self.msleep(FUSION_INTERVAL)
+
+    def fuse(self, now: float):
+        for index, ring in enumerate(self.rings):
+            samples = ring.drain()
+            if len(samples) == 0:
+                continue
+            if self.next_time is not None:
+                fresh = samples["t"] >= self.next_time - self.stale_age
+                self.stale += len(samples) - int(fresh.sum())
+                samples = samples[fresh]
+            history = np.concatenate([self.history[index], samples])
+            # A new clock offset can move a batch before the end of the previous one
+            self.history[index] = history[np.argsort(history["t"], kind="stable")]
+
+        end = now - self.delay
+        if self.next_time is None:
+            starts = [history["t"][0] for history in self.history if len(history)]
+            if not starts:
+                return
+            self.next_time = min(starts)
+        # Behind by more than the output holds: the oldest would be overwritten anyway
+        self.next_time = max(self.next_time, end - self.output.capacity * self.step)
+        if end < self.next_time:
+            return
+
+        grid = self.next_time + self.step * np.arange(int((end - self.next_time) / self.step) + 1)
+        self.merge(grid)
+        self.next_time = grid[-1] + self.step
+        for index, history in enumerate(self.history):
+            # Keep the newest sample older than the grid, it still holds for the next times
+            start = max(0, np.searchsorted(history["t"], self.next_time - self.stale_age) - 1)
+            self.history[index] = history[start:]
+
+    def merge(self, grid):
+        total = np.zeros(len(grid))
+        x = np.zeros(len(grid))
+        y = np.zeros(len(grid))
+        u = np.zeros(len(grid), np.uint16)
+        v = np.zeros(len(grid), np.uint16)
+        best = np.zeros(len(grid))
+        seen = np.zeros(len(grid), bool)
+
+        for history in self.history:
+            if len(history) == 0:
+                continue
+            index = np.searchsorted(history["t"], grid, side="right") - 1
+            samples = history[np.maximum(index, 0)]
+            age = grid - samples["t"]
+            fresh = (index >= 0) & (age <= self.stale_age)
+            present = fresh & ((samples["flags"] & FLAG_PRESENCE) != 0)
+            weight = np.where(present, edge_weight(samples["u"], samples["v"]) * (1 - 0.5 * age / self.stale_age), 0)
+
+            total += weight
+            x += weight * samples["x"]
+            y += weight * samples["y"]
+            stronger = weight > best
+            u[stronger] = samples["u"][stronger]
+            v[stronger] = samples["v"][stronger]
+            best = np.maximum(best, weight)
+            seen |= fresh
+
+        # Only the times some bar reported on, with or without a hand
+        present = total > 0
+        x[present] /= total[present]
+        y[present] /= total[present]
+        flags = np.where(present, FLAG_PRESENCE, 0).astype(np.uint8)
+        self.output.push_many(grid[seen], x[seen], y[seen], u[seen], v[seen], flags[seen])
+        self.fused += int(seen.sum())
+
+    def stop(self):
+        self.requestInterruption()
+        self.wait()
@@ -0,0 +1,32 @@
+from sensor.protocol import SENSOR_RANGE
+
+
+def strip_bounds(index: int, count: int, overlap: float):
+    """Left and right of the share of the screen seen by bar `index` of
+    `count` side by side, neighbours sharing `overlap` of the width"""
+    return max(0.0, index / count - overlap / 2), min(1.0, (index + 1) / count + overlap / 2)
+
+
+class LinearMapping:
+    """Stretch the sensor field over a rectangle, the whole screen by default"""
+
+    def __init__(self, width: float, height: float, left: float = 0, top: float = 0):
+        self.scale_x = width / SENSOR_RANGE
+        self.scale_y = height / SENSOR_RANGE
+        self.left = left
+        self.top = top
+
+    def map(self, u: int, v: int):
+        return self.left + u * self.scale_x, self.top + v * self.scale_y
+
+    def map_many(self, u, v):
+        return self.left + u * self.scale_x, self.top + v * self.scale_y
+
+
+def strip_mappings(count: int, width: int, height: int, overlap: float):
+    """Mappings of `count` bars side by side over the screen"""
+    mappings = []
+    for index in range(count):
+        left, right = strip_bounds(index, count, overlap)
+        mappings.append(LinearMapping((right - left) * width, height, left * width))
+    return mappings
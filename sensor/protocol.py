@@ -0,0 +1,53 @@
+import struct
+
+# A LinLED frame: magic, sensor timestamp (us), position (u, v), flags, checksum
+FRAME_MAGIC = b"\xa5\x5a"
+FRAME = struct.Struct("<2sIHHBB")
+FRAME_SIZE = FRAME.size
+
+FLAG_PRESENCE = 0x01  # A hand is in front of the bar
+SENSOR_RANGE = 0xFFFF  # u and v span 0..SENSOR_RANGE over the sensor field
+
+
+def checksum(payload: bytes) -> int:
+    return sum(payload) & 0xFF
+
+
+def encode_frame(timestamp_us: int, u: int, v: int, flags=FLAG_PRESENCE) -> bytes:
+    frame = FRAME.pack(FRAME_MAGIC, timestamp_us & 0xFFFFFFFF, u, v, flags, 0)
+    return frame[:-1] + bytes([checksum(frame[2:-1])])
+
+
+class FrameParser:
+    """Split a raw byte stream into frames, resyncing on the magic bytes"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.bad_frames = 0
+
+    def feed(self, data: bytes):
+        self.buffer += data
+        frames = []
+        start = 0
+        end = len(self.buffer)
+
+        while end - start >= FRAME_SIZE:
+            if self.buffer[start : start + 2] != FRAME_MAGIC:
+                start = self.buffer.find(FRAME_MAGIC, start + 1)
+                if start == -1:
+                    # Keep the last byte, it may be the first half of a magic
+                    start = end - 1
+                    break
+                continue
+
+            _, timestamp, u, v, flags, check = FRAME.unpack_from(self.buffer, start)
+            if checksum(self.buffer[start + 2 : start + FRAME_SIZE - 1]) != check:
+                self.bad_frames += 1
+                start += 1
+                continue
+
+            frames.append((timestamp, u, v, flags))
+            start += FRAME_SIZE
+
+        del self.buffer[:start]
+        return frames
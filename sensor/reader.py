@@ -0,0 +1,58 @@
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+
+from components.utils import now_ms
+
+from sensor.clock import ClockSync
+from sensor.protocol import FrameParser
+from sensor.ring_buffer import SampleRingBuffer
+from sensor.sources import open_source
+
+READ_TIMEOUT = 0.1  # s, how often the thread checks for a stop request
+
+
+class SensorReader(QThread):
+    """Read LinLED frames on a background thread and push them to a ring buffer"""
+
+    error = Signal(str)
+
+    def __init__(self, source_spec: str, ring: SampleRingBuffer, mapping):
+        super().__init__()
+        self.source_spec = source_spec
+        self.ring = ring
+        self.mapping = mapping
+        self.parser = FrameParser()
+        self.clock = ClockSync()
+        self.frames = 0
+
+    def run(self):
+        try:
+            source = open_source(self.source_spec)
+        except (OSError, ValueError, ImportError) as error:
+            self.error.emit(f"Cannot open sensor {self.source_spec}: {error}")
+            return
+
+        try:
+            while not self.isInterruptionRequested():
+                data = source.read(READ_TIMEOUT)
+                if data:
+                    self.ingest(now_ms(), self.parser.feed(data))
+        except OSError as error:
+            self.error.emit(f"Sensor {self.source_spec} disconnected: {error}")
+        finally:
+            source.close()
+
+    def ingest(self, received, frames):
+        if not frames:
+            return
+        timestamps, u, v, flags = (np.array(column) for column in zip(*frames))
+        # Frames read together arrived together, their times come from the
+        # sensor clock so that velocities stay meaningful
+        t = self.clock.to_host(received, timestamps)
+        x, y = self.mapping.map_many(u, v)
+        self.ring.push_many(t, x, y, u, v, flags)
+        self.frames += len(frames)
+
+    def stop(self):
+        self.requestInterruption()
+        self.wait()
@@ -0,0 +1,59 @@
+import threading
+
+import numpy as np
+
+SAMPLE_DTYPE = np.dtype(
+    [
+        ("t", "f8"),  # host time of the sample (ms, perf_counter clock)
+        ("x", "f4"),  # screen position (px)
+        ("y", "f4"),
+        ("u", "u2"),  # raw sensor position
+        ("v", "u2"),
+        ("flags", "u1"),
+    ]
+)
+
+
+class SampleRingBuffer:
+    """Fixed-size buffer written by the sensor thread and drained by the GUI thread.
+
+    When the GUI falls behind, the oldest samples are overwritten and counted
+    in `overruns` instead of growing the buffer.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.samples = np.zeros(capacity, SAMPLE_DTYPE)
+        self.lock = threading.Lock()
+        self.written = 0
+        self.drained = 0
+        self.overruns = 0
+
+    def push(self, t, x, y, u, v, flags):
+        with self.lock:
+            self.samples[self.written % self.capacity] = (t, x, y, u, v, flags)
+            self.written += 1
+
+    def push_many(self, t, x, y, u, v, flags):
+        count = len(t)
+        with self.lock:
+            # More than the capacity at once: the oldest would be overwritten anyway
+            skip = max(0, count - self.capacity)
+            indices = np.arange(self.written + skip, self.written + count) % self.capacity
+            for name, values in zip(SAMPLE_DTYPE.names, (t, x, y, u, v, flags)):
+                self.samples[name][indices] = values[skip:]
+            self.written += count
+
+    def drain(self):
+        """Return every sample written since the previous drain, oldest first"""
+        with self.lock:
+            start, end = self.drained, self.written
+            if end - start > self.capacity:
+                self.overruns += end - start - self.capacity
+                start = end - self.capacity
+            self.drained = end
+            return self.samples[np.arange(start, end) % self.capacity]
+
+    def __len__(self):
+        with self.lock:
+            return min(self.written - self.drained, self.capacity)
@@ -0,0 +1,139 @@
+import os
+import select
+import socket
+import subprocess
+import sys
+
+from components.assets import resource_path
+
+READ_SIZE = 4096
+
+
+class SensorSource:
+    """A byte stream carrying LinLED frames"""
+
+    def read(self, timeout: float) -> bytes:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SerialSource(SensorSource):
+    def __init__(self, port: str, baudrate: int):
+        import serial  # pyserial, only needed for bars plugged over USB/UART
+
+        self.serial = serial.Serial(port, baudrate, timeout=0)
+
+    def read(self, timeout):
+        self.serial.timeout = timeout
+        data = self.serial.read(max(1, self.serial.in_waiting))
+        return data
+
+    def close(self):
+        self.serial.close()
+
+
+class UdpSource(SensorSource):
+    def __init__(self, host: str, port: int):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind((host, port))
+
+    def read(self, timeout):
+        self.socket.settimeout(timeout)
+        try:
+            return self.socket.recv(READ_SIZE)
+        except socket.timeout:
+            return b""
+
+    def close(self):
+        self.socket.close()
+
+
+class PtySource(SensorSource):
+    def __init__(self, path: str):
+        import tty
+
+        self.fd = os.open(path, os.O_RDONLY | os.O_NOCTTY)
+        # Frames are binary, the line discipline must not touch them
+        tty.setraw(self.fd)
+
+    def read(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return b""
+        return os.read(self.fd, READ_SIZE)
+
+    def close(self):
+        os.close(self.fd)
+
+
+class SimulatorProcess:
+    """tools/sensor_simulator.py streaming `count` virtual bars, a pty each"""
+
+    def __init__(self, rate: int, count: int = 1):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "tools.sensor_simulator", "--rate", str(rate), "--sensors", str(count)],
+            cwd=resource_path(""),
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self.paths = [self.process.stdout.readline().strip() for _ in range(count)]
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait()
+
+
+class SimulatorSource(PtySource):
+    """Start a simulator of a single bar and read its pseudo-terminal"""
+
+    def __init__(self, rate: int):
+        self.simulator = SimulatorProcess(rate)
+        super().__init__(self.simulator.paths[0])
+
+    def close(self):
+        super().close()
+        self.simulator.close()
+
+
+def parse_simulator(address: str):
+    rate, _, count = address.partition(":")
+    return int(rate or 1000), int(count or 1)
+
+
+def expand_sources(specs):
+    """Start the simulators of several bars: `sim:RATE:COUNT` becomes COUNT
+    pty specs fed by one process, so that the bars see the same hand.
+
+    Returns the specs to open and the simulators to close.
+    """
+    expanded, simulators = [], []
+    for spec in specs:
+        kind, _, address = spec.partition(":")
+        if kind == "sim" and parse_simulator(address)[1] > 1:
+            simulator = SimulatorProcess(*parse_simulator(address))
+            simulators.append(simulator)
+            expanded.extend(f"pty:{path}" for path in simulator.paths)
+        else:
+            expanded.append(spec)
+    return expanded, simulators
+
+
+def open_source(spec: str) -> SensorSource:
+    """Open a source from its spec: serial:PORT[:BAUD], udp:[HOST:]PORT, pty:PATH or sim[:RATE]"""
+    kind, _, address = spec.partition(":")
+    match kind:
+        case "serial":
+            port, _, baudrate = address.rpartition(":")
+            if not port or not baudrate.isdigit():
+                port, baudrate = address, "921600"
+            return SerialSource(port, int(baudrate))
+        case "udp":
+            host, _, port = address.rpartition(":")
+            return UdpSource(host or "0.0.0.0", int(port))
+        case "pty":
+            return PtySource(address)
+        case "sim":
+            return SimulatorSource(parse_simulator(address)[0])
+    raise ValueError(f"Unknown sensor source: {spec}")
@@ -0,0 +1,67 @@
+"""Measure a frame of the carousel scrolling, with as many drinks as asked.
+
+The window runs offscreen, the carousel is filled with the drinks repeated
+up to --entries and scrolls at its top speed; a frame is one step of the
+scroll, FRAME_INTERVAL later than the previous one, and the repaint it
+causes. The card widgets count stays the same whatever
+the number of drinks.
+
+    python -m tools.bench_carrousel --entries 500 --frames 400
+"""
+import argparse
+import os
+import sys
+import time
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import FRAME_INTERVAL, SCROLL_MAX_SPEED
+
+WARMUP = 2500  # ms, the carousel cards activate 1.5 s after the scene shows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of a frame of the carousel scrolling")
+    parser.add_argument("--entries", type=int, default=9, help="Drinks in the carousel")
+    parser.add_argument("--frames", type=int, default=400, help="Scroll steps measured")
+    parser.add_argument("--window", action="store_true", help="Show the window instead of running offscreen")
+    args = parser.parse_args()
+
+    if not args.window:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from main_window import MainWindow
+    from components.carrousel_card import CarrouselCard
+    from components.selection import CoffeeType
+
+    app = QApplication(sys.argv)
+    window = MainWindow(debug=False)
+    window.show()
+    carrousel = window.coffee_selection_scene.carrousel
+    drinks = [coffee_type for coffee_type in CoffeeType if coffee_type != CoffeeType.NONE]
+    carrousel.set_entries([drinks[index % len(drinks)] for index in range(args.entries)])
+
+    warmup = QEventLoop()
+    QTimer.singleShot(WARMUP, warmup.quit)
+    warmup.exec()
+
+    carrousel.scroller.drive_at(SCROLL_MAX_SPEED)
+    times = []
+    for frame in range(args.frames):
+        started = time.perf_counter()
+        carrousel.on_frame(frame * FRAME_INTERVAL)
+        QCoreApplication.processEvents()
+        times.append((time.perf_counter() - started) * 1000)
+    window.close()
+
+    times.sort()
+    cards = len(carrousel.findChildren(CarrouselCard))
+    print(f"{args.entries} drinks on {cards} card widgets")
+    print(f"scroll frame mean {sum(times) / len(times):.2f} ms, "
+          f"p95 {times[int(len(times) * 0.95)]:.2f} ms, max {times[-1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
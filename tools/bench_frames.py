@@ -0,0 +1,76 @@
+"""Show where the frame time goes, phase by phase.
+
+The window runs offscreen through the phases of tools.bench_stylesheets,
+each keeping an animation going. For each phase it prints the frames ticked
+per second, the mean work of a frame split into input (with all that follows
+the hand), animations and paint, the longest frame and the frames over the
+budget.
+
+    python -m tools.bench_frames --seconds 3
+"""
+import argparse
+import os
+import sys
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import FRAME_BUDGET
+
+
+class FrameCounter:
+    """Work of the frame scheduler since the previous take"""
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.last = self.snapshot()
+
+    def snapshot(self):
+        scheduler = self.scheduler
+        return {"frames": scheduler.frames, "late": scheduler.late, "work": scheduler.work, **scheduler.parts}
+
+    def take(self):
+        snapshot = self.snapshot()
+        counts = {name: snapshot[name] - self.last[name] for name in snapshot}
+        counts["longest"] = self.scheduler.longest
+        self.scheduler.longest = 0.0
+        self.last = snapshot
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Where the frame time goes")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each phase")
+    parser.add_argument("--window", action="store_true", help="Show the window instead of running offscreen")
+    args = parser.parse_args()
+
+    if not args.window:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from main_window import MainWindow
+    from tools.bench_stylesheets import Bench
+
+    app = QApplication(sys.argv)
+    window = MainWindow(debug=False)
+    window.show()
+    counter = FrameCounter(window.scheduler)
+
+    bench = Bench(window, counter, args.seconds)
+    bench.finished.connect(app.quit)
+    app.exec()
+    window.close()
+
+    print(f"budget {FRAME_BUDGET} ms, times in ms per frame")
+    print(f"{'phase':<8}{'frames/s':>9}{'work':>7}{'input':>7}{'anim':>7}{'paint':>7}{'longest':>9}{'late':>6}")
+    for name, elapsed, counts in bench.results:
+        frames = max(counts["frames"], 1)
+        print(
+            f"{name:<8}{counts['frames'] / elapsed:>9.1f}{counts['work'] / frames:>7.2f}"
+            f"{counts['input'] / frames:>7.2f}{counts['animations'] / frames:>7.2f}{counts['paint'] / frames:>7.2f}"
+            f"{counts['longest']:>9.1f}{counts['late']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Show what a card hover repaints.
+
+The window runs offscreen, the hand moves from card to card in the middle of
+the carousel (away from the scrolling edges) and stays on each one for the
+selection animation. For each hover it prints the painted area per widget,
+the overdraw, and what was repainted outside the cards whose selection
+changed, by widget. Animations running on their own, like the glowing
+validation hint, show up there.
+
+    python -m tools.bench_repaint --hovers 4
+"""
+import argparse
+import os
+import sys
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import FRAME_INTERVAL, ANIMATION_SPEED
+from components.repaint_monitor import RepaintMonitor, region_area
+
+WARMUP = 2000  # ms, the carousel cards activate 1.5 s after the scene shows
+SETTLE = ANIMATION_SPEED + 300  # ms on each card
+
+
+class Bench(QObject):
+    finished = Signal()
+
+    def __init__(self, window, monitor: RepaintMonitor, hovers: int):
+        super().__init__(window)
+        self.window = window
+        self.monitor = monitor
+        self.hovers = hovers
+        self.carrousel = window.coffee_selection_scene.carrousel
+        self.target = None
+        self.previous = None
+        self.results = []
+
+        self.feeder = QTimer(self)
+        self.feeder.timeout.connect(self.feed)
+        self.feeder.start(FRAME_INTERVAL)
+        QTimer.singleShot(WARMUP, self.next_hover)
+
+    def middle_cards(self):
+        left = self.carrousel.mapToGlobal(QPoint(0, 0)).x()
+        width = self.carrousel.width()
+        cards = []
+        for card in self.carrousel.carrousel_cards:
+            x = card.mapToGlobal(card.rect().center()).x()
+            if left + 0.15 * width < x < left + 0.85 * width:
+                cards.append(card)
+        return cards
+
+    def next_hover(self):
+        if len(self.results) == self.hovers:
+            self.feeder.stop()
+            self.finished.emit()
+            return
+        cards = self.middle_cards()
+        card = cards[len(self.results) % len(cards)]
+        self.monitor.reset()
+        self.target = card.mapToGlobal(card.rect().center())
+        QTimer.singleShot(SETTLE, lambda: self.end_hover(card))
+
+    def end_hover(self, card):
+        # The card left keeps its selection border until it is unselected
+        changed = QRegion(window_rect(card))
+        if self.previous is not None and self.previous is not card:
+            changed += window_rect(self.previous)
+        outside = region_area(self.monitor.region - changed)
+        self.results.append((card.coffee_type.name, self.monitor.report(), outside, self.monitor.outside(changed)))
+        self.previous = card
+        self.next_hover()
+
+    def feed(self):
+        if self.target is not None:
+            # A hand is never perfectly still, moving keeps the pointer updates coming
+            jitter = (self.window.pointer.updates % 2) * 2
+            self.window.pointer.feed(self.window.pointer.clock(), self.target.x() + jitter, self.target.y())
+
+
+def window_rect(widget: QWidget):
+    return QRect(widget.mapTo(widget.window(), QPoint(0, 0)), widget.size())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What a card hover repaints")
+    parser.add_argument("--hovers", type=int, default=4, help="Cards hovered in turn")
+    parser.add_argument("--window", action="store_true", help="Show the window instead of running offscreen")
+    args = parser.parse_args()
+
+    if not args.window:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from main_window import MainWindow
+
+    app = QApplication(sys.argv)
+    monitor = RepaintMonitor()
+    window = MainWindow(debug=False)
+    window.show()
+    app.installEventFilter(monitor)
+
+    bench = Bench(window, monitor, args.hovers)
+    bench.finished.connect(app.quit)
+    app.exec()
+    app.removeEventFilter(monitor)
+    window.close()
+
+    screen = window.width * window.height
+    for name, report, outside, widgets in bench.results:
+        print(f"hover {name}: {outside} px repainted outside the cards ({outside / screen:.1%} of the screen)")
+        for widget, area in widgets.most_common():
+            print(f"  outside by {widget}: {area} px")
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
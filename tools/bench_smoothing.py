@@ -0,0 +1,118 @@
+"""Measure the jitter removed and the lag added by the pointer smoothing.
+
+Runs the OneEuroFilter over recorded input logs (or a synthetic trajectory)
+and compares the filtered positions to the raw ones:
+    jitter   RMS distance between consecutive positions while the hand is still
+    lag      distance behind the true position divided by the hand speed, while
+             the hand moves; next to the filter's own latency estimate
+
+Recorded logs have no ground truth, the raw position stands for it and its
+noise inflates the measured lag.
+
+    python -m tools.bench_smoothing recordings/input-*.lnr
+    python -m tools.bench_smoothing --synthetic 20 --beta 0.02 --latency-budget 50
+"""
+import argparse
+import time
+
+import numpy as np
+
+from config import SMOOTHING_MIN_CUTOFF, SMOOTHING_BETA, SMOOTHING_DERIVATIVE_CUTOFF, SMOOTHING_LATENCY_BUDGET
+from components.recorder import KIND_POINTER, read_log
+from components.smoothing import OneEuroFilter
+from tools.sensor_simulator import swipes
+
+SPEED_WINDOW = 100  # ms, hand speed is measured over this span
+STILL_SPEED = 100  # px/s
+MOVING_SPEED = 1000  # px/s
+
+
+def load_logs(paths):
+    t, x, y = [], [], []
+    for path in paths:
+        _, records = read_log(path)
+        for kind, record_t, a, b in records:
+            if kind == KIND_POINTER:
+                t.append(record_t)
+                x.append(a)
+                y.append(b)
+    order = np.argsort(t, kind="stable")
+    t, x, y = np.array(t)[order], np.array(x)[order], np.array(y)[order]
+    return t, x, y, x, y
+
+
+def synthetic(seconds, rate, noise, size=(1920, 1080)):
+    """Noisy samples of the simulator's swipes, and the true positions"""
+    t = np.arange(0, seconds * 1000, 1000 / rate)
+    true_x, true_y = np.array([swipes(ms / 1000) for ms in t]).T * np.array(size)[:, None]
+    rng = np.random.default_rng(0)
+    return t, true_x + rng.normal(0, noise, len(t)), true_y + rng.normal(0, noise, len(t)), true_x, true_y
+
+
+def hand_speed(t, x, y):
+    """Speed over the last SPEED_WINDOW ms at each sample (px/s)"""
+    start = np.searchsorted(t, t - SPEED_WINDOW)
+    elapsed = np.maximum(t - t[start], 1e-9)
+    return np.hypot(x - x[start], y - y[start]) * 1000 / elapsed
+
+
+def run(t, x, y, filter: OneEuroFilter):
+    latencies = np.empty(len(t))
+    smoothed_x = np.empty(len(t))
+    smoothed_y = np.empty(len(t))
+    start = time.perf_counter()
+    for i in range(len(t)):
+        smoothed_x[i], smoothed_y[i] = filter.filter(t[i], x[i], y[i])
+        latencies[i] = filter.latency
+    cost = (time.perf_counter() - start) / len(t) * 1e6
+    return smoothed_x, smoothed_y, latencies, cost
+
+
+def jitter(x, y, still):
+    steps = np.hypot(np.diff(x), np.diff(y))[still[1:]]
+    return float(np.sqrt(np.mean(steps**2))) if len(steps) else float("nan")
+
+
+def percentiles(values):
+    if len(values) == 0:
+        return "n/a"
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return f"p50 {p50:.2f}, p95 {p95:.2f}, p99 {p99:.2f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pointer smoothing benchmark")
+    parser.add_argument("logs", nargs="*", help="Input logs recorded with --record")
+    parser.add_argument("--synthetic", type=float, default=0, help="Seconds of simulated swipes instead of logs")
+    parser.add_argument("--rate", type=float, default=1000, help="Synthetic samples per second")
+    parser.add_argument("--noise", type=float, default=4.0, help="Synthetic jitter (px)")
+    parser.add_argument("--min-cutoff", type=float, default=SMOOTHING_MIN_CUTOFF, help="Hz")
+    parser.add_argument("--beta", type=float, default=SMOOTHING_BETA)
+    parser.add_argument("--derivative-cutoff", type=float, default=SMOOTHING_DERIVATIVE_CUTOFF, help="Hz")
+    parser.add_argument("--latency-budget", type=float, default=SMOOTHING_LATENCY_BUDGET, help="ms")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        t, x, y, true_x, true_y = synthetic(args.synthetic, args.rate, args.noise)
+    elif args.logs:
+        t, x, y, true_x, true_y = load_logs(args.logs)
+    else:
+        parser.error("give input logs or --synthetic SECONDS")
+
+    filter = OneEuroFilter(args.min_cutoff, args.beta, args.derivative_cutoff, args.latency_budget)
+    smoothed_x, smoothed_y, latencies, cost = run(t, x, y, filter)
+
+    speed = hand_speed(t, true_x, true_y)
+    still = speed < STILL_SPEED
+    moving = speed > MOVING_SPEED
+    lag = np.hypot(smoothed_x - true_x, smoothed_y - true_y)[moving] * 1000 / speed[moving]
+
+    print(f"{len(t)} samples, {still.mean():.0%} still, {moving.mean():.0%} moving, {cost:.1f} us per sample")
+    print(f"Jitter while still: {jitter(x, y, still):.2f} px raw, {jitter(smoothed_x, smoothed_y, still):.2f} px smoothed")
+    print(f"Estimated latency, moving: {percentiles(latencies[moving])}")
+    print(f"Estimated latency, still:  {percentiles(latencies[still])}")
+    print(f"Measured lag, moving:      {percentiles(lag)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Count the stylesheet changes made while the animations run.
+
+Every setStyleSheet call parses QSS again and re-polishes the widget and its
+children (one StyleChange event each). The window runs offscreen through
+phases that each keep an animation going:
+    idle          pulsing title of the idle scene
+    glow          "Go down to validate" glowing in the coffee scene
+    hover         the hand going in and out of the validation zone
+    edge          the hand on the left edge of the carousel, scrolling it
+    theme         switching between the production and the debug theme
+
+    python -m tools.bench_stylesheets --seconds 3
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import FRAME_INTERVAL
+from components.dwell import DwellParams
+from components.theme import Theme
+
+WARMUP = 2000  # ms, the carousel cards activate 1.5 s after the scene shows
+HOVER_PERIOD = 400  # ms in and out of the validation zone, or between theme switches
+
+
+class StyleCounter(QObject):
+    """Count setStyleSheet calls, style changes and paints"""
+
+    def __init__(self):
+        super().__init__()
+        self.counts = Counter()
+        counter = self
+        set_style_sheet = QWidget.setStyleSheet
+
+        def counting_set_style_sheet(widget, sheet):
+            counter.counts["setStyleSheet"] += 1
+            set_style_sheet(widget, sheet)
+
+        QWidget.setStyleSheet = counting_set_style_sheet
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.StyleChange:
+            self.counts["style changes"] += 1
+        elif event.type() == QEvent.Paint:
+            self.counts["paints"] += 1
+        return super().eventFilter(obj, event)
+
+    def take(self):
+        counts, self.counts = self.counts, Counter()
+        return counts
+
+
+class Bench(QObject):
+    finished = Signal()
+
+    def __init__(self, window, counter: StyleCounter, seconds: float):
+        super().__init__(window)
+        self.window = window
+        self.counter = counter
+        self.duration = int(seconds * 1000)
+        self.results = []
+        self.target = None
+        self.phases = [("idle", self.show_idle), ("glow", self.show_coffee), ("hover", self.hover), ("edge", self.edge), ("theme", self.switch_theme)]
+
+        self.feeder = QTimer(self)
+        self.feeder.timeout.connect(self.feed)
+        self.feeder.start(FRAME_INTERVAL)
+
+        self.zone = window.coffee_selection_scene.validate_bottom_zone
+        self.zone.dwell.params = DwellParams(dwell_time=60_000, early_time=60_000)  # Hover without validating
+        self.carrousel = window.coffee_selection_scene.carrousel
+        window.params.carrousel_swipe.state = False
+        QTimer.singleShot(WARMUP, self.next_phase)
+
+    def next_phase(self):
+        if self.phases:
+            name, start = self.phases.pop(0)
+            self.counter.take()
+            start()
+            self.started = time.perf_counter()
+            QTimer.singleShot(self.duration, lambda: self.end_phase(name))
+        else:
+            self.feeder.stop()
+            self.theme_timer.stop()
+            self.finished.emit()
+
+    def end_phase(self, name):
+        elapsed = time.perf_counter() - self.started
+        self.results.append((name, elapsed, self.counter.take()))
+        self.next_phase()
+
+    def show_idle(self):
+        self.target = None
+        self.window.onIdle()
+
+    def show_coffee(self):
+        self.window.exitIdle()
+        self.target = None
+
+    def hover(self):
+        self.hover_timer = QTimer(self)
+        self.hover_timer.timeout.connect(self.toggle_hover)
+        self.hover_timer.start(HOVER_PERIOD)
+        self.toggle_hover()
+
+    def toggle_hover(self):
+        inside = self.zone.mapToGlobal(self.zone.rect().center())
+        outside = inside - QPoint(0, 3 * self.zone.height())
+        self.target = outside if self.target == inside else inside
+
+    def edge(self):
+        self.hover_timer.stop()
+        self.target = self.carrousel.mapToGlobal(QPoint(self.carrousel.width() // 30, self.carrousel.height() // 2))
+
+    def switch_theme(self):
+        self.target = None
+        self.theme_timer = QTimer(self)
+        self.theme_timer.timeout.connect(lambda: Theme.getInstance().set_debug(not Theme.getInstance().debug))
+        self.theme_timer.start(HOVER_PERIOD)
+
+    def feed(self):
+        if self.target is not None:
+            # A hand is never perfectly still, moving keeps the pointer updates coming
+            jitter = (self.window.pointer.updates % 2) * 2
+            self.window.pointer.feed(self.window.pointer.clock(), self.target.x() + jitter, self.target.y())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stylesheet changes during animations")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each phase")
+    parser.add_argument("--window", action="store_true", help="Show the window instead of running offscreen")
+    args = parser.parse_args()
+
+    if not args.window:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from main_window import MainWindow
+
+    app = QApplication(sys.argv)
+    counter = StyleCounter()
+    window = MainWindow(debug=False)
+    window.show()
+    app.installEventFilter(counter)
+
+    bench = Bench(window, counter, args.seconds)
+    bench.finished.connect(app.quit)
+    app.exec()
+    app.removeEventFilter(counter)
+    window.close()
+
+    print(f"{'phase':<8}{'setStyleSheet/s':>17}{'style changes/s':>17}{'paints/s':>10}")
+    for name, elapsed, counts in bench.results:
+        print(
+            f"{name:<8}{counts['setStyleSheet'] / elapsed:>17.1f}"
+            f"{counts['style changes'] / elapsed:>17.1f}{counts['paints'] / elapsed:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
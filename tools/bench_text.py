@@ -0,0 +1,96 @@
+"""Measure what a frame of the large animated texts costs.
+
+Each scene is shown on its own at the size of the target screen and its
+animation is stepped frame by frame; a frame is the property change and the
+repaint it causes:
+    idle          pulsing 72pt title of the idle scene
+    preparation   48pt text of the preparation scene fading in and moving up
+
+    python -m tools.bench_text --size 1920x1080 --frames 120
+"""
+import argparse
+import os
+import sys
+import time
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from tools.build_assets import parse_resolution
+
+
+def frame_times(animations, frames: int):
+    """Milliseconds taken by each frame tick of `animations`, stepped together over their duration"""
+    from components.frame_scheduler import FrameScheduler
+
+    scheduler = FrameScheduler.getInstance()
+    scheduler.timer.stop()
+    clock = scheduler.clock
+    now = 0
+    scheduler.set_clock(lambda: now)
+    for animation in animations:
+        animation.stop()
+        animation.start()
+    QCoreApplication.processEvents()
+    duration = max(animation.duration() for animation in animations)
+    times = []
+    for frame in range(frames):
+        now = duration * frame // frames
+        started = time.perf_counter()
+        scheduler.tick()
+        times.append((time.perf_counter() - started) * 1000)
+    for animation in animations:
+        animation.stop()
+    scheduler.set_clock(clock)
+    scheduler.timer.start()
+    return times
+
+
+def idle_phase(size: QSize, frames: int):
+    from scenes.idle import IdleScene
+
+    scene = IdleScene()
+    scene.resize(size)
+    scene.show()
+    # The title pulses over 4 s, one way of the loop is enough
+    times = frame_times([scene.animation], frames)
+    scene.close()
+    return times
+
+
+def preparation_phase(size: QSize, frames: int):
+    from scenes.preparation import FadeInText
+
+    text = FadeInText("Preparing your order, please wait...")
+    text.resize(size)
+    text.show()
+    text.fade_in()
+    times = frame_times([text.transition.group], frames)
+    text.close()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of a frame of the large animated texts")
+    parser.add_argument("--size", type=parse_resolution, default=(1920, 1080), help="Screen, as WIDTHxHEIGHT")
+    parser.add_argument("--frames", type=int, default=120, help="Frames stepped per scene")
+    parser.add_argument("--window", action="store_true", help="Show the windows instead of running offscreen")
+    args = parser.parse_args()
+
+    if not args.window:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    app = QApplication(sys.argv)
+    size = QSize(*args.size)
+    phases = [("idle", idle_phase), ("preparation", preparation_phase)]
+
+    print(f"{'phase':<13}{'mean ms':>9}{'p95 ms':>9}{'max ms':>9}")
+    for name, phase in phases:
+        times = sorted(phase(size, args.frames))
+        mean = sum(times) / len(times)
+        print(f"{name:<13}{mean:>9.2f}{times[int(len(times) * 0.95)]:>9.2f}{times[-1]:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Validate the assets and pack them pre-scaled for the target screens.
+
+Every "assets/..." path written in the sources is checked: it must exist and,
+for an image, decode. The images whose size only depends on the screen are
+then scaled on a process pool for each resolution and written raw, in the
+format the screen is painted in, to assets/packs/<width>x<height>.pack. The
+app memory-maps the pack of its screen and draws them as they are. Carousel
+cards are sized by the layout: they are packed large enough to be scaled
+down from without decoding the JPEG.
+
+    python -m tools.build_assets --resolutions 1920x1080 1280x800
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+
+from components.asset_pack import PACK_FORMAT, pack_path, write_pack, mode_value
+from components.assets import (
+    resource_path,
+    relative_asset,
+    logo_path,
+    LOGO_HEIGHT,
+    MUGS_SIZE,
+    NO_SUGAR_SIZE,
+    PAYMENT_CARD_SCALE,
+)
+from components.selection import CoffeeType
+
+SOURCE_DIRECTORIES = ["components", "scenes", "sensor", "."]
+REFERENCE = re.compile(r"""["'](assets/[^"'\\]+)["']""")
+
+
+def referenced_assets():
+    """Every asset path written in the sources of the app"""
+    assets = set()
+    for directory in SOURCE_DIRECTORIES:
+        root = resource_path(directory)
+        for name in sorted(os.listdir(root)):
+            if name.endswith(".py"):
+                with open(os.path.join(root, name), encoding="utf-8") as file:
+                    for line in file:
+                        if not line.lstrip().startswith("#"):
+                            assets.update(REFERENCE.findall(line))
+    return sorted(asset for asset in assets if not asset.startswith("assets/packs/"))
+
+
+def validate(assets):
+    """Problems with the referenced assets, one line each"""
+    image_formats = {bytes(format).decode() for format in QImageReader.supportedImageFormats()}
+    problems = []
+    for asset in assets:
+        path = resource_path(asset)
+        if not os.path.isfile(path):
+            problems.append(f"{asset}: missing")
+        elif os.path.splitext(asset)[1][1:].lower() in image_formats:
+            reader = QImageReader(path)
+            if not reader.canRead():
+                problems.append(f"{asset}: cannot be decoded ({reader.errorString()})")
+        elif os.path.getsize(path) == 0:
+            problems.append(f"{asset}: empty")
+    return problems
+
+
+def packed_images(width: int, height: int):
+    """(asset, requested size, aspect mode) of the images packed for a screen.
+
+    The requested sizes are the ones the widgets ask the image cache for.
+    """
+    payment_card = resource_path("assets/cb.png")
+    images = [
+        (logo_path, QSize(width, int(height * LOGO_HEIGHT)), Qt.KeepAspectRatio),
+        (resource_path("assets/mugs.jpg"), QSize(MUGS_SIZE, MUGS_SIZE), Qt.KeepAspectRatio),
+        (resource_path("assets/no_sugar.png"), QSize(NO_SUGAR_SIZE, NO_SUGAR_SIZE), Qt.IgnoreAspectRatio),
+        (payment_card, QImageReader(payment_card).size() * PAYMENT_CARD_SCALE, Qt.KeepAspectRatio),
+    ]
+    # A card is never wider than a quarter of the screen nor higher than it
+    card_paths = {coffee_type.image_path for coffee_type in CoffeeType if coffee_type.image_path}
+    for path in sorted(card_paths):
+        images.append((resource_path(path), QSize(width // 4, height), Qt.KeepAspectRatioByExpanding))
+    return [
+        (path, (size.width(), size.height()), mode_value(mode))
+        for path, size, mode in images
+        if QImageReader(path).canRead()
+    ]
+
+
+def scale_image(path: str, request, mode: int):
+    """Runs in a worker: the raw pixels of one packed image"""
+    image = QImageReader(path).read()
+    size = image.size().scaled(QSize(*request), Qt.AspectRatioMode(mode))
+    source = False
+    if mode == mode_value(Qt.KeepAspectRatioByExpanding) and size.width() >= image.width():
+        # Only scaled down from, a larger one would be no sharper
+        size = image.size()
+        source = True
+    if size != image.size():
+        image = image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    image = image.convertToFormat(PACK_FORMAT)
+    entry = {
+        "path": relative_asset(path),
+        "request": list(request),
+        "mode": mode,
+        "width": image.width(),
+        "height": image.height(),
+        "stride": image.bytesPerLine(),
+        "source": source,
+    }
+    return entry, bytes(image.constBits())
+
+
+def parse_resolution(text: str):
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"resolution must be WIDTHxHEIGHT, got {text!r}")
+    return width, height
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the assets and pack them for the target screens")
+    parser.add_argument(
+        "--resolutions", nargs="+", type=parse_resolution, default=[(1920, 1080)], help="Screens, as WIDTHxHEIGHT"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Processes scaling the images")
+    parser.add_argument("--allow-missing", action="store_true", help="Pack what exists despite missing assets")
+    args = parser.parse_args()
+
+    assets = referenced_assets()
+    problems = validate(assets)
+    for problem in problems:
+        print(problem)
+    print(f"{len(assets)} referenced assets, {len(problems)} problems")
+    if problems and not args.allow_missing:
+        sys.exit(1)
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(args.workers) as pool:
+        jobs = {
+            resolution: [pool.submit(scale_image, *image) for image in packed_images(*resolution)]
+            for resolution in args.resolutions
+        }
+        for (width, height), futures in jobs.items():
+            images = [future.result() for future in futures]
+            path = pack_path(width, height)
+            write_pack(path, (width, height), images)
+            size = sum(len(pixels) for _, pixels in images)
+            print(f"{path}: {len(images)} images, {size / 1e6:.1f} MB")
+    print(f"Packed in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""Evaluate the gesture detectors over labelled hand trajectories.
+
+A dataset is an .npz file holding every trajectory back to back:
+    t, x, y   samples (ms, screen px)
+    offsets   index of the first sample of each trajectory, plus the total
+    labels    "flick", "swipe_left", "swipe_right" or "none" per trajectory
+    onsets    time the labelled gesture starts (ms, NaN for "none")
+
+Dwell datasets label trajectories "validate" (the hand goes down into the
+validation zone to validate) or "none" (it dips into it or passes near it),
+the `dwell` command replays them frame by frame through DwellCommit.
+
+    python -m tools.gesture_eval generate data.npz --count 5000
+    python -m tools.gesture_eval sweep data.npz --window 150:250:50 \\
+        --flick-distance 40:200:5 --swipe-distance 80:250:5 --output sweep.csv
+    python -m tools.gesture_eval generate-dwell dwell.npz
+    python -m tools.gesture_eval dwell dwell.npz --early-time 40:120:20 --commit-speed 800:1600:400
+"""
+import argparse
+import csv
+import itertools
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from config import (
+    FRAME_INTERVAL,
+    GESTURE_WINDOW,
+    SWIPE_DISTANCE,
+    FLICK_DISTANCE,
+    VALIDATION_TIME,
+    VALIDATION_EARLY_TIME,
+    VALIDATION_COMMIT_SPEED,
+    VALIDATION_STRAIGHTNESS,
+)
+from components.dwell import DwellCommit, DwellParams
+from components.gestures import motion_scores
+
+CLASSES = ["flick", "swipe_left", "swipe_right"]
+GAP = 100_000  # ms between trajectories once batched, more than any window
+SEGMENT_SPAN = 1e6  # px, larger than any score so segments never overlap
+ZONE_TOP = 980  # px, top of the validation zone on a 1080 px screen
+
+
+class Dataset:
+    def __init__(self, paths):
+        parts = [dict(np.load(path)) for path in paths]
+        self.t, self.x, self.y, offsets = [], [], [], [0]
+        labels, onsets = [], []
+        shift = 0.0
+        for part in parts:
+            for start, end, onset in zip(part["offsets"][:-1], part["offsets"][1:], part["onsets"]):
+                # Move every trajectory far from the previous one, so that
+                # the whole dataset is scored in a single pass
+                t = part["t"][start:end]
+                delta = shift - t[0]
+                self.t.append(t + delta)
+                self.x.append(part["x"][start:end])
+                self.y.append(part["y"][start:end])
+                onsets.append(onset + delta)
+                offsets.append(offsets[-1] + end - start)
+                shift = t[-1] + delta + GAP
+            labels.extend(str(label) for label in part["labels"])
+
+        self.t = np.concatenate(self.t)
+        self.x = np.concatenate(self.x).astype(float)
+        self.y = np.concatenate(self.y).astype(float)
+        self.offsets = np.array(offsets)
+        self.labels = np.array(labels)
+        self.onsets = np.array(onsets)
+        self.starts = self.t[self.offsets[:-1]]
+        self.segments = np.repeat(np.arange(len(labels)), np.diff(self.offsets))
+
+    def __len__(self):
+        return len(self.labels)
+
+
+_dataset = None
+
+
+def load_worker(paths):
+    global _dataset
+    _dataset = Dataset(paths)
+
+
+@lru_cache(maxsize=4)
+def crossing_curves(window):
+    """Running maximum of each score, shifted so the whole dataset stays sorted.
+
+    The first sample of trajectory k whose score exceeds d is then a single
+    searchsorted for k * SEGMENT_SPAN + d, whatever the threshold.
+    """
+    curves = []
+    for score in motion_scores(_dataset.t, _dataset.x, _dataset.y, window):
+        curves.append(np.maximum.accumulate(score + _dataset.segments * SEGMENT_SPAN))
+    return curves
+
+
+def first_crossings(curve, threshold):
+    base = np.arange(len(_dataset)) * SEGMENT_SPAN
+    index = np.searchsorted(curve, base + threshold, side="right")
+    # No crossing inside the trajectory: point past its end
+    return np.minimum(index, _dataset.offsets[1:])
+
+
+def evaluate(window, flick_distance, swipe_distance, frame_interval):
+    down, left, right = crossing_curves(window)
+    crossings = np.stack(
+        [
+            first_crossings(down, flick_distance),
+            first_crossings(left, swipe_distance),
+            first_crossings(right, swipe_distance),
+        ]
+    )
+    # The earliest gesture wins, ties go to the flick like in GestureEngine
+    winner = np.argmin(crossings, axis=0)
+    index = crossings[winner, np.arange(len(_dataset))]
+    triggered = index < _dataset.offsets[1:]
+
+    trigger_time = _dataset.t[np.minimum(index, len(_dataset.t) - 1)]
+    # The engine runs once per frame, a trigger is seen at the next frame
+    frames = np.ceil((trigger_time - _dataset.starts) / frame_interval)
+    detection_time = _dataset.starts + frames * frame_interval
+    predicted = np.where(triggered, np.array(CLASSES)[winner], "none")
+    in_time = trigger_time >= _dataset.onsets
+
+    result = {"window": window, "flick_distance": flick_distance, "swipe_distance": swipe_distance}
+    total_tp = total_fp = total_fn = 0
+    for name in CLASSES:
+        tp = (predicted == name) & (_dataset.labels == name) & in_time
+        fp = (predicted == name).sum() - tp.sum()
+        fn = (_dataset.labels == name).sum() - tp.sum()
+        latency = detection_time[tp] - _dataset.onsets[tp]
+        result[f"{name}_precision"] = ratio(tp.sum(), tp.sum() + fp)
+        result[f"{name}_recall"] = ratio(tp.sum(), tp.sum() + fn)
+        result[f"{name}_latency_p50"] = percentile(latency, 50)
+        result[f"{name}_latency_p95"] = percentile(latency, 95)
+        total_tp += tp.sum()
+        total_fp += fp
+        total_fn += fn
+
+    precision = ratio(total_tp, total_tp + total_fp)
+    recall = ratio(total_tp, total_tp + total_fn)
+    result["precision"] = precision
+    result["recall"] = recall
+    result["f1"] = ratio(2 * precision * recall, precision + recall)
+    return result
+
+
+def ratio(numerator, denominator):
+    return float(numerator / denominator) if denominator else math.nan
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) if len(values) else math.nan
+
+
+def evaluate_chunk(window, distances, frame_interval):
+    return [evaluate(window, flick, swipe, frame_interval) for flick, swipe in distances]
+
+
+def parse_range(text):
+    """"150" or "start:stop:step", stop included"""
+    if ":" not in text:
+        return [float(text)]
+    start, stop, step = (float(value) for value in text.split(":"))
+    return list(np.arange(start, stop + step / 2, step))
+
+
+def sweep(args):
+    windows = parse_range(args.window)
+    distances = list(itertools.product(parse_range(args.flick_distance), parse_range(args.swipe_distance)))
+    if max(windows) >= GAP:
+        sys.exit(f"Windows must be shorter than {GAP} ms")
+
+    # Chunks of one window each, so a worker scores the dataset once per window
+    workers = args.workers or os.cpu_count()
+    chunk_size = max(1, math.ceil(len(distances) * len(windows) / (workers * 4)))
+    chunks = [
+        (window, distances[start : start + chunk_size])
+        for window in windows
+        for start in range(0, len(distances), chunk_size)
+    ]
+
+    results = []
+    with ProcessPoolExecutor(workers, initializer=load_worker, initargs=(args.datasets,)) as pool:
+        futures = [pool.submit(evaluate_chunk, window, chunk, args.frame_interval) for window, chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+
+    results.sort(key=lambda result: -np.nan_to_num(result["f1"]))
+    if args.output:
+        with open(args.output, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(results[0]))
+            writer.writeheader()
+            writer.writerows(results)
+
+    print(f"{len(results)} settings evaluated, best {min(args.top, len(results))}:")
+    for result in results[: args.top]:
+        latencies = ", ".join(f"{name} {result[f'{name}_latency_p50']:.0f} ms" for name in CLASSES)
+        print(
+            f"  window {result['window']:.0f} ms, flick {result['flick_distance']:.0f} px, "
+            f"swipe {result['swipe_distance']:.0f} px: precision {result['precision']:.3f}, "
+            f"recall {result['recall']:.3f} (p50 latency {latencies})"
+        )
+
+
+def replay_dwell(t, x, y, zone_top, params, frame_interval):
+    """Commit time of the first validation of a trajectory, NaN if none"""
+    dwell = DwellCommit(params)
+    for now in np.arange(t[0], t[-1] + frame_interval, frame_interval):
+        end = np.searchsorted(t, now, side="right")
+        elapsed = dwell.update(t[:end], x[:end], y[:end], y[end - 1] >= zone_top, now)
+        if elapsed is not None:
+            return elapsed
+    return math.nan
+
+
+def evaluate_dwell(params, zone_top, frame_interval):
+    commits = np.array(
+        [
+            replay_dwell(
+                _dataset.t[start:end], _dataset.x[start:end], _dataset.y[start:end], zone_top, params, frame_interval
+            )
+            for start, end in zip(_dataset.offsets[:-1], _dataset.offsets[1:])
+        ]
+    )
+    validated = ~np.isnan(commits)
+    intended = _dataset.labels == "validate"
+    return {
+        "early_time": params.early_time,
+        "commit_speed": params.commit_speed,
+        "straightness": params.straightness,
+        "recall": ratio((validated & intended).sum(), intended.sum()),
+        "false_validations": ratio((validated & ~intended).sum(), (~intended).sum()),
+        "commit_mean": float(np.mean(commits[validated & intended])) if (validated & intended).any() else math.nan,
+        "commit_p50": percentile(commits[validated & intended], 50),
+        "commit_p95": percentile(commits[validated & intended], 95),
+    }
+
+
+def evaluate_dwell_chunk(settings, zone_top, frame_interval):
+    return [evaluate_dwell(params, zone_top, frame_interval) for params in settings]
+
+
+def dwell(args):
+    settings = [DwellParams(dwell_time=args.dwell_time, early_time=args.dwell_time)]  # Fixed dwell, the reference
+    for early_time, commit_speed, straightness in itertools.product(
+        parse_range(args.early_time), parse_range(args.commit_speed), parse_range(args.straightness)
+    ):
+        settings.append(DwellParams(args.dwell_time, early_time, commit_speed=commit_speed, straightness=straightness))
+
+    workers = args.workers or os.cpu_count()
+    chunk_size = max(1, math.ceil(len(settings) / workers))
+    results = []
+    with ProcessPoolExecutor(workers, initializer=load_worker, initargs=(args.datasets,)) as pool:
+        futures = [
+            pool.submit(evaluate_dwell_chunk, settings[start : start + chunk_size], args.zone_top, args.frame_interval)
+            for start in range(0, len(settings), chunk_size)
+        ]
+        for future in futures:
+            results.extend(future.result())
+
+    reference, results = results[0], results[1:]
+    # Fastest commits first, among the settings validating no more by mistake
+    results.sort(key=lambda result: (result["false_validations"] > reference["false_validations"], result["commit_mean"]))
+    if args.output:
+        with open(args.output, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(reference))
+            writer.writeheader()
+            writer.writerows([reference] + results)
+
+    def describe(result):
+        return (
+            f"recall {result['recall']:.3f}, false validations {result['false_validations']:.3f}, "
+            f"commit mean {result['commit_mean']:.0f} ms, p50 {result['commit_p50']:.0f} ms, p95 {result['commit_p95']:.0f} ms"
+        )
+
+    print(f"Fixed {args.dwell_time:.0f} ms dwell: {describe(reference)}")
+    print(f"{len(results)} settings evaluated, best {min(args.top, len(results))}:")
+    for result in results[: args.top]:
+        print(
+            f"  early {result['early_time']:.0f} ms, speed {result['commit_speed']:.0f} px/s, "
+            f"straightness {result['straightness']:.2f}: {describe(result)}"
+        )
+
+
+def generate(args):
+    """Synthetic trajectories, to try the harness without recorded data"""
+    rng = np.random.default_rng(args.seed)
+    period = 1000 / args.rate
+    ts, xs, ys, offsets, labels, onsets = [], [], [], [0], [], []
+
+    for _ in range(args.count):
+        label = rng.choice(["none"] + CLASSES)
+        duration = rng.uniform(800, 1500)
+        t = np.arange(0, duration, period)
+        x = np.full(len(t), rng.uniform(300, 1600))
+        y = np.full(len(t), rng.uniform(200, 600))
+        # Slow wandering, faster than the jitter but far below a gesture
+        x += np.cumsum(rng.normal(0, 0.3, len(t)))
+        y += np.cumsum(rng.normal(0, 0.3, len(t)))
+
+        onset = math.nan
+        if label != "none":
+            onset = rng.uniform(200, duration - 400)
+            length = rng.uniform(80, 250)  # ms
+            amplitude = rng.uniform(120, 400)  # px
+            progress = np.clip((t - onset) / length, 0, 1)
+            progress = progress * progress * (3 - 2 * progress)
+            dx, dy = {"flick": (0, 1), "swipe_left": (-1, 0), "swipe_right": (1, 0)}[label]
+            x += dx * amplitude * progress + rng.normal(0, 0.1) * amplitude * progress
+            y += dy * amplitude * progress + rng.normal(0, 0.1) * amplitude * progress
+
+        x += rng.normal(0, args.noise, len(t))
+        y += rng.normal(0, args.noise, len(t))
+        ts.append(t)
+        xs.append(x)
+        ys.append(y)
+        offsets.append(offsets[-1] + len(t))
+        labels.append(label)
+        onsets.append(onset)
+
+    np.savez_compressed(
+        args.output,
+        t=np.concatenate(ts),
+        x=np.concatenate(xs).astype(np.float32),
+        y=np.concatenate(ys).astype(np.float32),
+        offsets=np.array(offsets),
+        labels=np.array(labels),
+        onsets=np.array(onsets),
+    )
+    print(f"{args.count} trajectories written to {args.output}")
+
+
+def generate_dwell(args):
+    """Synthetic approaches of the validation zone, to try the dwell replay"""
+    rng = np.random.default_rng(args.seed)
+    period = 1000 / args.rate
+    ts, xs, ys, offsets, labels, onsets = [], [], [], [0], [], []
+
+    for _ in range(args.count):
+        label = rng.choice(["validate", "none"])
+        t = np.arange(0, rng.uniform(1200, 1800), period)
+        x = np.full(len(t), rng.uniform(300, 1600)) + np.cumsum(rng.normal(0, 0.3, len(t)))
+        y = np.full(len(t), rng.uniform(300, 700)) + np.cumsum(rng.normal(0, 0.3, len(t)))
+
+        onset = rng.uniform(200, 500)
+        length = rng.uniform(80, 600)  # ms, from a flick to a slow reach
+        depth = ZONE_TOP + rng.uniform(20, 80) - y[0]
+        slant = rng.choice([0.1, 1.0])  # Some approaches drift sideways as much as they go down
+        if label == "none":
+            kind = rng.choice(["short", "pass", "bounce"])
+            if kind == "short":
+                depth -= rng.uniform(40, 100)  # Stops above the zone
+            elif kind == "pass":
+                slant = rng.uniform(2, 4)  # Sideways move that grazes the zone
+            else:
+                length = rng.uniform(80, 200)  # Fast dip straight back up
+        progress = np.clip((t - onset) / length, 0, 1)
+        progress = progress * progress * (3 - 2 * progress)
+        x += slant * rng.choice([-1, 1]) * depth * progress
+        if label == "none" and kind != "short":
+            stay = rng.uniform(0, 150) if kind == "pass" else rng.uniform(0, 30)
+            back = np.clip((t - onset - length - stay) / length, 0, 1)
+            progress = progress - back * back * (3 - 2 * back)
+        y += depth * progress
+
+        x += rng.normal(0, args.noise, len(t))
+        y += rng.normal(0, args.noise, len(t))
+        ts.append(t)
+        xs.append(x)
+        ys.append(y)
+        offsets.append(offsets[-1] + len(t))
+        labels.append(label)
+        onsets.append(onset)
+
+    np.savez_compressed(
+        args.output,
+        t=np.concatenate(ts),
+        x=np.concatenate(xs).astype(np.float32),
+        y=np.concatenate(ys).astype(np.float32),
+        offsets=np.array(offsets),
+        labels=np.array(labels),
+        onsets=np.array(onsets),
+    )
+    print(f"{args.count} trajectories written to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gesture detection evaluation harness")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sweep_parser = commands.add_parser("sweep", help="Evaluate a grid of thresholds")
+    sweep_parser.add_argument("datasets", nargs="+", help="Labelled .npz datasets")
+    sweep_parser.add_argument("--window", default=str(GESTURE_WINDOW), help="ms, value or start:stop:step")
+    sweep_parser.add_argument("--flick-distance", default=str(FLICK_DISTANCE), help="px, value or start:stop:step")
+    sweep_parser.add_argument("--swipe-distance", default=str(SWIPE_DISTANCE), help="px, value or start:stop:step")
+    sweep_parser.add_argument("--frame-interval", type=float, default=FRAME_INTERVAL, help="ms")
+    sweep_parser.add_argument("--workers", type=int, default=None)
+    sweep_parser.add_argument("--output", help="Write every result to this CSV file")
+    sweep_parser.add_argument("--top", type=int, default=10)
+
+    generate_parser = commands.add_parser("generate", help="Write a synthetic dataset")
+    generate_parser.add_argument("output")
+    generate_parser.add_argument("--count", type=int, default=2000)
+    generate_parser.add_argument("--rate", type=float, default=1000, help="Samples per second")
+    generate_parser.add_argument("--noise", type=float, default=2.0, help="px")
+    generate_parser.add_argument("--seed", type=int, default=0)
+
+    dwell_parser = commands.add_parser("dwell", help="Evaluate the validation dwell against a fixed one")
+    dwell_parser.add_argument("datasets", nargs="+", help="Labelled .npz datasets")
+    dwell_parser.add_argument("--zone-top", type=float, default=ZONE_TOP, help="px")
+    dwell_parser.add_argument("--dwell-time", type=float, default=VALIDATION_TIME, help="ms")
+    dwell_parser.add_argument("--early-time", default=str(VALIDATION_EARLY_TIME), help="ms, value or start:stop:step")
+    dwell_parser.add_argument("--commit-speed", default=str(VALIDATION_COMMIT_SPEED), help="px/s, value or start:stop:step")
+    dwell_parser.add_argument("--straightness", default=str(VALIDATION_STRAIGHTNESS), help="value or start:stop:step")
+    dwell_parser.add_argument("--frame-interval", type=float, default=FRAME_INTERVAL, help="ms")
+    dwell_parser.add_argument("--workers", type=int, default=None)
+    dwell_parser.add_argument("--output", help="Write every result to this CSV file")
+    dwell_parser.add_argument("--top", type=int, default=10)
+
+    generate_dwell_parser = commands.add_parser("generate-dwell", help="Write a synthetic dwell dataset")
+    generate_dwell_parser.add_argument("output")
+    generate_dwell_parser.add_argument("--count", type=int, default=2000)
+    generate_dwell_parser.add_argument("--rate", type=float, default=1000, help="Samples per second")
+    generate_dwell_parser.add_argument("--noise", type=float, default=2.0, help="px")
+    generate_dwell_parser.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+    if args.command == "sweep":
+        sweep(args)
+    elif args.command == "dwell":
+        dwell(args)
+    elif args.command == "generate-dwell":
+        generate_dwell(args)
+    else:
+        generate(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Replay input logs recorded with `linled_coffee.py --record DIRECTORY`.
+
+Samples and keys go through the same path as live input, on the recorded
+timeline: frames are cut every FRAME_INTERVAL of recorded time whatever the
+speed, so gestures and selections replay identically. The animations run
+on the frame scheduler, ticked here on recorded time too. Plain QTimers
+still run on the wall clock: the single shots of scene transitions (and the
+carousel activation after them), the idle and presence timers and the
+frames of animated images. Keep --speed 1 when those matter.
+
+Offscreen, the screen has the size the logs were recorded on, so the same
+widgets are under the same positions; with --window the positions are
+scaled to the screen. Logs recorded on different sizes are refused.
+
+    python -m tools.replay recordings/input-*.lnr --speed 4
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from config import FRAME_INTERVAL
+from components.recorder import KIND_POINTER, KIND_KEY, read_log
+
+
+class InputReplayer(QObject):
+    finished = Signal()
+
+    def __init__(self, window, records, speed: float):
+        super().__init__(window)
+        self.window = window
+        self.pointer = window.pointer
+        self.records = records
+        self.next = 0
+        self.now = records[0][1] if records else 0.0
+        self.frames = 0
+
+        # Frames are driven from here, on recorded time
+        window.scheduler.timer.stop()
+        self.pointer.clock = lambda: self.now
+        window.scheduler.set_clock(lambda: self.now)
+        if window.virtual_pointer is None:
+            window.use_virtual_pointer()
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.step)
+        self.timer.start(round(FRAME_INTERVAL / speed) if speed > 0 else 0)
+
+    def step(self):
+        self.now += FRAME_INTERVAL
+        while self.next < len(self.records) and self.records[self.next][1] <= self.now:
+            kind, t, a, b = self.records[self.next]
+            if kind == KIND_POINTER:
+                self.pointer.feed(t, a, b)
+            elif kind == KIND_KEY:
+                self.send_key(a, bool(b))
+            self.next += 1
+
+        self.window.scheduler.tick()
+        self.frames += 1
+        if self.next >= len(self.records):
+            self.timer.stop()
+            self.finished.emit()
+
+    def send_key(self, key, pressed):
+        event_type = QEvent.KeyPress if pressed else QEvent.KeyRelease
+        target = QApplication.focusWidget() or self.window
+        QApplication.sendEvent(target, QKeyEvent(event_type, key, Qt.NoModifier))
+
+
+def offscreen_screen(size):
+    """Configuration file of the offscreen platform with a single screen of `size`"""
+    width, height = size
+    screen = {"name": "replay", "x": 0, "y": 0, "width": width, "height": height, "logicalDpi": 96, "logicalBaseDpi": 96, "dpr": 1}
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as file:
+        json.dump({"screens": [screen]}, file)
+    return file.name
+
+
+def scale_positions(records, recorded, screen):
+    """Pointer positions of `records` moved from the `recorded` screen size to `screen`"""
+    sx, sy = screen[0] / recorded[0], screen[1] / recorded[1]
+    return [(kind, t, a * sx, b * sy) if kind == KIND_POINTER else (kind, t, a, b) for kind, t, a, b in records]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded inputs")
+    parser.add_argument("logs", nargs="+", help="Input logs, in recording order")
+    parser.add_argument("--speed", type=float, default=1.0, help="0 replays as fast as possible")
+    parser.add_argument("--window", action="store_true", help="Show the app instead of running offscreen")
+    args = parser.parse_args()
+
+    records = []
+    size = None
+    for path in args.logs:
+        log_size, log_records = read_log(path)
+        if size is not None and log_size != size:
+            parser.error(f"{path} was recorded on a {log_size[0]}x{log_size[1]} screen, the logs before on {size[0]}x{size[1]}")
+        size = log_size
+        records.extend(log_records)
+    records.sort(key=lambda record: record[1])
+
+    config = None
+    if not args.window:
+        # The app lays itself out on the screen size, the same widgets are under the same positions
+        config = offscreen_screen(size) if size is not None else None
+        os.environ["QT_QPA_PLATFORM"] = f"offscreen:configfile={config}" if config else "offscreen"
+
+    from main_window import MainWindow, MouseGlobalEventFilter
+
+    app = QApplication(sys.argv)
+    window = MainWindow(debug=False)
+    event_filter = MouseGlobalEventFilter(window)
+    app.installEventFilter(event_filter)
+    window.show()
+    if size is not None and (window.width, window.height) != size:
+        print(f"Recorded on a {size[0]}x{size[1]} screen, replayed on {window.width}x{window.height}: positions are scaled")
+        records = scale_positions(records, size, (window.width, window.height))
+
+    gestures = {"swipe": 0, "flick": 0, "dwell": 0}
+    window.pointer.gestures.swiped.connect(lambda _: gestures.update(swipe=gestures["swipe"] + 1))
+    window.pointer.gestures.flicked_down.connect(lambda: gestures.update(flick=gestures["flick"] + 1))
+    window.pointer.gestures.dwelled.connect(lambda _: gestures.update(dwell=gestures["dwell"] + 1))
+
+    replayer = InputReplayer(window, records, args.speed)
+    replayer.finished.connect(app.quit)
+    start = time.perf_counter()
+    app.exec()
+    app.removeEventFilter(event_filter)
+    window.close()
+    if config is not None:
+        os.remove(config)
+
+    print(f"{len(records)} records replayed in {replayer.frames} frames, {time.perf_counter() - start:.1f} s")
+    print(f"Pointer: {window.pointer.stats()}")
+    print(f"Gestures: {gestures}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Stream synthetic LinLED frames on pseudo-terminals.
+
+The slave path of each bar is printed on its own line of stdout, pass it to
+the app with `--sensor pty:PATH` (or let `--sensor sim:RATE[:COUNT]` start
+this script). With `--sensors N` the bars stand side by side and share the
+hand, each one has its own rate, clock origin and clock drift.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tty
+
+from config import SENSOR_OVERLAP
+from sensor.mapping import strip_bounds
+from sensor.protocol import FRAME_SIZE, SENSOR_RANGE, encode_frame
+
+
+def lissajous(t: float):
+    """Slow hand wandering over the whole field, t in seconds"""
+    return 0.5 + 0.45 * math.sin(0.7 * t), 0.5 + 0.4 * math.sin(1.1 * t + 0.5)
+
+
+def swipes(t: float):
+    """Hold still, swipe right, hold still, flick down, every 4 seconds"""
+    phase = t % 4.0
+    if phase < 1.0:
+        return 0.3, 0.4
+    if phase < 1.2:
+        return 0.3 + 0.4 * (phase - 1.0) / 0.2, 0.4
+    if phase < 3.0:
+        return 0.7, 0.4
+    if phase < 3.15:
+        return 0.7, 0.4 + 0.4 * (phase - 3.0) / 0.15
+    return 0.7, 0.8
+
+
+PATTERNS = {"lissajous": lissajous, "swipes": swipes}
+
+
+def to_sensor(value: float) -> int:
+    return round(min(max(value, 0.0), 1.0) * SENSOR_RANGE)
+
+
+class VirtualBar:
+    """One bar of the installation, seeing the hand in its strip of the screen"""
+
+    def __init__(self, index, count, rate, overlap, drift):
+        self.left, self.right = strip_bounds(index, count, overlap)
+        self.period = 1 / rate
+        self.clock_origin = random.randrange(1 << 32)  # us, the bars did not start together
+        self.clock_rate = 1 + random.uniform(-drift, drift) * 1e-6
+        self.sent = 0
+        self.dropped = 0
+        self.pending = b""
+
+        self.master, slave = os.openpty()
+        tty.setraw(slave)
+        os.set_blocking(self.master, False)
+        self.path = os.ttyname(slave)
+
+    def emit_due(self, now, trajectory, noise):
+        # Emit every frame that is due, so the rate holds even if we oversleep
+        due = int(now / self.period) + 1
+        while self.sent < due:
+            t = self.sent * self.period
+            x, y = trajectory(t)
+            x += random.gauss(0.0, noise)
+            y += random.gauss(0.0, noise)
+            timestamp = int(self.clock_origin + t * 1e6 * self.clock_rate)
+            if self.left <= x <= self.right:
+                u = (x - self.left) / (self.right - self.left)
+                self.pending += encode_frame(timestamp, to_sensor(u), to_sensor(y))
+            else:
+                self.pending += encode_frame(timestamp, 0, 0, flags=0)
+            self.sent += 1
+
+        try:
+            written = os.write(self.master, self.pending)
+            self.pending = self.pending[written:]
+        except BlockingIOError:
+            # Nobody reads the pty fast enough, drop like a real sensor would
+            self.dropped += len(self.pending) // FRAME_SIZE
+            self.pending = b""
+
+    def next_due(self):
+        return self.sent * self.period
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LinLED sensor simulator")
+    parser.add_argument("--rate", type=int, default=1000, help="Frames per second")
+    parser.add_argument("--pattern", choices=PATTERNS, default="lissajous")
+    parser.add_argument("--noise", type=float, default=0.002, help="Position jitter")
+    parser.add_argument("--sensors", type=int, default=1, help="Bars side by side")
+    parser.add_argument("--rates", default=None, help="Frames per second of each bar, comma separated")
+    parser.add_argument("--overlap", type=float, default=SENSOR_OVERLAP, help="Share of the width seen by two bars")
+    parser.add_argument("--drift", type=float, default=50, help="Largest clock drift of a bar (ppm)")
+    args = parser.parse_args()
+
+    rates = [int(rate) for rate in args.rates.split(",")] if args.rates else [args.rate] * args.sensors
+    if len(rates) != args.sensors:
+        parser.error("--rates needs one rate per sensor")
+    bars = [VirtualBar(index, args.sensors, rates[index], args.overlap, args.drift) for index in range(args.sensors)]
+    for bar in bars:
+        print(bar.path, flush=True)
+
+    trajectory = PATTERNS[args.pattern]
+    start = time.perf_counter()
+
+    try:
+        while True:
+            now = time.perf_counter() - start
+            for bar in bars:
+                bar.emit_due(now, trajectory, args.noise)
+            next_due = min(bar.next_due() for bar in bars)
+            time.sleep(max(0.0, next_due - (time.perf_counter() - start)))
+    except KeyboardInterrupt:
+        for index, bar in enumerate(bars):
+            print(f"Bar {index}: {bar.sent} frames sent, {bar.dropped} dropped", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()